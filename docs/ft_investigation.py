@@ -1,34 +1,29 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from dissig.signals.batch import SignalBatch
+from dissig.fourier.continuous import step_spectrum
+
 # Parameters
 ell = 27                            # Modulus
-t = 100                                # Time parameter
-# s = np.random.rand(ell)             # Example signal s(n) defined over Z/ellZ
-discrete_space = np.linspace(0, ell, ell)
-
-for multiplier in range(ell):
-    s = np.real(np.exp(complex(0,1)*(2*np.pi/ell)*multiplier*discrete_space))
-    print(s)
 
-    # Omega range
-    omega_vals = np.linspace(0, 100, 1000)
+# Real parts of the character signals, one row per multiplier
+characters = SignalBatch.characters(list(range(ell)), ell)
+real_characters = characters.extract_real().astype(complex)
 
-    # Define f(omega)
-    def f(omega):
-        exp_term = np.exp(-2j * np.pi * np.arange(ell) * t / ell)
-        total = np.sum(s * exp_term)    # Only this part depends on s(n) and t
-        return total * np.sinc(omega / ell)
+# Omega range
+omega_vals = np.linspace(0, 100, 1000)
 
-    # Vectorized computation
-    f_vals = f(omega_vals)
+# Spectra of the step-realized signals, all multipliers at once
+f_vals_by_multiplier = step_spectrum(real_characters, omega_vals)
 
+for multiplier, f_vals in enumerate(f_vals_by_multiplier):
     # Plot
     plt.figure(figsize=(8, 4))
     plt.plot(omega_vals, np.real(f_vals), label='Re[f(ω)]')
     plt.plot(omega_vals, np.imag(f_vals), label='Im[f(ω)]', linestyle='--')
     plt.axhline(0, color='gray', lw=0.5)
-    plt.title(r"$f(\omega) = \sum_n s(n)\,e^{-2\pi i nt/\ell} \cdot \mathrm{sinc}(\omega/\ell)$")
+    plt.title(rf"Step-realized $\mathrm{{Re}}\,\chi_{{{multiplier}}}$: $f(\omega)$")
     plt.xlabel(r'$\omega$')
     plt.ylabel(r'$f(\omega)$')
     plt.legend()
@@ -3,9 +3,37 @@
 """
 from __future__ import annotations
 
-from dissig.fourier.fftonnetz import fft_with_multipliers, fft_tonnetz
+from dissig.utils.fft_backend import fft_workers, get_fft_workers, set_fft_workers
+from dissig.fourier.continuous import step_spectrum
+from dissig.fourier.dirichlet import dirichlet_transform, inverse_dirichlet_transform, orbit_indices
+from dissig.fourier.fftonnetz import (
+    HermitianSpectrum,
+    fft_with_multipliers,
+    fft_tonnetz,
+    fourier_node_matrix,
+)
+from dissig.fourier.resynthesis import multiplier_mask, resynthesize, resynthesize_batch
+from dissig.fourier.spectra import node_spectra, rescaled_spectrum
+from dissig.fourier.stft import frame_count, stft, stream_stft
 
 __all__ = [
+    "HermitianSpectrum",
     "fft_with_multipliers",
     "fft_tonnetz",
+    "fourier_node_matrix",
+    "fft_workers",
+    "get_fft_workers",
+    "set_fft_workers",
+    "node_spectra",
+    "rescaled_spectrum",
+    "frame_count",
+    "stft",
+    "stream_stft",
+    "step_spectrum",
+    "dirichlet_transform",
+    "inverse_dirichlet_transform",
+    "orbit_indices",
+    "multiplier_mask",
+    "resynthesize",
+    "resynthesize_batch",
 ]
@@ -0,0 +1,114 @@
+"""
+Continuous Fourier transforms of step-realized discrete signals.
+
+A signal s on ℤ/ℓℤ is realized as the step function on [0, 1) equal to s(t) on
+[t / ℓ, (t + 1) / ℓ). Its Fourier transform at frequency ω (in cycles per period) is
+    F(ω) = (1 / ℓ) · e^{-πiω/ℓ} · sinc(ω / ℓ) · Σ_t s(t) · e^{-2πiωt/ℓ},
+so at integer ω = k it is the k-th DFT coefficient damped by the sinc envelope.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import numpy as np
+
+from dissig.signals.batch import SignalBatch
+from dissig.signals.discrete import Signal
+from dissig.tonnetze.networks import SignalTonnetz
+from dissig.utils.blocks import block_rows
+
+
+def _stacked_samples(source : Signal | SignalBatch | np.ndarray) -> np.ndarray:
+    """The samples of `source` as an array of one or more rows."""
+    if isinstance(source, Signal):
+        return source.underlying_signal
+    if isinstance(source, SignalBatch):
+        return source.samples
+
+    samples = np.asarray(source)
+    assert samples.ndim in [1, 2]
+    return samples
+
+
+def _node_sample_blocks(signal_tonnetz : SignalTonnetz) -> Iterator[np.ndarray]:
+    """Stream the node signals of a tonnetz as blocks of rows, in vertex order."""
+    modulus = signal_tonnetz.sample_count
+    block_size = block_rows(modulus)
+
+    if signal_tonnetz.storage == "matrix":
+        # vertices are always a tail 0.. or 1.. of the rows, so yield slices (no copy,
+        # and memory-mapped matrices are read one block at a time)
+        vertices = signal_tonnetz.vertices()
+        first_vertex = vertices[0] if len(vertices) else modulus
+        for start in range(first_vertex, modulus, block_size):
+            yield signal_tonnetz.node_signals[start:start + block_size]
+        return
+
+    block = []
+    for _, current_signal in signal_tonnetz.iter_node_signals():
+        block.append(current_signal.underlying_signal)
+        if len(block) == block_size:
+            yield np.array(block)
+            block = []
+    if block:
+        yield np.array(block)
+
+
+def _sample_sums(samples : np.ndarray, omegas : np.ndarray, out : np.ndarray) -> None:
+    """Write Σ_t s(t) · e^{-2πiωt/ℓ} for each row of `samples` and each ω into `out`."""
+    modulus = samples.shape[-1]
+    times = np.arange(modulus, dtype=np.float64)
+
+    block_size = block_rows(modulus)
+    for start in range(0, len(omegas), block_size):
+        stop = min(len(omegas), start + block_size)
+        phase_factors = np.exp((-2j * np.pi / modulus) * np.multiply.outer(times, omegas[start:stop]))
+        out[..., start:stop] = samples @ phase_factors
+
+
+def step_spectrum(
+    source : Signal | SignalBatch | SignalTonnetz | np.ndarray,
+    omegas : np.ndarray,
+) -> np.ndarray:
+    """
+    Evaluate the continuous Fourier transform of step-realized signals on a frequency grid.
+
+    The sums over samples are computed for a block of frequencies at a time as one
+    matrix product, so memory stays bounded for dense grids and many signals. The
+    node signals of a SignalTonnetz are processed in blocks of vertices: row slices
+    of its node matrix (memory-mapped ones included), or signals streamed from
+    `iter_node_signals` for graph and lazy storage.
+
+    Args:
+        source (Signal | SignalBatch | SignalTonnetz | np.ndarray): A signal, a batch of
+            signals, a SignalTonnetz (one signal per vertex, in vertex order), or an
+            array of samples of shape (sample_count,) or (signal_count, sample_count).
+        omegas (np.ndarray): One-dimensional grid of real frequencies ω.
+
+    Returns:
+        np.ndarray: Complex array of F(ω) over the grid, of shape (len(omegas),) for a
+            single signal and (signal_count, len(omegas)) otherwise.
+    """
+    omegas = np.asarray(omegas, dtype=np.float64)
+    assert omegas.ndim == 1
+
+    if isinstance(source, SignalTonnetz):
+        modulus = source.sample_count
+        assert modulus >= 1
+        spectrum = np.empty((len(source.vertices()), len(omegas)), dtype=np.complex128)
+
+        start = 0
+        for samples in _node_sample_blocks(source):
+            _sample_sums(samples, omegas, spectrum[start:start + len(samples)])
+            start += len(samples)
+    else:
+        samples = _stacked_samples(source)
+        modulus = samples.shape[-1]
+        assert modulus >= 1
+        spectrum = np.empty(samples.shape[:-1] + omegas.shape, dtype=np.complex128)
+        _sample_sums(samples, omegas, spectrum)
+
+    scaled_omegas = omegas / modulus
+    spectrum *= np.exp(-1j * np.pi * scaled_omegas) * np.sinc(scaled_omegas) / modulus
+
+    return spectrum
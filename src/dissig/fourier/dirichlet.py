@@ -0,0 +1,118 @@
+"""
+Decomposition of signals into multiplicative (Dirichlet) characters on the orbits
+of the unit group (ℤ/nℤ)^×.
+
+The orbit of a divisor d is {d · u mod n | u unit}, in bijection with the units
+modulo m = n / d. Writing (ℤ/mℤ)^× as a product of cyclic groups ⟨g_1⟩ × ... × ⟨g_r⟩
+of orders o_1, ..., o_r (`ModulusContext.unit_generators`), a unit is indexed by
+its discrete logarithm (x_1, ..., x_r), and the characters are
+    χ_j(g_1^x_1 · ... · g_r^x_r) = exp(2πi · Σ_i j_i · x_i / o_i).
+Restricted to an orbit and laid out on the discrete-log grid, a signal is therefore
+decomposed by one multidimensional FFT, in O(φ(m) log φ(m)) operations.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+from dissig.signals.discrete import Signal
+from dissig.utils import fft_backend
+from dissig.utils.context import ModulusContext
+
+
+@lru_cache(maxsize=64)
+def _cofactor_unit_grid(cofactor : int) -> np.ndarray:
+    """
+    The unit grid modulo `cofactor`, cached apart from `modulus_context`.
+
+    Transforming a signal visits one cofactor n / d per divisor d, so going through
+    the shared context cache would evict the contexts of the moduli in use.
+    """
+    return ModulusContext(cofactor).unit_grid
+
+
+def orbit_indices(modulus : int, divisor : int) -> np.ndarray:
+    """
+    Residues of the unit-group orbit of `divisor`, laid out on the discrete-log grid.
+
+    Args:
+        modulus (int): The modulus n.
+        divisor (int): A positive divisor d of n.
+
+    Returns:
+        np.ndarray: Int64 array of the shape of the unit grid modulo n / d whose entry x
+            is d · g_1^x_1 · ... · g_r^x_r mod n.
+    """
+    assert isinstance(modulus, int) and modulus >= 1
+    assert isinstance(divisor, int) and divisor >= 1
+    assert modulus % divisor == 0
+
+    unit_grid = _cofactor_unit_grid(modulus // divisor)
+
+    return (divisor * unit_grid) % modulus
+
+
+def dirichlet_transform(
+    discrete_signal : Signal,
+    divisors : list[int] | None = None,
+    workers : int | None = None,
+) -> dict[int, np.ndarray]:
+    """
+    Decompose a signal, restricted to each unit-group orbit, into Dirichlet characters.
+
+    The coefficient of the character χ_j on the orbit of d is
+        Σ_x s(d · g^x) · conj(χ_j(g^x)),
+    stored at index j = (j_1, ..., j_r) of the orbit's coefficient array.
+
+    Args:
+        discrete_signal (Signal): The signal to decompose.
+        divisors (list[int] | None): Divisors d of n whose orbits to transform;
+            defaults to all of them, matching the keys of `unit_clusters`.
+        workers (int | None): FFT threads; None uses the configured count.
+
+    Returns:
+        dict[int, np.ndarray]: For each divisor d, the complex coefficients over the
+            character grid of (ℤ/(n/d)ℤ)^×.
+    """
+    modulus = discrete_signal.sample_count
+    samples = discrete_signal.underlying_signal
+
+    if divisors is None:
+        divisors = discrete_signal.context.divisors
+
+    coefficients = {}
+    for divisor in divisors:
+        orbit_samples = samples[orbit_indices(modulus, divisor)]
+        coefficients[divisor] = fft_backend.fftn(orbit_samples, workers=workers)
+
+    return coefficients
+
+
+def inverse_dirichlet_transform(
+    coefficients : dict[int, np.ndarray],
+    modulus : int,
+    workers : int | None = None,
+) -> Signal:
+    """
+    Rebuild a signal from its Dirichlet coefficients on unit-group orbits.
+
+    Every residue lies in exactly one orbit, so the coefficients of all divisors
+    determine the signal; residues of orbits missing from `coefficients` are 0.
+
+    Args:
+        coefficients (dict[int, np.ndarray]): Coefficients as returned by `dirichlet_transform`.
+        modulus (int): The signal length n.
+        workers (int | None): FFT threads; None uses the configured count.
+
+    Returns:
+        Signal: The signal of length n with those coefficients.
+    """
+    samples = np.zeros(modulus, dtype=np.complex128)
+
+    for divisor, orbit_coefficients in coefficients.items():
+        indices = orbit_indices(modulus, divisor)
+        assert orbit_coefficients.shape == indices.shape
+        samples[indices] = fft_backend.ifftn(orbit_coefficients, workers=workers)
+
+    return Signal(samples)
@@ -4,26 +4,103 @@ component signals into a Signal-decorated tonnetz
 """
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
+
 import numpy as np
 
-from dissig.signals.discrete import Signal, character_signal
-from dissig.tonnetze.networks import SignalTonnetz
+from dissig.utils import fft_backend
+from dissig.signals.discrete import CharacterSignal, Signal, character_signal
+from dissig.tonnetze.networks import LazySignalTonnetz, SignalTonnetz
+from dissig.utils.blocks import block_rows
+
+
+class HermitianSpectrum(Mapping):
+    """
+    Read-only mapping from multiplier to Fourier coefficient for a real signal,
+    storing only the non-negative half of the spectrum.
+
+    The coefficients of a real signal satisfy X[n - k] = conj(X[k]), so the
+    multipliers above n // 2 are filled in on access.
+
+    Attributes:
+        sample_count (int): Number of coefficients n, i.e., the signal length.
+        half_spectrum (np.ndarray): The n // 2 + 1 coefficients returned by `rfft`.
+    """
+    def __init__(self, half_spectrum : np.ndarray, sample_count : int):
+        assert isinstance(half_spectrum, np.ndarray)
+        assert isinstance(sample_count, int)
+        assert len(half_spectrum) == sample_count // 2 + 1
+
+        self.half_spectrum = half_spectrum
+        self.sample_count = sample_count
 
+    def __getitem__(self, multiplier : int) -> complex:
+        if not isinstance(multiplier, (int, np.integer)) or not 0 <= multiplier < self.sample_count:
+            raise KeyError(multiplier)
 
-def fft_with_multipliers(discrete_signal : Signal) -> dict[int, complex]:
+        if multiplier < len(self.half_spectrum):
+            return complex(self.half_spectrum[multiplier])
+        return complex(self.half_spectrum[self.sample_count - multiplier]).conjugate()
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.sample_count))
+
+    def __len__(self) -> int:
+        return self.sample_count
+
+    def to_array(self) -> np.ndarray:
+        """Return all n coefficients as a complex array, indexed by multiplier."""
+        spectrum = np.empty(self.sample_count, dtype=np.complex128)
+        half_length = len(self.half_spectrum)
+
+        spectrum[:half_length] = self.half_spectrum
+        spectrum[half_length:] = np.conj(self.half_spectrum[1:self.sample_count - half_length + 1][::-1])
+
+        return spectrum
+
+
+def fft_with_multipliers(
+    discrete_signal : Signal,
+    as_array : bool = False,
+    real : bool | None = None,
+    workers : int | None = None,
+) -> Mapping[int, complex] | np.ndarray:
     """
     Computes the discrete Fourier transform of a Signal instance.
 
+    Real signals are transformed with `rfft`, which computes only the non-negative
+    half of the spectrum; the other half follows from Hermitian symmetry. The spectrum
+    of a `CharacterSignal` is written down directly.
+
     Args:
         discrete_signal (Signal): The input signal, assumed to be periodic with a fixed sample count.
+        as_array (bool): Return a complex array indexed by multiplier instead of a mapping.
+        real (bool | None): Whether the signal is real-valued; None to check its imaginary part.
+        workers (int | None): FFT threads; None uses the count configured in
+            `dissig.utils.fft_backend`.
 
     Returns:
-        dict[int, complex]: A dictionary mapping each integer multiplier (frequency index)
-            to its corresponding Fourier coefficient.
+        Mapping[int, complex] | np.ndarray: A mapping from each integer multiplier
+            (frequency index) to its Fourier coefficient: a dict for complex signals and
+            a `HermitianSpectrum` for real ones. With `as_array`, an array of length n.
     """
-    signal_as_list = discrete_signal.underlying_signal
+    if isinstance(discrete_signal, CharacterSignal):
+        spike_spectrum = discrete_signal.spectrum()
+        return spike_spectrum if as_array else dict(enumerate(spike_spectrum.tolist()))
+
+    samples = discrete_signal.underlying_signal
+
+    if real is None:
+        real = not np.any(samples.imag)
+
+    if real:
+        fft_coeffs = HermitianSpectrum(fft_backend.rfft(samples.real, workers=workers), len(samples))
+        return fft_coeffs.to_array() if as_array else fft_coeffs
+
+    fft_output = fft_backend.fft(samples, workers=workers)
+    if as_array:
+        return fft_output
 
-    fft_output = np.fft.fft(signal_as_list)
     fft_output = fft_output.tolist()
 
     fft_coeffs = {
@@ -34,34 +111,91 @@ def fft_with_multipliers(discrete_signal : Signal) -> dict[int, complex]:
     return fft_coeffs
 
 
-def fft_tonnetz(discrete_signal : Signal, integer_list : list[int]) -> SignalTonnetz:
+def fourier_node_matrix(fourier_coefficients : np.ndarray) -> np.ndarray:
+    """
+    Build the matrix of Fourier components of a signal, one row per multiplier:
+        node_signals[k, t] = X[k] · exp(2πi · k · t / n).
+
+    Rows are filled in blocks by a broadcast over a single table of roots of unity,
+    so the temporary phase indices stay bounded.
+
+    Args:
+        fourier_coefficients (np.ndarray): The n Fourier coefficients X of a signal.
+
+    Returns:
+        np.ndarray: Complex array of shape (n, n).
+    """
+    modulus = len(fourier_coefficients)
+    roots_of_unity = np.exp(2j * np.pi * np.arange(modulus) / modulus)
+    times = np.arange(modulus, dtype=np.int64)
+
+    node_signals = np.empty((modulus, modulus), dtype=np.complex128)
+
+    block_size = block_rows(modulus)
+    for start in range(0, modulus, block_size):
+        stop = min(modulus, start + block_size)
+        multipliers = np.arange(start, stop, dtype=np.int64)
+        phase_indices = np.multiply.outer(multipliers, times) % modulus
+        np.multiply(
+            fourier_coefficients[start:stop, None],
+            roots_of_unity[phase_indices],
+            out=node_signals[start:stop],
+        )
+
+    return node_signals
+
+
+def fft_tonnetz(
+    discrete_signal : Signal,
+    integer_list : list[int],
+    lazy : bool = False,
+    backend : str = "networkx",
+) -> SignalTonnetz:
     """
     Constructs a SignalTonnetz whose nodes are decorated with the Fourier components
     of the input signal scaled by corresponding character signals.
 
+    The node signal matrix is computed directly from the Fourier coefficients and
+    attached to a tonnetz built without propagating any signal. With `lazy=True`
+    each node holds the component as a `CharacterSignal`, X[k] · χ_k, built in O(1)
+    on access; its samples are only computed when read.
+
     Args:
         discrete_signal (Signal): A discrete periodic signal to analyze via Fourier transform.
         integer_list (list[int]): List of multipliers defining the structure of the tonnetz.
+        lazy (bool): Return a LazySignalTonnetz computing components on demand.
+        backend (str): Graph storage, "networkx" or "csr"; see `Tonnetz`.
 
     Returns:
         SignalTonnetz: A tonnetz graph where each node's signal is the input signal’s
-            Fourier coefficient scaled by a character signal.
+            Fourier coefficient scaled by a character signal. Its `fourier_coefficients`
+            attribute holds the Fourier coefficients, indexed by multiplier.
     """
     modulus = discrete_signal.sample_count
 
     generating_character = character_signal(1, modulus)
-    signal_tonnetz = SignalTonnetz(generating_character, integer_list, include_zero=True)
-
-    fft_coeffs = fft_with_multipliers(discrete_signal)
-
-    for multiplier in range(modulus):
-        current_coefficient = fft_coeffs[multiplier]
-        original_signal = signal_tonnetz.network.nodes[multiplier]["signal"]
-        original_signal_list = original_signal.underlying_signal
-
-        new_signal_list = [current_coefficient * value for value in original_signal_list]
-        weighted_signal = Signal(new_signal_list)
-
-        signal_tonnetz.network.nodes[multiplier]["signal"] = weighted_signal
-    
-    return signal_tonnetz
\ No newline at end of file
+    fourier_coefficients = fft_with_multipliers(discrete_signal, as_array=True)
+
+    if lazy:
+        def fourier_component(multiplier : int) -> Signal:
+            return fourier_coefficients[multiplier] * generating_character.scale_time_by(multiplier)
+
+        signal_tonnetz = LazySignalTonnetz(
+            generating_character,
+            integer_list,
+            include_zero=True,
+            backend=backend,
+            node_factory=fourier_component,
+        )
+    else:
+        signal_tonnetz = SignalTonnetz.from_node_matrix(
+            generating_character,
+            integer_list,
+            fourier_node_matrix(fourier_coefficients),
+            include_zero=True,
+            backend=backend,
+        )
+
+    signal_tonnetz.fourier_coefficients = fourier_coefficients
+
+    return signal_tonnetz
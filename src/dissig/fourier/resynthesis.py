@@ -0,0 +1,120 @@
+"""
+Resynthesis of signals from selected Fourier components, e.g. the nodes of one
+unit-cluster orbit of an `fft_tonnetz`, by masking the coefficients and applying
+a single inverse FFT.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from dissig.fourier.fftonnetz import fft_with_multipliers
+from dissig.signals.batch import SignalBatch
+from dissig.signals.discrete import Signal
+from dissig.tonnetze.networks import SignalTonnetz
+from dissig.utils import fft_backend
+
+
+def _fourier_coefficients(source : Signal | SignalTonnetz | np.ndarray) -> np.ndarray:
+    """The Fourier coefficients of a signal, of an `fft_tonnetz`, or given as an array."""
+    if isinstance(source, SignalTonnetz):
+        assert source.fourier_coefficients is not None, "expected a tonnetz built by fft_tonnetz"
+        return source.fourier_coefficients
+    if isinstance(source, Signal):
+        return fft_with_multipliers(source, as_array=True)
+
+    coefficients = np.asarray(source)
+    assert coefficients.ndim == 1
+    return coefficients
+
+
+def multiplier_mask(multipliers : Iterable[int], modulus : int) -> np.ndarray:
+    """
+    Boolean mask of length `modulus` selecting the residues of `multipliers`.
+
+    Args:
+        multipliers (Iterable[int]): Integer multipliers; only their residues mod n matter.
+        modulus (int): The signal length n.
+
+    Returns:
+        np.ndarray: Boolean array, True at each selected multiplier.
+    """
+    assert isinstance(modulus, int) and modulus >= 1
+
+    mask = np.zeros(modulus, dtype=bool)
+    mask[np.asarray(list(multipliers), dtype=np.int64) % modulus] = True
+
+    return mask
+
+
+def resynthesize(
+    source : Signal | SignalTonnetz | np.ndarray,
+    multipliers : Iterable[int],
+    normalize : bool = True,
+    workers : int | None = None,
+) -> Signal:
+    """
+    Rebuild the part of a signal carried by the Fourier components of `multipliers`.
+
+    With `normalize=True` the result is the component of the original signal, so
+    resynthesizing every multiplier gives the signal back. With `normalize=False`
+    it is n times larger, which is the sum of the selected node signals of the
+    `fft_tonnetz` of the signal.
+
+    Args:
+        source (Signal | SignalTonnetz | np.ndarray): A signal, a tonnetz built by
+            `fft_tonnetz`, or an array of Fourier coefficients.
+        multipliers (Iterable[int]): Multipliers of the Fourier components to keep.
+        normalize (bool): Divide by n as the inverse DFT does.
+        workers (int | None): FFT threads; None uses the configured count.
+
+    Returns:
+        Signal: The resynthesized signal.
+    """
+    coefficients = _fourier_coefficients(source)
+    modulus = len(coefficients)
+
+    masked_coefficients = np.where(multiplier_mask(multipliers, modulus), coefficients, 0)
+    samples = fft_backend.ifft(masked_coefficients, workers=workers)
+
+    if not normalize:
+        samples *= modulus
+
+    return Signal(samples)
+
+
+def resynthesize_batch(
+    source : Signal | SignalTonnetz | np.ndarray,
+    masks : np.ndarray | list[Iterable[int]],
+    normalize : bool = True,
+    workers : int | None = None,
+) -> SignalBatch:
+    """
+    Resynthesize one signal per mask of Fourier components with one batched inverse FFT.
+
+    Args:
+        source (Signal | SignalTonnetz | np.ndarray): As in `resynthesize`.
+        masks (np.ndarray | list[Iterable[int]]): A boolean array of shape
+            (mask_count, n), or a list of multiplier sets, one per output signal.
+        normalize (bool): Divide by n as the inverse DFT does.
+        workers (int | None): FFT threads; None uses the configured count.
+
+    Returns:
+        SignalBatch: Batch whose row i is `resynthesize(source, masks[i], normalize)`.
+    """
+    coefficients = _fourier_coefficients(source)
+    modulus = len(coefficients)
+
+    if isinstance(masks, np.ndarray):
+        assert masks.dtype == bool
+        assert masks.ndim == 2 and masks.shape[1] == modulus
+    else:
+        masks = np.array([multiplier_mask(multipliers, modulus) for multipliers in masks]).reshape(-1, modulus)
+
+    samples = fft_backend.ifft(np.where(masks, coefficients, 0), axis=1, workers=workers)
+
+    if not normalize:
+        samples *= modulus
+
+    return SignalBatch(samples)
@@ -0,0 +1,104 @@
+"""
+Spectra of time-rescaled signals, derived from the spectrum of the original signal
+by index maps instead of new Fourier transforms.
+
+Rescaling time by a unit a permutes the Fourier coefficients, k ↦ a⁻¹ · k. Rescaling
+by a non-unit a with g = gcd(a, n) folds the spectrum onto the multiples of g.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from dissig.fourier.fftonnetz import fft_with_multipliers
+from dissig.tonnetze.networks import SignalTonnetz
+from dissig.utils.blocks import block_rows
+
+
+def rescaled_spectrum(spectrum : np.ndarray, multiplier : int) -> np.ndarray:
+    """
+    Compute the spectrum of a signal with time rescaled by `multiplier` from the
+    spectrum of the original signal, in O(n).
+
+    With y(t) = x(a · t mod n), g = gcd(a, n), m = n / g and a' = a / g, which is a
+    unit modulo m, the spectrum Y vanishes off the multiples of g and
+        Y[g · l] = F[a'⁻¹ · l mod m],   where F[r] = Σ_j X[r + m · j].
+
+    Args:
+        spectrum (np.ndarray): The n Fourier coefficients X of the original signal.
+        multiplier (int): Integer multiplier a; only its residue mod n matters.
+
+    Returns:
+        np.ndarray: The n Fourier coefficients Y of the rescaled signal.
+    """
+    assert isinstance(spectrum, np.ndarray)
+    assert spectrum.ndim == 1
+    assert isinstance(multiplier, (int, np.integer))
+
+    modulus = len(spectrum)
+    residue = int(multiplier) % modulus
+    common_divisor = math.gcd(residue, modulus)
+    cofactor = modulus // common_divisor
+
+    folded_spectrum = spectrum.reshape(common_divisor, cofactor).sum(axis=0)
+    inverse = pow(residue // common_divisor, -1, cofactor)
+
+    rescaled = np.zeros(modulus, dtype=np.complex128)
+    rescaled[::common_divisor] = folded_spectrum[(inverse * np.arange(cofactor)) % cofactor]
+
+    return rescaled
+
+
+def node_spectra(signal_tonnetz : SignalTonnetz, vertices : list[int] | np.ndarray | None = None) -> np.ndarray:
+    """
+    Compute the spectra of the node signals of a SignalTonnetz from a single
+    Fourier transform of its tonic.
+
+    Vertices are grouped by their gcd with n, so that each folded spectrum is
+    formed once; the rows of a group are then filled by blocked gathers.
+
+    Args:
+        signal_tonnetz (SignalTonnetz): A tonnetz whose node signals are the rescalings
+            of its tonic (`has_propagated_signals` must hold).
+        vertices (list[int] | np.ndarray | None): Vertices whose spectra to compute;
+            defaults to `signal_tonnetz.vertices()`.
+
+    Returns:
+        np.ndarray: Complex array of shape (len(vertices), n) whose row i is the
+            spectrum of the signal at `vertices[i]`.
+
+    Raises:
+        AssertionError: If the node signals are not rescalings of the tonic.
+    """
+    assert signal_tonnetz.has_propagated_signals()
+
+    if vertices is None:
+        vertices = signal_tonnetz.vertices()
+    vertices = np.asarray(vertices, dtype=np.int64)
+    assert vertices.ndim == 1
+
+    modulus = signal_tonnetz.sample_count
+    tonic_spectrum = fft_with_multipliers(signal_tonnetz.tonic_signal, as_array=True)
+    gcd_classes = signal_tonnetz.context.gcd_classes[vertices % modulus]
+
+    spectra = np.zeros((len(vertices), modulus), dtype=np.complex128)
+
+    for common_divisor in np.unique(gcd_classes).tolist():
+        cofactor = modulus // common_divisor
+        folded_spectrum = tonic_spectrum.reshape(common_divisor, cofactor).sum(axis=0)
+
+        rows = np.flatnonzero(gcd_classes == common_divisor)
+        inverses = np.array(
+            [pow((vertex % modulus) // common_divisor, -1, cofactor) for vertex in vertices[rows].tolist()],
+            dtype=np.int64,
+        )
+        positions = np.arange(cofactor, dtype=np.int64)
+
+        block_size = block_rows(cofactor)
+        for start in range(0, len(rows), block_size):
+            stop = min(len(rows), start + block_size)
+            phase_indices = np.multiply.outer(inverses[start:stop], positions) % cofactor
+            spectra[rows[start:stop], ::common_divisor] = folded_spectrum[phase_indices]
+
+    return spectra
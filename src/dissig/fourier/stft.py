@@ -0,0 +1,201 @@
+"""
+Short-time Fourier transforms of signals and of audio streamed chunk by chunk.
+
+Frames are strided views onto the samples (`sliding_window_view`), never copied
+one by one; blocks of frames are windowed and transformed with one batched FFT.
+Frame i covers the samples [i · hop_length, i · hop_length + frame_length), and
+only complete frames are transformed.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import get_window
+
+from dissig.signals.discrete import Signal
+from dissig.utils import fft_backend
+from dissig.utils.blocks import block_rows
+
+
+def frame_count(sample_count : int, frame_length : int, hop_length : int) -> int:
+    """
+    Number of complete frames in `sample_count` samples.
+
+    Args:
+        sample_count (int): Number of samples.
+        frame_length (int): Samples per frame.
+        hop_length (int): Samples between the starts of consecutive frames.
+
+    Returns:
+        int: The number of frames that fit entirely in the samples.
+    """
+    if sample_count < frame_length:
+        return 0
+    return 1 + (sample_count - frame_length) // hop_length
+
+
+def _frame_window(window : str | np.ndarray | None, frame_length : int) -> np.ndarray:
+    """The window as an array of length `frame_length`; None is the rectangular window."""
+    if window is None:
+        return np.ones(frame_length)
+    if isinstance(window, str):
+        return get_window(window, frame_length)
+
+    window = np.asarray(window)
+    assert window.shape == (frame_length,)
+    return window
+
+
+def _check_frames(frame_length : int, hop_length : int | None) -> int:
+    """Validate the frame parameters and return the hop length, defaulting to half a frame."""
+    assert isinstance(frame_length, int)
+    assert frame_length >= 1
+
+    if hop_length is None:
+        hop_length = max(1, frame_length // 2)
+    assert isinstance(hop_length, int)
+    assert hop_length >= 1
+
+    return hop_length
+
+
+def _frame_spectra(
+    samples : np.ndarray,
+    frame_length : int,
+    hop_length : int,
+    window : np.ndarray,
+    real : bool,
+    workers : int | None,
+) -> np.ndarray:
+    """Spectra of the complete frames of `samples`, one row per frame."""
+    frames = sliding_window_view(samples, frame_length)[::hop_length]
+    spectrum_length = frame_length // 2 + 1 if real else frame_length
+    transform = fft_backend.rfft if real else fft_backend.fft
+
+    spectra = np.empty((len(frames), spectrum_length), dtype=np.complex128)
+
+    block_size = block_rows(frame_length)
+    for start in range(0, len(frames), block_size):
+        stop = min(len(frames), start + block_size)
+        spectra[start:stop] = transform(frames[start:stop] * window, axis=1, workers=workers)
+
+    return spectra
+
+
+def stft(
+    source : Signal | np.ndarray,
+    frame_length : int,
+    hop_length : int | None = None,
+    window : str | np.ndarray | None = "hann",
+    real : bool | None = None,
+    workers : int | None = None,
+) -> np.ndarray:
+    """
+    Compute the short-time Fourier transform of a signal.
+
+    Real signals are transformed with `rfft`, so each frame keeps only its
+    frame_length // 2 + 1 non-negative multipliers.
+
+    Args:
+        source (Signal | np.ndarray): The signal, or a one-dimensional array of samples.
+        frame_length (int): Samples per frame.
+        hop_length (int | None): Samples between consecutive frames; defaults to
+            half a frame.
+        window (str | np.ndarray | None): A window name understood by
+            `scipy.signal.get_window`, an array of length frame_length, or None
+            for the rectangular window.
+        real (bool | None): Whether the samples are real-valued; None to check
+            their imaginary part.
+        workers (int | None): FFT threads; None uses the configured count.
+
+    Returns:
+        np.ndarray: Complex array of shape (frame_count, spectrum_length) whose row i
+            is the spectrum of frame i, indexed by multiplier.
+
+    Raises:
+        AssertionError: If the samples are not one-dimensional or the frame
+            parameters are invalid.
+    """
+    hop_length = _check_frames(frame_length, hop_length)
+
+    samples = source.underlying_signal if isinstance(source, Signal) else np.asarray(source)
+    assert samples.ndim == 1
+
+    if real is None:
+        real = not np.iscomplexobj(samples) or not np.any(samples.imag)
+    if real:
+        samples = samples.real
+
+    return _frame_spectra(
+        samples,
+        frame_length,
+        hop_length,
+        _frame_window(window, frame_length),
+        real,
+        workers,
+    )
+
+
+def stream_stft(
+    chunks : Iterable[np.ndarray],
+    frame_length : int,
+    hop_length : int | None = None,
+    window : str | np.ndarray | None = "hann",
+    real : bool = True,
+    workers : int | None = None,
+) -> Iterator[np.ndarray]:
+    """
+    Compute the short-time Fourier transform of a stream of sample chunks.
+
+    Only the samples of the frame in progress are carried from one chunk to the
+    next, so arbitrarily long recordings are analyzed in memory bounded by the
+    chunk and frame lengths. The frames, and hence the concatenation of the
+    yielded spectra, are exactly those of `stft` on the concatenated chunks.
+
+    Args:
+        chunks (Iterable[np.ndarray]): One-dimensional sample arrays, in order,
+            e.g. from `dissig.io.from_wav.iter_wav_chunks`.
+        frame_length (int): Samples per frame.
+        hop_length (int | None): Samples between consecutive frames; defaults to
+            half a frame.
+        window (str | np.ndarray | None): Window, as in `stft`.
+        real (bool): Whether the samples are real-valued; complex chunks require False.
+        workers (int | None): FFT threads; None uses the configured count.
+
+    Yields:
+        np.ndarray: Spectra of the frames completed by each chunk, one row per
+            frame; chunks completing no frame yield nothing.
+    """
+    hop_length = _check_frames(frame_length, hop_length)
+    frame_window = _frame_window(window, frame_length)
+    sample_dtype = np.float64 if real else np.complex128
+
+    carried_samples = np.empty(0, dtype=sample_dtype)
+    skipped_count = 0
+
+    for chunk in chunks:
+        chunk = np.asarray(chunk)
+        assert chunk.ndim == 1
+        assert not (real and np.iscomplexobj(chunk))
+
+        dropped_count = min(skipped_count, len(chunk))
+        skipped_count -= dropped_count
+
+        buffer = np.concatenate((carried_samples, chunk[dropped_count:].astype(sample_dtype)))
+        completed_count = frame_count(len(buffer), frame_length, hop_length)
+
+        if completed_count:
+            yield _frame_spectra(
+                buffer[:(completed_count - 1) * hop_length + frame_length],
+                frame_length,
+                hop_length,
+                frame_window,
+                real,
+                workers,
+            )
+
+        consumed_count = completed_count * hop_length
+        skipped_count += max(0, consumed_count - len(buffer))
+        carried_samples = buffer[consumed_count:]
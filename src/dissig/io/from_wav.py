@@ -3,6 +3,8 @@ Load WAV file as Signal object
 """
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import numpy as np
 from scipy.io import wavfile
 
@@ -21,9 +23,46 @@ def read_wav_to_signal(file_path : str) -> tuple[Signal, int]:
     """
     sample_rate, samples = wavfile.read(file_path)
 
-    complex_samples = [complex(sample, 0) for sample in samples]
-    
+    complex_samples = np.asarray(samples, dtype=np.complex128)
+
     discrete_signal = Signal(complex_samples)
 
     return discrete_signal, sample_rate
 
+
+def iter_wav_chunks(
+    file_path : str,
+    chunk_length : int = 2**16,
+    channel : int | None = None,
+) -> tuple[Iterator[np.ndarray], int]:
+    """
+    Memory-map a WAV file and stream its samples in chunks, returning the chunk
+    iterator and the sample rate.
+
+    Only the chunk being converted is read into memory, so recordings of any
+    length can be fed to `dissig.fourier.stft.stream_stft`.
+
+    Args:
+        file_path (str): Path of WAV file to import
+        chunk_length (int): Number of samples per chunk; the last chunk may be shorter.
+        channel (int | None): Channel to read from a multi-channel file; None
+            averages the channels.
+
+    Return:
+        Tuple consisting of an iterator over float64 sample chunks and the WAV sample rate
+    """
+    assert isinstance(chunk_length, int)
+    assert chunk_length >= 1
+
+    sample_rate, samples = wavfile.read(file_path, mmap=True)
+    if samples.ndim == 2:
+        assert channel is None or 0 <= channel < samples.shape[1]
+
+    def sample_chunks() -> Iterator[np.ndarray]:
+        for start in range(0, len(samples), chunk_length):
+            chunk = samples[start:start + chunk_length]
+            if chunk.ndim == 2:
+                chunk = chunk.mean(axis=1) if channel is None else chunk[:, channel]
+            yield np.asarray(chunk, dtype=np.float64)
+
+    return sample_chunks(), sample_rate
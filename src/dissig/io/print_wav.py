@@ -73,21 +73,19 @@ def signal_to_wav(
 
     modulus = len(signal)
 
-    normalized_real_signal = signal.extract_real(normalize=True)
+    normalized_real_signal = np.asarray(signal.extract_real(normalize=True), dtype=float)
 
     wave_sample_period = 1 / wav_sample_rate
     signal_sample_period = 1 / signal_max_freq
 
-    resampled_ostinato = []
     wav_sample_count = math.floor(wav_duration * wav_sample_rate)
-    for wav_sample_idx in range(wav_sample_count):
-        signal_sample_index = math.floor(wav_sample_idx * wave_sample_period / signal_sample_period)
-        signal_sample_index = signal_sample_index%modulus
+    wav_sample_indices = np.arange(wav_sample_count)
+    signal_sample_indices = np.floor(
+        wav_sample_indices * wave_sample_period / signal_sample_period
+    ).astype(np.int64)
+    signal_sample_indices %= modulus
 
-        value = normalized_real_signal[signal_sample_index]
-        resampled_ostinato.append(value)
-
-    resampled_waveform = np.array(resampled_ostinato)
+    resampled_waveform = normalized_real_signal[signal_sample_indices]
     rescaled_waveform = resampled_waveform * MAX_INT16
     int_waveform = rescaled_waveform.astype(np.int16)
 
@@ -110,9 +108,10 @@ def tonnetz_to_wav(
     """
     Converts each signal stored at the nodes of a SignalTonnetz into a WAV file.
 
-    Each node in the Tonnetz graph is expected to have a `'signal'` attribute,
-    which is converted to audio using the `signal_to_wav` function. The resulting
-    WAV files are saved with filenames that include the node identifier.
+    Node signals are streamed one at a time through `iter_node_signals`, so lazy
+    tonnetze are written in bounded memory, and each is converted to audio using
+    the `signal_to_wav` function. The resulting WAV files are saved with filenames
+    that include the node identifier.
 
     Args:
         signal_tonnetz (SignalTonnetz): A Tonnetz graph with signals on its nodes.
@@ -125,9 +124,7 @@ def tonnetz_to_wav(
     Returns:
         None
     """
-    tonnetz_nodes = signal_tonnetz.network.nodes
-    for idx in tonnetz_nodes:
-        present_signal = signal_tonnetz.network.nodes[idx]['signal']
+    for idx, present_signal in signal_tonnetz.iter_node_signals():
         signal_to_wav(
             present_signal,
             signal_max_freq,
@@ -3,9 +3,12 @@
 """
 from __future__ import annotations
 
-from dissig.signals.discrete import Signal, character_signal
+from dissig.signals.discrete import CharacterSignal, Signal, character_signal
+from dissig.signals.batch import SignalBatch
 
 __all__ = [
     "Signal",
+    "CharacterSignal",
     "character_signal",
+    "SignalBatch",
 ]
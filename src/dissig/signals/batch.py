@@ -0,0 +1,179 @@
+"""
+dissig.signals.batch
+
+This module defines the `SignalBatch` class, a stack of same-modulus discrete signals
+stored as one two-dimensional complex array, with batched versions of the `Signal` operations.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from dissig.signals.discrete import Signal
+from dissig.utils import fft_backend
+from dissig.utils.context import ModulusContext, modulus_context
+
+
+class SignalBatch():
+    """
+    A batch of discrete-time signals sharing one sample count, stored as a
+    contiguous complex128 array of shape (batch_size, sample_count).
+
+    Attributes:
+        batch_size (int): Number of signals in the batch.
+        sample_count (int): Number of samples in every signal of the batch.
+        samples (np.ndarray): Read-only view of the (batch_size, sample_count) sample array.
+    """
+    def __init__(self, sample_array : np.ndarray):
+        """
+        Constructs a SignalBatch from a two-dimensional complex array.
+
+        A C-contiguous complex128 array is stored without copying.
+
+        Args:
+            sample_array (np.ndarray): Complex array of shape (batch_size, sample_count),
+                with sample_count ≥ 1.
+
+        Raises:
+            AssertionError: If the input is not a two-dimensional complex array
+                with at least one sample per signal.
+        """
+        assert isinstance(sample_array, np.ndarray)
+        assert sample_array.ndim == 2
+        assert np.issubdtype(sample_array.dtype, np.complexfloating)
+        assert sample_array.shape[1] >= 1
+
+        self._samples = np.ascontiguousarray(sample_array, dtype=np.complex128)
+        self.batch_size, self.sample_count = self._samples.shape
+
+    @classmethod
+    def from_signals(cls, signals : list[Signal]) -> SignalBatch:
+        """
+        Stack a non-empty list of same-length signals into a batch.
+
+        Args:
+            signals (list[Signal]): Signals to stack; all must have the same sample count.
+
+        Returns:
+            SignalBatch: Batch whose rows are the given signals, in order.
+
+        Raises:
+            AssertionError: If the list is empty or the sample counts differ.
+        """
+        assert isinstance(signals, list)
+        assert len(signals) >= 1
+        assert len({len(signal) for signal in signals}) == 1
+
+        return cls(np.stack([signal.underlying_signal for signal in signals]))
+
+    @classmethod
+    def characters(cls, multipliers : list[int] | np.ndarray, modulus : int) -> SignalBatch:
+        """
+        Construct the batch of character signals χ_k(t) = exp(2πi · k · t / modulus),
+        one row per multiplier k.
+
+        Args:
+            multipliers (list[int] | np.ndarray): Frequency multipliers, one per row.
+            modulus (int): Signal length; must be ≥ 1.
+
+        Returns:
+            SignalBatch: Batch of complex exponential signals of length modulus.
+
+        Raises:
+            AssertionError: If modulus < 1 or the multipliers are not integers.
+        """
+        assert isinstance(modulus, int)
+        assert modulus >= 1
+        multiplier_array = np.asarray(multipliers)
+        assert multiplier_array.ndim == 1
+        assert multiplier_array.size == 0 or np.issubdtype(multiplier_array.dtype, np.integer)
+
+        roots_of_unity = np.exp(2j * np.pi * np.arange(modulus) / modulus)
+        phase_indices = (
+            (multiplier_array.astype(np.int64) % modulus)[:, None]
+            * np.arange(modulus, dtype=np.int64)[None, :]
+        ) % modulus
+
+        return cls(roots_of_unity[phase_indices])
+
+    @property
+    def samples(self) -> np.ndarray:
+        """Read-only view of the (batch_size, sample_count) samples; no copy is made."""
+        view = self._samples.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def context(self) -> ModulusContext:
+        """Shared arithmetic context for ℤ/sample_countℤ."""
+        return modulus_context(self.sample_count)
+
+    def __len__(self):
+        """Return the number of signals in the batch."""
+        return self.batch_size
+
+    def __getitem__(self, idx : int) -> Signal:
+        """Return the signal in row `idx` as a Signal sharing the batch's memory."""
+        return Signal(self._samples[idx])
+
+    def to_signals(self) -> list[Signal]:
+        """
+        Split the batch into a list of Signal objects, one per row.
+
+        Each Signal is a view onto its row of the batch; no samples are copied.
+
+        Returns:
+            list[Signal]: The signals of the batch, in order.
+        """
+        return [Signal(row) for row in self._samples]
+
+    def scale_time_by(self, multiplier : int) -> SignalBatch:
+        """
+        Return a new batch with time in every signal rescaled modularly by the multiplier.
+
+        Args:
+            multiplier (int): Integer multiplier to apply in ℤ/sample_countℤ.
+
+        Returns:
+            SignalBatch: The rescaled batch.
+
+        Raises:
+            AssertionError: If the multiplier is not an integer.
+        """
+        assert isinstance(multiplier, (int, np.integer))
+
+        index_table = self.context.scaling_table(multiplier)
+
+        return SignalBatch(self._samples[:, index_table])
+
+    def extract_real(self, normalize=False) -> np.ndarray:
+        """
+        Extracts the real parts of every signal in the batch.
+
+        If `normalize` is True, each row is scaled to the range [-1, 1] by
+        dividing it by its own peak absolute value.
+
+        Returns:
+            np.ndarray: Float array of shape (batch_size, sample_count).
+        """
+        real_signals = self._samples.real.copy()
+
+        if normalize:
+            peak_values = np.max(np.abs(real_signals), axis=1, keepdims=True)
+            real_signals /= (peak_values + 1e-8)
+
+        return real_signals
+
+    def fft(self, workers : int | None = None) -> np.ndarray:
+        """
+        Compute the discrete Fourier transform of every signal along the sample axis.
+
+        The rows are transformed in parallel by `dissig.utils.fft_backend`.
+
+        Args:
+            workers (int | None): FFT threads; None uses the configured count.
+
+        Returns:
+            np.ndarray: Complex array of shape (batch_size, sample_count) whose row `i`
+                holds the Fourier coefficients of signal `i`, indexed by multiplier.
+        """
+        return fft_backend.fft(self._samples, axis=1, workers=workers)
@@ -8,35 +8,64 @@ from __future__ import annotations
 
 import numpy as np
 
-from dissig.utils.arithmetic import multiplicative_units
+from dissig.utils import fft_backend
+from dissig.utils.context import ModulusContext, modulus_context
 
 class Signal():
     """
-    A discrete-time, finite-length signal represented by a list of complex-valued samples.
+    A discrete-time, finite-length signal backed by a contiguous complex128 array.
 
     Attributes:
         sample_count (int): Number of samples in the signal.
-        underlying_signal (list[complex]): The signal values.
+        underlying_signal (np.ndarray): Read-only view of the signal values.
         ring_units (list[int]): Multiplicative units in ℤ/sample_countℤ.
     """
-    def __init__(self, sample_list : list[complex]):
+    # Make numpy scalars and arrays defer to the reflected operators below instead of
+    # iterating over the (modular, never-ending) indices of the signal.
+    __array_ufunc__ = None
+
+    def __init__(self, sample_list : list[complex] | np.ndarray):
         """
-        Constructs a Signal object from a list of complex samples.
+        Constructs a Signal object from a list or array of complex samples.
+
+        A one-dimensional complex128 array that is already C-contiguous is stored
+        as-is, without copying; other complex arrays are converted once.
 
         Args:
-            sample_list (list[complex]): Non-empty list of complex numbers.
+            sample_list (list[complex] | np.ndarray): Non-empty list of complex numbers,
+                or a non-empty one-dimensional array with a complex dtype.
 
         Raises:
-            AssertionError: If the input is not a list of complex numbers or is empty.
+            AssertionError: If the input is not a list of complex numbers or a complex
+                array, or is empty.
         """
-        assert isinstance(sample_list, list)
+        if isinstance(sample_list, np.ndarray):
+            assert sample_list.ndim == 1
+            assert np.issubdtype(sample_list.dtype, np.complexfloating)
+        else:
+            assert isinstance(sample_list, list)
+            assert all(isinstance(entry, complex) for entry in sample_list)
         assert len(sample_list) >= 1
-        assert all(isinstance(entry, complex) for entry in sample_list)
 
-        self.sample_count = len(sample_list)
-        self.underlying_signal = sample_list
+        self._samples = np.ascontiguousarray(sample_list, dtype=np.complex128)
+        self.sample_count = len(self._samples)
+
+    @property
+    def underlying_signal(self) -> np.ndarray:
+        """Read-only view of the samples; no copy is made."""
+        view = self._samples.view()
+        view.flags.writeable = False
+        return view
 
-        self.ring_units = multiplicative_units(self.sample_count)
+    @property
+    def context(self) -> ModulusContext:
+        """Shared arithmetic context for ℤ/sample_countℤ."""
+        return modulus_context(self.sample_count)
+
+    @property
+    def ring_units(self) -> list[int]:
+        """Multiplicative units in ℤ/sample_countℤ, read lazily from the shared context."""
+        return self.context.units
 
     def scale_time_by(self, multiplier : int) -> Signal:
         """
@@ -54,17 +83,199 @@ class Signal():
         Raises:
             AssertionError: If the multiplier is not an integer.
         """
-        assert isinstance(multiplier, int)
+        assert isinstance(multiplier, (int, np.integer))
 
-        new_sample_list = [
-            self.underlying_signal[(multiplier * idx)%len(self)]
-            for idx in range(self.sample_count)
-        ]
+        index_table = self.context.scaling_table(multiplier)
 
-        new_signal = Signal(new_sample_list)
+        new_signal = Signal(self._samples[index_table])
 
         return new_signal
 
+    def scale_time_by_many(self, multipliers : list[int] | np.ndarray) -> np.ndarray:
+        """
+        Rescale time by every multiplier at once.
+
+        Row `i` of the result is the sample array of `self.scale_time_by(multipliers[i])`;
+        all rows are gathered in a single fancy-indexing pass.
+
+        Args:
+            multipliers (list[int] | np.ndarray): Integer multipliers to apply in ℤ/modulusℤ.
+
+        Returns:
+            np.ndarray: Complex array of shape (len(multipliers), sample_count).
+
+        Raises:
+            AssertionError: If the multipliers are not integers.
+        """
+        multiplier_array = np.asarray(multipliers)
+        assert multiplier_array.ndim == 1
+        assert multiplier_array.size == 0 or np.issubdtype(multiplier_array.dtype, np.integer)
+
+        modulus = self.sample_count
+        reduced_multipliers = multiplier_array.astype(np.int64) % modulus
+        index_table = (
+            reduced_multipliers[:, None] * np.arange(modulus, dtype=np.int64)[None, :]
+        ) % modulus
+
+        return self._samples[index_table]
+
+    def rescaling_sum(self, include_zero : bool = True) -> Signal:
+        """
+        Sum all time rescalings of the signal, Σ_v s(v · t mod n), over v in ℤ/nℤ
+        (or over v ≠ 0 if `include_zero` is False).
+
+        For fixed t the map v ↦ v · t hits each multiple of g = gcd(t, n) exactly
+        g times, so the sum only depends on g and equals g · Σ_j s(g · j). One value
+        is computed per divisor of n and broadcast over its gcd class, which costs
+        O(σ(n)) instead of the O(n^2) of summing n rescaled signals.
+
+        Args:
+            include_zero (bool): Whether the term for v = 0, the constant s(0), is included.
+
+        Returns:
+            Signal: The summed signal.
+        """
+        modulus = self.sample_count
+
+        class_totals = np.zeros(modulus + 1, dtype=np.complex128)
+        for divisor in self.context.divisors:
+            class_totals[divisor] = divisor * self._samples[::divisor].sum()
+
+        total_signal = class_totals[self.context.gcd_classes]
+        if not include_zero:
+            total_signal -= self._samples[0]
+
+        return Signal(total_signal)
+
+    def _operand_samples(self, other : Signal | complex) -> np.ndarray | complex | None:
+        """Samples of a same-length Signal, a scalar as is, or None for unsupported operands."""
+        if isinstance(other, Signal):
+            assert len(other) == len(self)
+            return other.underlying_signal
+        if isinstance(other, (int, float, complex, np.number)):
+            return other
+        return None
+
+    def __add__(self, other : Signal | complex) -> Signal:
+        """Pointwise sum with a same-length signal, or a scalar added to every sample."""
+        operand = self._operand_samples(other)
+        if operand is None:
+            return NotImplemented
+        return Signal(self._samples + operand)
+
+    def __radd__(self, other : complex) -> Signal:
+        """Scalar added to every sample; also lets `sum` start from 0."""
+        return self.__add__(other)
+
+    def __sub__(self, other : Signal | complex) -> Signal:
+        """Pointwise difference with a same-length signal, or a scalar subtracted from every sample."""
+        operand = self._operand_samples(other)
+        if operand is None:
+            return NotImplemented
+        return Signal(self._samples - operand)
+
+    def __mul__(self, other : Signal | complex) -> Signal:
+        """Pointwise product with a same-length signal, or every sample scaled by a scalar."""
+        operand = self._operand_samples(other)
+        if operand is None:
+            return NotImplemented
+        return Signal(self._samples * operand)
+
+    def __rmul__(self, other : complex) -> Signal:
+        """Every sample scaled by a scalar."""
+        return self.__mul__(other)
+
+    def __neg__(self) -> Signal:
+        """The signal with every sample negated."""
+        return Signal(-self._samples)
+
+    def __iadd__(self, other : Signal | complex) -> Signal:
+        """
+        Add in place, without allocating a new sample array.
+
+        The samples are shared with whatever array the Signal was built from, which
+        sees the update; read-only samples (e.g. rows of a node signal matrix) raise
+        a ValueError.
+        """
+        operand = self._operand_samples(other)
+        if operand is None:
+            return NotImplemented
+        self._samples += operand
+        return self
+
+    def __isub__(self, other : Signal | complex) -> Signal:
+        """Subtract in place, as `__iadd__`."""
+        operand = self._operand_samples(other)
+        if operand is None:
+            return NotImplemented
+        self._samples -= operand
+        return self
+
+    def __imul__(self, other : Signal | complex) -> Signal:
+        """Multiply in place, as `__iadd__`."""
+        operand = self._operand_samples(other)
+        if operand is None:
+            return NotImplemented
+        self._samples *= operand
+        return self
+
+    def conjugate(self) -> Signal:
+        """Return the complex conjugate signal."""
+        return Signal(np.conj(self._samples))
+
+    def energy(self) -> float:
+        """Return the energy Σ_t |s(t)|² of the signal."""
+        return float(np.vdot(self._samples, self._samples).real)
+
+    def inner(self, other : Signal) -> complex:
+        """
+        Inner product Σ_t s(t) · conj(o(t)), linear in this signal.
+
+        Args:
+            other (Signal): A signal of the same length.
+
+        Returns:
+            complex: The inner product.
+        """
+        assert isinstance(other, Signal)
+        assert len(other) == len(self)
+
+        return complex(np.vdot(other.underlying_signal, self._samples))
+
+    def convolve(self, other : Signal) -> Signal:
+        """
+        Circular convolution (s ∗ o)(t) = Σ_u s(u) · o(t - u mod n), computed through the FFT.
+
+        Args:
+            other (Signal): A signal of the same length.
+
+        Returns:
+            Signal: The convolution, in O(n log n).
+        """
+        assert isinstance(other, Signal)
+        assert len(other) == len(self)
+
+        product = fft_backend.fft(self._samples) * fft_backend.fft(other.underlying_signal)
+
+        return Signal(fft_backend.ifft(product))
+
+    def correlate(self, other : Signal) -> Signal:
+        """
+        Circular cross-correlation r(τ) = Σ_t s(t + τ mod n) · conj(o(t)), computed through the FFT.
+
+        Args:
+            other (Signal): A signal of the same length.
+
+        Returns:
+            Signal: The correlation, in O(n log n); r(0) is `self.inner(other)`.
+        """
+        assert isinstance(other, Signal)
+        assert len(other) == len(self)
+
+        product = fft_backend.fft(self._samples) * np.conj(fft_backend.fft(other.underlying_signal))
+
+        return Signal(fft_backend.ifft(product))
+
     def __len__(self):
         """Return the number of samples in the signal."""
         return self.sample_count
@@ -88,12 +299,12 @@ class Signal():
         """
         assert isinstance(idx, int)
 
-        value = self.underlying_signal[idx%len(self)]
+        value = self._samples[idx%len(self)]
 
         return value
 
 
-    def extract_real(self, normalize=False) -> list[float]:
+    def extract_real(self, normalize=False) -> np.ndarray:
         """
         Extracts the real parts of the complex-valued signal.
 
@@ -101,22 +312,142 @@ class Signal():
         by dividing each value by the peak absolute value in the signal.
 
         Returns:
-            list[float]: The list of real parts from the underlying signal,
+            np.ndarray: Float array of real parts from the underlying signal,
                         optionally normalized.
         """
-        real_signal = [float(value.real) for value in self.underlying_signal]
-
-        max_real_value = max(real_signal)
-        min_real_value = min(real_signal)
-        peak_value = max(max_real_value, abs(min_real_value))
+        real_signal = self._samples.real.copy()
 
         if normalize:
-            real_signal = [float(value/(peak_value + 1e-8)) for value in real_signal]
+            peak_value = np.max(np.abs(real_signal))
+            real_signal /= (peak_value + 1e-8)
 
         return real_signal
 
 
-def character_signal(multiplier : int, modulus : int) -> Signal:
+class CharacterSignal(Signal):
+    """
+    The character signal t ↦ amplitude · exp(2πi · multiplier · t / modulus), stored
+    analytically as (multiplier, modulus, amplitude).
+
+    Rescaling time by a sends χ_k to χ_{a·k mod n}, scaling multiplies the amplitude
+    and the spectrum is a single spike, so these operations never touch samples.
+    The samples are computed, vectorized, only on first use and are read-only, so
+    in-place arithmetic rebinds the name to a new signal instead of mutating them.
+
+    Attributes:
+        multiplier (int): Frequency multiplier k, reduced mod n.
+        amplitude (complex): Constant factor of the character.
+    """
+    def __init__(self, multiplier : int, modulus : int, amplitude : complex = 1):
+        """
+        Constructs the character signal amplitude · χ_multiplier on ℤ/modulusℤ.
+
+        Args:
+            multiplier (int): Frequency multiplier.
+            modulus (int): Signal length; must be ≥ 1.
+            amplitude (complex): Constant factor of the character.
+
+        Raises:
+            AssertionError: If modulus < 1 or the multiplier or modulus is not an integer.
+        """
+        assert isinstance(multiplier, (int, np.integer))
+        assert isinstance(modulus, int)
+        assert modulus >= 1
+        assert isinstance(amplitude, (int, float, complex, np.number))
+
+        self.multiplier = int(multiplier) % modulus
+        self.sample_count = modulus
+        self.amplitude = complex(amplitude)
+        self._sample_cache = None
+
+    @property
+    def _samples(self) -> np.ndarray:
+        """The samples, computed on first access and kept read-only."""
+        if self._sample_cache is None:
+            modulus = self.sample_count
+            phases = (self.multiplier * np.arange(modulus, dtype=np.int64)) % modulus
+            samples = self.amplitude * np.exp((2j * np.pi / modulus) * phases)
+            samples.flags.writeable = False
+            self._sample_cache = samples
+        return self._sample_cache
+
+    def scale_time_by(self, multiplier : int) -> CharacterSignal:
+        """
+        Return the character with time rescaled by `multiplier`, χ_{multiplier · k}, in O(1).
+
+        Args:
+            multiplier (int): Integer multiplier to apply in ℤ/modulusℤ.
+
+        Returns:
+            CharacterSignal: The rescaled character.
+        """
+        assert isinstance(multiplier, (int, np.integer))
+
+        return CharacterSignal(int(multiplier) * self.multiplier, self.sample_count, self.amplitude)
+
+    def spectrum(self) -> np.ndarray:
+        """Fourier coefficients of the character: amplitude · n at the multiplier, 0 elsewhere."""
+        spectrum = np.zeros(self.sample_count, dtype=np.complex128)
+        spectrum[self.multiplier] = self.amplitude * self.sample_count
+        return spectrum
+
+    def rescaling_sum(self, include_zero : bool = True) -> Signal:
+        """
+        Sum all time rescalings of the character, Σ_v χ_k(v · t).
+
+        The sum over v of exp(2πi · k · v · t / n) is n when k · t ≡ 0 mod n and 0
+        otherwise, so the result is computed without materializing any samples.
+
+        Args:
+            include_zero (bool): Whether the term for v = 0, the constant amplitude, is included.
+
+        Returns:
+            Signal: The summed signal.
+        """
+        modulus = self.sample_count
+        times = np.arange(modulus, dtype=np.int64)
+
+        total_signal = np.where((self.multiplier * times) % modulus == 0, self.amplitude * modulus, 0j)
+        if not include_zero:
+            total_signal -= self.amplitude
+
+        return Signal(total_signal)
+
+    def __mul__(self, other : Signal | complex) -> Signal:
+        """Scalars and characters multiply analytically; other signals pointwise."""
+        if isinstance(other, CharacterSignal):
+            assert len(other) == len(self)
+            return CharacterSignal(
+                self.multiplier + other.multiplier,
+                self.sample_count,
+                self.amplitude * other.amplitude,
+            )
+        if isinstance(other, (int, float, complex, np.number)):
+            return CharacterSignal(self.multiplier, self.sample_count, self.amplitude * other)
+        return super().__mul__(other)
+
+    def __iadd__(self, other : Signal | complex) -> Signal:
+        """Return `self + other` as a new, writable Signal; the character is left unchanged."""
+        return self.__add__(other)
+
+    def __isub__(self, other : Signal | complex) -> Signal:
+        """Return `self - other` as a new, writable Signal; the character is left unchanged."""
+        return self.__sub__(other)
+
+    def __imul__(self, other : Signal | complex) -> Signal:
+        """Return `self * other`, a new CharacterSignal for scalar and character factors."""
+        return self.__mul__(other)
+
+    def conjugate(self) -> CharacterSignal:
+        """Return the conjugate character, conj(amplitude) · χ_{-k}."""
+        return CharacterSignal(-self.multiplier, self.sample_count, self.amplitude.conjugate())
+
+    def energy(self) -> float:
+        """Return the energy n · |amplitude|² of the character."""
+        return self.sample_count * abs(self.amplitude) ** 2
+
+
+def character_signal(multiplier : int, modulus : int) -> CharacterSignal:
     """
     Construct a character signal from the exponential character
         χ(t) = exp(2πi · multiplier · t / modulus).
@@ -126,7 +457,8 @@ def character_signal(multiplier : int, modulus : int) -> Signal:
         modulus (int): Signal length; must be ≥ 1.
 
     Returns:
-        Signal: A complex exponential signal of length modulus.
+        CharacterSignal: A complex exponential signal of length modulus, whose
+            samples are computed on first use.
 
     Raises:
         AssertionError: If modulus < 1 or inputs are not integers.
@@ -135,27 +467,23 @@ def character_signal(multiplier : int, modulus : int) -> Signal:
     assert isinstance(modulus, int)
     assert modulus >= 1
 
-    theta = multiplier * (2 * np.pi / modulus)
-
-    sample_list = [complex(np.exp(complex(0,1) * theta * idx)) for idx in range(modulus)]
-
-    output_signal = Signal(sample_list)
+    output_signal = CharacterSignal(multiplier, modulus)
 
     return output_signal
 
 
 def signal_from_real(sample_list : list[int | float]) -> Signal:
     """
-    Construct a complex-valued Signal from a list of real numbers.
+    Construct a complex-valued Signal from a list or array of real numbers.
 
     Args:
-        sample_list (list[int | float]): Real-valued samples.
+        sample_list (list[int | float] | np.ndarray): Real-valued samples.
 
     Returns:
         Signal: Signal with samples cast as complex numbers (imaginary part 0).
     """
-    complexified_sample_list = [complex(value, 0) for value in sample_list]
+    complexified_samples = np.asarray(sample_list, dtype=np.complex128)
 
-    resulting_signal = Signal(complexified_sample_list)
+    resulting_signal = Signal(complexified_samples)
 
     return resulting_signal
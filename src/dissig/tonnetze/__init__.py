@@ -3,11 +3,21 @@
 """
 from __future__ import annotations
 
-from dissig.tonnetze.networks import Tonnetz, SignalTonnetz
+from dissig.tonnetze.networks import Tonnetz, SignalTonnetz, LazySignalTonnetz
+from dissig.tonnetze.quotient import QuotientTonnetz
+from dissig.tonnetze.reachability import ReachabilityIndex
+from dissig.tonnetze.sweep import run_sweep, tonnetz_statistics
+from dissig.tonnetze.walks import TonnetzWalker
 from dissig.tonnetze.visualizers import nx_viz
 
 __all__ = [
     "Tonnetz",
     "SignalTonnetz",
+    "LazySignalTonnetz",
+    "QuotientTonnetz",
+    "ReachabilityIndex",
+    "run_sweep",
+    "tonnetz_statistics",
+    "TonnetzWalker",
     "nx_viz",
 ]
@@ -4,11 +4,23 @@ Build the tone network (tonnetz) for signals of a given modulus, i.e., a given s
 from __future__ import annotations
 
 import copy
+import json
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from pathlib import Path
 
 import networkx as nx
 import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
 
 from dissig.signals.discrete import Signal
+from dissig.utils.blocks import block_rows
+from dissig.utils.context import modulus_context
+
+
+SAVE_FORMAT = "dissig-tonnetz" # tag written to the metadata of saved tonnetze
+SAVE_VERSION = 1
 
 
 class Tonnetz():
@@ -25,7 +37,13 @@ class Tonnetz():
             discrete pitch classes or tonal units.
         integer_list (list[int]): List of integer multipliers used to
             generate edges between vertices.
+        context (ModulusContext): Shared arithmetic data for ℤ/sample_countℤ.
+        backend (str): Storage for the graph, either "networkx" or "csr".
+        adjacency (sparse.csr_array | None): With the "csr" backend, the
+            sample_count × sample_count adjacency matrix whose entries are the
+            edge weights; None with the "networkx" backend.
         network (nx.DiGraph): A NetworkX directed graph representing the Tonnetz.
+            With the "csr" backend it is built from `adjacency` on first access.
     """
     def __init__(
         self,
@@ -33,6 +51,7 @@ class Tonnetz():
         integer_list : list[int],
         include_loops : bool=False,
         include_zero : bool=False,
+        backend : str="networkx",
     ):
         assert isinstance(sample_count, int)
         assert sample_count >= 1
@@ -40,6 +59,7 @@ class Tonnetz():
         assert all(isinstance(entry, int) for entry in integer_list)
         assert isinstance(include_loops, bool)
         assert isinstance(include_zero, bool)
+        assert backend in ["networkx", "csr"]
 
         self.sample_count = sample_count
         self.integer_list = integer_list
@@ -47,7 +67,67 @@ class Tonnetz():
         self.include_loops = include_loops
         self.include_zero = include_zero
 
-        self.network = self.generate_network(self.integer_list)
+        self.context = modulus_context(sample_count)
+
+        self.backend = backend
+        self.adjacency = None
+        self._network = None
+
+        if self.backend == "csr":
+            self.adjacency = self.generate_adjacency(self.integer_list)
+        else:
+            self.network = self.generate_network(self.integer_list)
+
+    @property
+    def network(self) -> nx.DiGraph:
+        """The Tonnetz as a NetworkX graph, materialized lazily with the "csr" backend."""
+        if self._network is None:
+            self._network = self.generate_network_from_adjacency()
+        return self._network
+
+    @network.setter
+    def network(self, new_network : nx.DiGraph):
+        self._network = new_network
+
+    def generate_edge_arrays(
+        self,
+        new_integer_list: list[int],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Generate the weighted directed edges for a list of integer multipliers as
+        COO arrays (sources, targets, weights).
+
+        All candidate edges (source, source · multiplier mod sample_count, multiplier)
+        are formed at once as an outer product of vertices and multipliers; self-loops
+        and, unless `include_zero` is set, edges leaving vertex 0 are then dropped with
+        boolean masks. Edges are ordered by source vertex, then by position of the
+        multiplier in `new_integer_list`.
+
+        Args:
+            new_integer_list (list[int]): A list of integer multipliers used to compute edges.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: Equal-length int64 arrays holding
+            the source vertex, target vertex and weight (multiplier) of every edge.
+        """
+        assert isinstance(new_integer_list, list)
+        assert all(isinstance(entry, int) for entry in new_integer_list)
+
+        modulus = self.sample_count
+        multipliers = np.asarray(new_integer_list, dtype=np.int64)
+        vertices = np.arange(modulus, dtype=np.int64)
+
+        sources = np.repeat(vertices, len(multipliers))
+        weights = np.tile(multipliers, modulus)
+        targets = (sources * (weights % modulus)) % modulus
+
+        edge_mask = np.ones(len(sources), dtype=bool)
+        if not self.include_loops:
+            edge_mask &= sources != targets
+        if not self.include_zero:
+            edge_mask &= sources != 0
+
+        return sources[edge_mask], targets[edge_mask], weights[edge_mask]
 
     def generate_weighted_edges(self, new_integer_list: list[int]) -> list[tuple[int, int, int]]:
         """
@@ -64,24 +144,9 @@ class Tonnetz():
             list[tuple[int, int, int]]: A list of triples (source, target, weight) representing
             the weighted edges of a directed graph.
         """
-        assert isinstance(new_integer_list, list)
-        assert all(isinstance(entry, int) for entry in new_integer_list)
-
-        if self.include_zero:
-            vertices = range(self.sample_count)
-        else:
-            vertices = range(1, self.sample_count)
-
-        new_weighted_edges = []
-        for source_vertex in vertices:
-            for interval_multiplier in new_integer_list:
-                target_vertex = (source_vertex * interval_multiplier) % self.sample_count
-                current_edge = (source_vertex, target_vertex, interval_multiplier)
+        sources, targets, weights = self.generate_edge_arrays(new_integer_list)
 
-                if not self.include_loops and source_vertex == target_vertex:
-                    continue
-
-                new_weighted_edges.append(current_edge)
+        new_weighted_edges = list(zip(sources.tolist(), targets.tolist(), weights.tolist()))
 
         return new_weighted_edges
 
@@ -89,20 +154,482 @@ class Tonnetz():
         """
         Generate a directed graph where all vertices from 0 to sample_count - 1 are included,
         even if they are not connected by any edges.
+
+        The edges are produced by `generate_edge_arrays` in vectorized form, but NetworkX
+        still inserts them one at a time in Python, which dominates for large moduli
+        (tens of seconds for ~10^7 edges). The sub-second construction of large Tonnetze
+        only holds with `backend="csr"`, which never builds the graph unless asked.
+        """
+        sources, targets, weights = self.generate_edge_arrays(new_integer_list)
+
+        return self._network_from_edge_arrays(sources, targets, weights)
+
+    def generate_adjacency(self, new_integer_list: list[int]) -> sparse.csr_array:
+        """
+        Generate the weighted adjacency matrix of the Tonnetz in CSR form.
+
+        Entry (source, target) holds the weight of the edge source → target. When
+        several multipliers send a vertex to the same target, the one appearing last
+        in `new_integer_list` is kept, exactly as repeated `DiGraph.add_edge` calls
+        would do. Weights may be 0 (multiplier 0); such entries are stored explicitly.
+
+        Args:
+            new_integer_list (list[int]): A list of integer multipliers used to compute edges.
+
+        Returns:
+            sparse.csr_array: A sample_count × sample_count int64 matrix of edge weights.
         """
+        return self._adjacency_from_edge_arrays(*self.generate_edge_arrays(new_integer_list))
+
+    def _adjacency_from_edge_arrays(
+        self,
+        sources : np.ndarray,
+        targets : np.ndarray,
+        weights : np.ndarray,
+    ) -> sparse.csr_array:
+        """Compress COO edge arrays into a CSR adjacency matrix; later duplicates win."""
+        modulus = self.sample_count
+
+        # sort edges into CSR (row-major) order; the stable sort keeps coinciding
+        # edges in multiplier order, so the last one of each run is the one to keep
+        edge_keys = sources * modulus + targets
+        edge_order = np.argsort(edge_keys, kind="stable")
+        sorted_keys = edge_keys[edge_order]
+        is_last = np.append(sorted_keys[1:] != sorted_keys[:-1], True)
+        kept_positions = edge_order[is_last[:len(edge_order)]]
+
+        index_dtype = np.int32 if max(modulus, len(kept_positions)) < 2**31 else np.int64
+
+        row_pointers = np.zeros(modulus + 1, dtype=index_dtype)
+        np.cumsum(np.bincount(sources[kept_positions], minlength=modulus), out=row_pointers[1:])
+
+        new_adjacency = sparse.csr_array(
+            (
+                weights[kept_positions],
+                targets[kept_positions].astype(index_dtype),
+                row_pointers,
+            ),
+            shape=(modulus, modulus),
+        )
+
+        return new_adjacency
+
+    def generate_network_from_adjacency(self) -> nx.DiGraph:
+        """
+        Build the NetworkX graph of a "csr" Tonnetz from its adjacency matrix.
+
+        Returns:
+            nx.DiGraph: The same graph `generate_network` would produce.
+        """
+        assert self.adjacency is not None
+
+        return self._network_from_edge_arrays(*self.edge_arrays())
+
+    def _network_from_edge_arrays(
+        self,
+        sources : np.ndarray,
+        targets : np.ndarray,
+        weights : np.ndarray,
+    ) -> nx.DiGraph:
+        """Insert COO edge arrays into a DiGraph holding every vertex of the Tonnetz (one Python insert per edge)."""
         if self.include_zero:
             vertices = range(self.sample_count)
         else:
             vertices = range(1, self.sample_count)
 
-        weighted_edges = self.generate_weighted_edges(new_integer_list)
-
         new_network = nx.DiGraph()
         new_network.add_nodes_from(vertices)
-        new_network.add_weighted_edges_from(weighted_edges)
+        new_network.add_weighted_edges_from(
+            zip(sources.tolist(), targets.tolist(), weights.tolist())
+        )
 
         return new_network
 
+    def edge_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the edges currently in the Tonnetz as (sources, targets, weights) arrays.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: int64 arrays of equal length,
+            sorted by (source, target).
+        """
+        if self.backend == "csr":
+            row_lengths = np.diff(self.adjacency.indptr)
+            sources = np.repeat(np.arange(self.sample_count, dtype=np.int64), row_lengths)
+            targets = self.adjacency.indices.astype(np.int64)
+            weights = self.adjacency.data.astype(np.int64)
+            return sources, targets, weights
+
+        edge_count = self.network.number_of_edges()
+        edges = sorted(self.network.edges(data="weight"))
+        edge_table = np.array(edges, dtype=np.int64).reshape(edge_count, 3)
+
+        return edge_table[:, 0].copy(), edge_table[:, 1].copy(), edge_table[:, 2].copy()
+
+    def _adjacency_keys(self) -> np.ndarray:
+        """Sorted int64 keys source · sample_count + target of the stored adjacency entries."""
+        row_lengths = np.diff(self.adjacency.indptr)
+        sources = np.repeat(np.arange(self.sample_count, dtype=np.int64), row_lengths)
+
+        return sources * self.sample_count + self.adjacency.indices
+
+    def _splice_adjacency(self, sources : np.ndarray, targets : np.ndarray, weights : np.ndarray) -> None:
+        """
+        Write edges with distinct (source, target) pairs into the adjacency matrix,
+        overwriting the weight of stored entries and inserting the others at their
+        sorted position in each row; `indptr` is shifted by a cumulative count.
+        """
+        modulus = self.sample_count
+        adjacency = self.adjacency
+
+        new_keys = sources * modulus + targets
+        key_order = np.argsort(new_keys)
+        sources, targets, weights, new_keys = (
+            sources[key_order], targets[key_order], weights[key_order], new_keys[key_order],
+        )
+
+        current_keys = self._adjacency_keys()
+        positions = np.searchsorted(current_keys, new_keys)
+        is_stored = positions < len(current_keys)
+        is_stored[is_stored] = current_keys[positions[is_stored]] == new_keys[is_stored]
+
+        data = adjacency.data.copy()
+        data[positions[is_stored]] = weights[is_stored]
+
+        is_new = ~is_stored
+        entry_count = len(data) + int(is_new.sum())
+        index_dtype = np.int32 if max(modulus, entry_count) < 2**31 else np.int64
+
+        indices = np.insert(adjacency.indices.astype(index_dtype), positions[is_new], targets[is_new])
+        data = np.insert(data, positions[is_new], weights[is_new])
+
+        row_pointers = adjacency.indptr.astype(index_dtype)
+        inserted_counts = np.bincount(sources[is_new], minlength=modulus)
+        row_pointers[1:] += np.cumsum(inserted_counts).astype(index_dtype)
+
+        self.adjacency = sparse.csr_array((data, indices, row_pointers), shape=(modulus, modulus))
+
+    def add_multipliers(self, new_multipliers : list[int]) -> None:
+        """
+        Add multipliers to the Tonnetz in place, without rebuilding it.
+
+        Only the edges of the new multipliers are generated and patched into the
+        graph, which costs O(sample_count) per multiplier. With the "csr" backend the
+        new entries are spliced into the sorted rows of the adjacency matrix, one
+        multiplier at a time, without re-sorting the existing edges (each splice also
+        copies the O(edge count) CSR arrays once). The result is the Tonnetz that
+        `integer_list + new_multipliers` would build.
+
+        Args:
+            new_multipliers (list[int]): Multipliers to append to `integer_list`.
+        """
+        assert isinstance(new_multipliers, list)
+        assert all(isinstance(entry, int) for entry in new_multipliers)
+
+        self.integer_list = self.integer_list + new_multipliers
+
+        if self.adjacency is not None:
+            # one multiplier sends each source to a single target, so splicing the edges
+            # of each distinct multiplier once never inserts two entries for the same
+            # (source, target); they go in order of last occurrence, so later ones win
+            last_occurrences = list(dict.fromkeys(reversed(new_multipliers)))[::-1]
+            for multiplier in last_occurrences:
+                self._splice_adjacency(*self.generate_edge_arrays([multiplier]))
+
+        if self._network is not None:
+            sources, targets, weights = self.generate_edge_arrays(new_multipliers)
+            self._network.add_weighted_edges_from(
+                zip(sources.tolist(), targets.tolist(), weights.tolist())
+            )
+
+    def remove_multipliers(self, old_multipliers : list[int]) -> None:
+        """
+        Remove every occurrence of the given multipliers from the Tonnetz in place.
+
+        Only edges produced by the removed multipliers are revisited. Such an edge
+        is kept, re-weighted, when a remaining multiplier also realizes it, and
+        deleted otherwise. The result is the Tonnetz that the remaining
+        `integer_list` would build.
+
+        Args:
+            old_multipliers (list[int]): Multipliers to remove; each must be in `integer_list`.
+        """
+        assert isinstance(old_multipliers, list)
+        assert all(entry in self.integer_list for entry in old_multipliers)
+
+        modulus = self.sample_count
+        remaining_multipliers = [
+            entry for entry in self.integer_list if entry not in old_multipliers
+        ]
+        self.integer_list = remaining_multipliers
+
+        sources, targets, _ = self.generate_edge_arrays(list(set(old_multipliers)))
+        affected_keys = np.sort(sources * modulus + targets)
+        is_first = np.ones(len(affected_keys), dtype=bool)
+        is_first[1:] = affected_keys[1:] != affected_keys[:-1]
+        affected_keys = affected_keys[is_first]
+        sources, targets = affected_keys // modulus, affected_keys % modulus
+
+        # the last remaining multiplier sending source to target, if any, owns the edge
+        new_weights = np.zeros(len(affected_keys), dtype=np.int64)
+        is_kept = np.zeros(len(affected_keys), dtype=bool)
+        for multiplier in remaining_multipliers:
+            realizes_edge = (sources * (multiplier % modulus)) % modulus == targets
+            new_weights[realizes_edge] = multiplier
+            is_kept |= realizes_edge
+
+        if self.adjacency is not None:
+            # every affected edge is stored; re-weight the kept ones in place and
+            # drop the others with a mask and a per-row decrement of the row pointers
+            positions = np.searchsorted(self._adjacency_keys(), affected_keys)
+            data = self.adjacency.data.copy()
+            data[positions[is_kept]] = new_weights[is_kept]
+
+            keep_mask = np.ones(len(data), dtype=bool)
+            keep_mask[positions[~is_kept]] = False
+
+            row_pointers = self.adjacency.indptr.copy()
+            removed_counts = np.bincount(sources[~is_kept], minlength=modulus)
+            row_pointers[1:] -= np.cumsum(removed_counts).astype(row_pointers.dtype)
+
+            self.adjacency = sparse.csr_array(
+                (data[keep_mask], self.adjacency.indices[keep_mask], row_pointers),
+                shape=(modulus, modulus),
+            )
+
+        if self._network is not None:
+            self._network.add_weighted_edges_from(
+                zip(sources[is_kept].tolist(), targets[is_kept].tolist(), new_weights[is_kept].tolist())
+            )
+            self._network.remove_edges_from(
+                zip(sources[~is_kept].tolist(), targets[~is_kept].tolist())
+            )
+
+            zero_is_orphaned = (
+                not self.include_zero
+                and 0 in self._network
+                and self._network.degree(0) == 0
+            )
+            if zero_is_orphaned:
+                self._network.remove_node(0)
+
+    def transition_table(self) -> np.ndarray:
+        """
+        Tabulate the multiplier action on ℤ/sample_countℤ.
+
+        Entry (v, j) is v · integer_list[j] mod sample_count, the vertex reached from
+        v along multiplier j. Rows cover every residue, including 0, and entries that
+        would be self-loops are kept (the walker simply stays put).
+
+        Returns:
+            np.ndarray: int64 array of shape (sample_count, len(integer_list)).
+        """
+        modulus = self.sample_count
+        multipliers = np.asarray(self.integer_list, dtype=np.int64) % modulus
+
+        return (np.arange(modulus, dtype=np.int64)[:, None] * multipliers[None, :]) % modulus
+
+    def vertices(self) -> np.ndarray:
+        """
+        Return the vertices of the Tonnetz.
+
+        These are 0, ..., sample_count - 1, without 0 unless `include_zero` is set
+        or some edge points at 0.
+
+        Returns:
+            np.ndarray: Sorted int64 array of vertices.
+        """
+        if self.backend == "csr":
+            zero_reached = bool(np.any(self.adjacency.indices == 0))
+        else:
+            zero_reached = 0 in self.network
+
+        start = 0 if (self.include_zero or zero_reached) else 1
+
+        return np.arange(start, self.sample_count, dtype=np.int64)
+
+    def successors(self, vertex : int) -> np.ndarray:
+        """
+        Return the sorted targets of the edges leaving `vertex`.
+
+        Args:
+            vertex (int): A vertex in ℤ/sample_countℤ.
+
+        Returns:
+            np.ndarray: int64 array of successor vertices.
+        """
+        assert isinstance(vertex, (int, np.integer))
+        assert 0 <= vertex < self.sample_count
+
+        if self.backend == "csr":
+            start, stop = self.adjacency.indptr[vertex], self.adjacency.indptr[vertex + 1]
+            return self.adjacency.indices[start:stop].astype(np.int64)
+
+        if vertex not in self.network:
+            return np.zeros(0, dtype=np.int64)
+
+        return np.array(sorted(self.network.successors(vertex)), dtype=np.int64)
+
+    def out_degrees(self) -> np.ndarray:
+        """
+        Return the out-degree of every residue in ℤ/sample_countℤ.
+
+        Returns:
+            np.ndarray: int64 array of length sample_count (0 for absent vertices).
+        """
+        if self.backend == "csr":
+            return np.diff(self.adjacency.indptr).astype(np.int64)
+
+        degrees = np.zeros(self.sample_count, dtype=np.int64)
+        for vertex, degree in self.network.out_degree():
+            degrees[vertex] = degree
+
+        return degrees
+
+    def in_degrees(self) -> np.ndarray:
+        """
+        Return the in-degree of every residue in ℤ/sample_countℤ.
+
+        Returns:
+            np.ndarray: int64 array of length sample_count (0 for absent vertices).
+        """
+        if self.backend == "csr":
+            return np.bincount(self.adjacency.indices, minlength=self.sample_count).astype(np.int64)
+
+        degrees = np.zeros(self.sample_count, dtype=np.int64)
+        for vertex, degree in self.network.in_degree():
+            degrees[vertex] = degree
+
+        return degrees
+
+    def reachable_from(self, vertex : int) -> np.ndarray:
+        """
+        Return every vertex reachable from `vertex` along directed edges, including itself.
+
+        Args:
+            vertex (int): A vertex in ℤ/sample_countℤ.
+
+        Returns:
+            np.ndarray: Sorted int64 array of reachable vertices.
+        """
+        assert isinstance(vertex, (int, np.integer))
+        assert 0 <= vertex < self.sample_count
+
+        if self.backend == "csr":
+            # explicit weight-0 entries are edges too, so search on the sparsity pattern
+            structure = sparse.csr_array(
+                (
+                    np.ones(self.adjacency.nnz, dtype=np.int8),
+                    self.adjacency.indices,
+                    self.adjacency.indptr,
+                ),
+                shape=self.adjacency.shape,
+            )
+            reached = csgraph.breadth_first_order(
+                structure, int(vertex), directed=True, return_predecessors=False
+            )
+            return np.sort(reached).astype(np.int64)
+
+        if vertex not in self.network:
+            return np.array([vertex], dtype=np.int64)
+
+        reached = nx.descendants(self.network, vertex) | {vertex}
+
+        return np.array(sorted(reached), dtype=np.int64)
+
+    def save(self, path : str | Path) -> None:
+        """
+        Save the Tonnetz to a directory of raw arrays.
+
+        The directory holds `metadata.json` (sample count, flags, backend and class)
+        and one `.npy` file per array: `multipliers`, and the edge arrays `sources`,
+        `targets` and `weights`. Subclasses add their node data.
+
+        Args:
+            path (str | Path): Directory to write; created if missing.
+        """
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        sources, targets, weights = self.edge_arrays()
+        np.save(directory / "multipliers.npy", np.asarray(self.integer_list, dtype=np.int64))
+        np.save(directory / "sources.npy", sources)
+        np.save(directory / "targets.npy", targets)
+        np.save(directory / "weights.npy", weights)
+
+        metadata = self._save_metadata()
+        (directory / "metadata.json").write_text(json.dumps(metadata, indent=2))
+
+    def _save_metadata(self) -> dict:
+        """Metadata describing the saved Tonnetz."""
+        return {
+            "format": SAVE_FORMAT,
+            "version": SAVE_VERSION,
+            "kind": "Tonnetz",
+            "sample_count": self.sample_count,
+            "include_loops": self.include_loops,
+            "include_zero": self.include_zero,
+            "backend": self.backend,
+        }
+
+    @classmethod
+    def load(cls, path : str | Path, mmap : bool = False) -> Tonnetz:
+        """
+        Load a Tonnetz written by `save`, without regenerating its edges.
+
+        The saved class is restored, so loading a saved SignalTonnetz through
+        `Tonnetz.load` also returns a SignalTonnetz.
+
+        Args:
+            path (str | Path): Directory written by `save`.
+            mmap (bool): Memory-map large arrays (node signals) read-only instead of
+                reading them into memory; pages are then loaded on first access.
+
+        Returns:
+            Tonnetz: The loaded Tonnetz, an instance of `cls`.
+        """
+        directory = Path(path)
+        metadata = json.loads((directory / "metadata.json").read_text())
+        assert metadata["format"] == SAVE_FORMAT
+        assert metadata["version"] == SAVE_VERSION
+
+        tonnetz_classes = {
+            "Tonnetz": Tonnetz,
+            "SignalTonnetz": SignalTonnetz,
+            "LazySignalTonnetz": LazySignalTonnetz,
+        }
+        tonnetz_class = tonnetz_classes[metadata["kind"]]
+        assert issubclass(tonnetz_class, cls)
+
+        loaded_tonnetz = tonnetz_class.__new__(tonnetz_class)
+        loaded_tonnetz._restore(directory, metadata, mmap)
+
+        return loaded_tonnetz
+
+    def _restore(self, directory : Path, metadata : dict, mmap : bool) -> None:
+        """Set up a bare instance from a saved directory."""
+        self.sample_count = metadata["sample_count"]
+        self.integer_list = np.load(directory / "multipliers.npy").tolist()
+
+        self.include_loops = metadata["include_loops"]
+        self.include_zero = metadata["include_zero"]
+
+        self.context = modulus_context(self.sample_count)
+
+        self.backend = metadata["backend"]
+        self.adjacency = None
+        self._network = None
+
+        edge_arrays = [
+            np.load(directory / f"{name}.npy")
+            for name in ["sources", "targets", "weights"]
+        ]
+
+        if self.backend == "csr":
+            self.adjacency = self._adjacency_from_edge_arrays(*edge_arrays)
+        else:
+            self.network = self._network_from_edge_arrays(*edge_arrays)
+
 
 class SignalTonnetz(Tonnetz):
     """
@@ -112,8 +639,24 @@ class SignalTonnetz(Tonnetz):
     time-scaled by a factor corresponding to the node index. This allows each
     vertex to encode a transformed version of the tonic signal.
 
+    With `storage="graph"` every node holds its own Signal in the graph. With
+    `storage="matrix"` all node signals live in one (sample_count, sample_count)
+    array built with a single gather, and the graph nodes hold Signal views onto
+    its rows.
+
     Attributes:
         tonic_signal (Signal): The base signal to be transformed and propagated.
+        storage (str): Where node signals are kept, "graph" or "matrix"
+            ("lazy" for `LazySignalTonnetz`).
+        node_signals (np.ndarray | None): With "matrix" storage, a read-only array
+            whose row v is the tonic rescaled by v; None with "graph" storage.
+        tonic_propagated (bool): True while every node signal is the tonic rescaled
+            by its vertex; code replacing node signals must set it to False. Replaced
+            "signal" attributes in "graph" storage are also detected, see
+            `has_propagated_signals`.
+        fourier_coefficients (np.ndarray | None): For a tonnetz built by `fft_tonnetz`,
+            the Fourier coefficients its node signals were computed from, indexed by
+            multiplier; None otherwise. Saved and restored with the tonnetz.
         network (nx.DiGraph): A directed graph where each node includes a
             time-scaled version of the tonic signal as an attribute.
     """
@@ -122,7 +665,9 @@ class SignalTonnetz(Tonnetz):
                  tonic_signal: Signal,
                  integer_list: list[int],
                  include_loops: bool = False,
-                 include_zero: bool = False):
+                 include_zero: bool = False,
+                 backend: str = "networkx",
+                 storage: str = "graph"):
         """
         Initialize the SignalTonnetz.
 
@@ -131,17 +676,88 @@ class SignalTonnetz(Tonnetz):
             integer_list (list[int]): A list of multipliers defining edge directions and weights.
             include_loops (bool): Whether to include self-loops in the network.
             include_zero (bool): Whether to include the zero node in the graph.
+            backend (str): Graph storage, "networkx" or "csr"; see `Tonnetz`.
+            storage (str): Node signal storage, "graph" or "matrix".
         """
+        assert storage in ["graph", "matrix"]
+
         sample_count = len(tonic_signal)
         super().__init__(
             sample_count,
             integer_list,
             include_loops,
             include_zero,
+            backend,
         )
 
         self.tonic_signal = tonic_signal
-        self.network = self.propogate_signal()
+        self.storage = storage
+        self.node_signals = None
+        self.tonic_propagated = True
+        self.fourier_coefficients = None
+
+        if self.storage == "matrix":
+            self.node_signals = self.propogate_signal_matrix()
+            if self._network is not None:
+                self.attach_signal_views(self._network)
+        else:
+            self.network = self.propogate_signal()
+            self._propagated_signals = {
+                vertex : self._network.nodes[vertex]["signal"] for vertex in self._network.nodes
+            }
+
+    @classmethod
+    def from_node_matrix(cls,
+                         tonic_signal: Signal,
+                         integer_list: list[int],
+                         node_signals: np.ndarray,
+                         include_loops: bool = False,
+                         include_zero: bool = False,
+                         backend: str = "networkx",
+                         tonic_propagated: bool = False) -> SignalTonnetz:
+        """
+        Build a "matrix" storage SignalTonnetz around a precomputed node signal matrix,
+        without propagating the tonic.
+
+        Args:
+            tonic_signal (Signal): The base signal of the tonnetz.
+            integer_list (list[int]): A list of multipliers defining edge directions and weights.
+            node_signals (np.ndarray): Complex array of shape (sample_count, sample_count)
+                whose row v is the signal at vertex v. It is stored without copying
+                when already complex128, and marked read-only.
+            include_loops (bool): Whether to include self-loops in the network.
+            include_zero (bool): Whether to include the zero node in the graph.
+            backend (str): Graph storage, "networkx" or "csr"; see `Tonnetz`.
+            tonic_propagated (bool): Whether every row is the tonic rescaled by its vertex.
+
+        Returns:
+            SignalTonnetz: The tonnetz, with graph nodes holding views onto the matrix rows.
+        """
+        sample_count = len(tonic_signal)
+        assert isinstance(node_signals, np.ndarray)
+        assert node_signals.shape == (sample_count, sample_count)
+
+        signal_tonnetz = cls.__new__(cls)
+        Tonnetz.__init__(
+            signal_tonnetz,
+            sample_count,
+            integer_list,
+            include_loops,
+            include_zero,
+            backend,
+        )
+
+        signal_tonnetz.tonic_signal = tonic_signal
+        signal_tonnetz.storage = "matrix"
+        signal_tonnetz.node_signals = np.asarray(node_signals, dtype=np.complex128)
+        signal_tonnetz.node_signals.flags.writeable = False
+        signal_tonnetz.tonic_propagated = tonic_propagated
+        signal_tonnetz.fourier_coefficients = None
+
+        if signal_tonnetz._network is not None:
+            signal_tonnetz.attach_signal_views(signal_tonnetz._network)
+
+        return signal_tonnetz
 
     def propogate_signal(self) -> nx.DiGraph:
         """
@@ -158,18 +774,367 @@ class SignalTonnetz(Tonnetz):
             new_graph.nodes[vertex]["signal"] = rescaled_signal
 
         return new_graph
-    
+
+    def propogate_signal_matrix(self) -> np.ndarray:
+        """
+        Gather every rescaling of the tonic signal into one matrix,
+        node_signals[v, t] = tonic[v · t mod sample_count].
+
+        Rows are gathered in blocks so the temporary index table stays bounded.
+
+        Returns:
+            np.ndarray: Read-only complex array of shape (sample_count, sample_count).
+        """
+        modulus = self.sample_count
+        node_signals = np.empty((modulus, modulus), dtype=np.complex128)
+
+        block_size = block_rows(modulus)
+        for start in range(0, modulus, block_size):
+            stop = min(modulus, start + block_size)
+            node_signals[start:stop] = self.tonic_signal.scale_time_by_many(np.arange(start, stop))
+
+        node_signals.flags.writeable = False
+
+        return node_signals
+
+    def attach_signal_views(self, graph : nx.DiGraph) -> None:
+        """
+        Set the "signal" attribute of every node in `graph` to a Signal viewing
+        its row of `node_signals`.
+
+        Args:
+            graph (nx.DiGraph): The graph whose nodes are annotated in place.
+        """
+        for vertex in graph.nodes:
+            graph.nodes[vertex]["signal"] = Signal(self.node_signals[vertex])
+
+    def generate_network_from_adjacency(self) -> nx.DiGraph:
+        """Build the NetworkX graph from `adjacency`, with node signal views in "matrix" storage."""
+        new_network = super().generate_network_from_adjacency()
+
+        if self.storage == "matrix":
+            self.attach_signal_views(new_network)
+
+        return new_network
+
+    def add_multipliers(self, new_multipliers : list[int]) -> None:
+        """
+        Add multipliers in place, as `Tonnetz.add_multipliers`; existing node signals
+        are kept, and a vertex 0 newly reached by an edge gets its signal.
+
+        Args:
+            new_multipliers (list[int]): Multipliers to append to `integer_list`.
+        """
+        super().add_multipliers(new_multipliers)
+
+        zero_needs_signal = (
+            self.storage != "lazy"
+            and self._network is not None
+            and 0 in self._network
+            and "signal" not in self._network.nodes[0]
+        )
+        if zero_needs_signal:
+            if self.storage == "matrix":
+                self._network.nodes[0]["signal"] = Signal(self.node_signals[0])
+            else:
+                self._network.nodes[0]["signal"] = self.tonic_signal.scale_time_by(0)
+                self._propagated_signals[0] = self._network.nodes[0]["signal"]
+
+    def has_propagated_signals(self) -> bool:
+        """
+        Whether every node signal is still the tonic rescaled by its vertex, so that
+        closed forms computed from the tonic apply.
+
+        In "graph" storage the "signal" node attributes are public and may be replaced
+        without clearing `tonic_propagated`, so each one is compared, in O(n), with
+        the Signal object set when the tonic was propagated. Samples mutated in place
+        are not detected; such code must set `tonic_propagated` to False itself.
+
+        Returns:
+            bool: True if the node signals are the propagated rescalings of the tonic.
+        """
+        if not self.tonic_propagated:
+            return False
+        if self.storage != "graph":
+            return True
+
+        node_data = self.network.nodes
+        return all(
+            vertex in self._propagated_signals
+            and node_data[vertex].get("signal") is self._propagated_signals[vertex]
+            for vertex in node_data
+        )
+
+    def node_signal(self, vertex : int) -> Signal:
+        """
+        Return the signal at a vertex.
+
+        Args:
+            vertex (int): A vertex of the Tonnetz.
+
+        Returns:
+            Signal: The node signal; a view onto `node_signals` in "matrix" storage.
+        """
+        if self.storage == "matrix":
+            return Signal(self.node_signals[vertex])
+
+        return self.network.nodes[vertex]["signal"]
+
+    def iter_node_signals(self) -> Iterator[tuple[int, Signal]]:
+        """
+        Iterate over the vertices and their signals, in increasing vertex order.
+
+        Yields:
+            tuple[int, Signal]: A vertex and its node signal.
+        """
+        for vertex in self.vertices().tolist():
+            yield vertex, self.node_signal(vertex)
+
     def total_signal(self) -> Signal:
-        total_signal = np.zeros((self.sample_count), dtype=complex)
+        """
+        Sum the signals over all nodes of the Tonnetz.
+
+        While `has_propagated_signals` holds, the sum is computed in closed form from
+        the tonic by `Signal.rescaling_sum`, one value per divisor of the modulus.
+        Otherwise node signals are streamed one at a time, so only a single extra
+        signal is held in memory besides the running sum.
 
-        for node in self.network.nodes:
-            current_signal = self.network.nodes[node]['signal']
-            current_signal = current_signal.underlying_signal
-            current_signal =  np.array(current_signal, dtype=complex)
+        Returns:
+            Signal: The sum of all node signals.
+        """
+        if self.has_propagated_signals():
+            vertices = self.vertices()
+            if len(vertices) == 0:
+                return Signal(np.zeros(self.sample_count, dtype=np.complex128))
+            return self.tonic_signal.rescaling_sum(include_zero=bool(vertices[0] == 0))
 
-            total_signal = total_signal + current_signal
+        if self.storage == "matrix":
+            # vertices are always a tail 0.. or 1.. of the rows, so sum a slice (no copy)
+            vertices = self.vertices()
+            first_vertex = vertices[0] if len(vertices) else self.sample_count
+            total_signal = self.node_signals[first_vertex:].sum(axis=0)
+            return Signal(np.ascontiguousarray(total_signal, dtype=np.complex128))
 
-        total_signal = total_signal.tolist()
-        total_signal = Signal(total_signal)
+        total_signal = Signal(np.zeros((self.sample_count), dtype=complex))
+
+        for _, current_signal in self.iter_node_signals():
+            total_signal += current_signal
 
         return total_signal
+
+    def save(self, path : str | Path) -> None:
+        """
+        Save the SignalTonnetz to a directory of raw arrays.
+
+        Besides the files written by `Tonnetz.save`, this writes the tonic to
+        `tonic.npy` and the (sample_count, sample_count) node signal matrix to
+        `node_signals.npy`, row v holding the signal at vertex v. Graph-stored signals
+        are written into a memory-mapped file in blocks, never stacked in memory.
+        A lazy tonnetz whose nodes are plain rescalings of the tonic only saves the tonic.
+        `fourier_coefficients`, when set, goes to `fourier_coefficients.npy`.
+
+        Args:
+            path (str | Path): Directory to write; created if missing.
+        """
+        super().save(path)
+
+        directory = Path(path)
+        np.save(directory / "tonic.npy", np.asarray(self.tonic_signal.underlying_signal))
+        if self.fourier_coefficients is not None:
+            np.save(directory / "fourier_coefficients.npy", self.fourier_coefficients)
+
+        if self._saved_kind() == "LazySignalTonnetz":
+            return
+
+        if self.storage == "matrix":
+            np.save(directory / "node_signals.npy", self.node_signals)
+            return
+
+        modulus = self.sample_count
+        node_signals = np.lib.format.open_memmap(
+            directory / "node_signals.npy",
+            mode="w+",
+            dtype=np.complex128,
+            shape=(modulus, modulus),
+        )
+        if self.has_propagated_signals():
+            block_size = block_rows(modulus)
+            for start in range(0, modulus, block_size):
+                stop = min(modulus, start + block_size)
+                node_signals[start:stop] = self.tonic_signal.scale_time_by_many(np.arange(start, stop))
+        else:
+            node_signals[:] = 0
+            for vertex, current_signal in self.iter_node_signals():
+                node_signals[vertex] = current_signal.underlying_signal
+        node_signals.flush()
+        del node_signals
+
+    def _saved_kind(self) -> str:
+        """Class name recorded in the metadata; lazy tonnetze with custom nodes load as matrices."""
+        if self.storage == "lazy" and self.tonic_propagated:
+            return "LazySignalTonnetz"
+        return "SignalTonnetz"
+
+    def _save_metadata(self) -> dict:
+        """Metadata describing the saved SignalTonnetz."""
+        metadata = super()._save_metadata()
+        metadata["kind"] = self._saved_kind()
+        metadata["tonic_propagated"] = self.has_propagated_signals()
+        metadata["fourier_coefficients"] = self.fourier_coefficients is not None
+
+        return metadata
+
+    def _restore(self, directory : Path, metadata : dict, mmap : bool) -> None:
+        """Set up a bare instance from a saved directory, with "matrix" storage."""
+        super()._restore(directory, metadata, mmap)
+
+        self.tonic_signal = Signal(np.load(directory / "tonic.npy"))
+        self.tonic_propagated = metadata["tonic_propagated"]
+        self.storage = "matrix"
+        self.fourier_coefficients = self._load_fourier_coefficients(directory, metadata)
+
+        self.node_signals = np.load(directory / "node_signals.npy", mmap_mode="r" if mmap else None)
+        self.node_signals.flags.writeable = False
+
+        if self._network is not None:
+            self.attach_signal_views(self._network)
+
+    @staticmethod
+    def _load_fourier_coefficients(directory : Path, metadata : dict) -> np.ndarray | None:
+        """The saved `fourier_coefficients`, or None if none were saved (or by older versions)."""
+        if not metadata.get("fourier_coefficients", False):
+            return None
+        return np.load(directory / "fourier_coefficients.npy")
+
+
+class LazySignalTonnetz(SignalTonnetz):
+    """
+    A SignalTonnetz that stores only its tonic signal and computes node signals on access.
+
+    Fully materializing the node signals of a Tonnetz on modulus n takes O(n^2) memory.
+    This variant instead rescales the tonic when a node signal is requested, keeping
+    the most recently used node signals in an LRU cache of at most `cache_size` entries.
+    Graph nodes carry no "signal" attribute; use `node_signal` or `iter_node_signals`.
+
+    A `node_factory` may replace the rescaling of the tonic, for node signals that
+    are cheap to compute per vertex but are not rescalings of the tonic.
+
+    Attributes:
+        cache_size (int): Maximum number of node signals kept in the LRU cache.
+        node_factory (Callable[[int], Signal] | None): Computes the signal at a vertex;
+            None to rescale the tonic.
+    """
+
+    def __init__(self,
+                 tonic_signal: Signal,
+                 integer_list: list[int],
+                 include_loops: bool = False,
+                 include_zero: bool = False,
+                 backend: str = "networkx",
+                 cache_size: int = 128,
+                 node_factory: Callable[[int], Signal] | None = None):
+        """
+        Initialize the LazySignalTonnetz.
+
+        Args:
+            tonic_signal (Signal): The base signal rescaled at each vertex.
+            integer_list (list[int]): A list of multipliers defining edge directions and weights.
+            include_loops (bool): Whether to include self-loops in the network.
+            include_zero (bool): Whether to include the zero node in the graph.
+            backend (str): Graph storage, "networkx" or "csr"; see `Tonnetz`.
+            cache_size (int): Maximum number of node signals to keep cached; 0 disables caching.
+            node_factory (Callable[[int], Signal] | None): Computes the signal at a vertex
+                instead of rescaling the tonic; `tonic_propagated` is then False.
+        """
+        assert isinstance(cache_size, int)
+        assert cache_size >= 0
+        assert node_factory is None or callable(node_factory)
+
+        Tonnetz.__init__(
+            self,
+            len(tonic_signal),
+            integer_list,
+            include_loops,
+            include_zero,
+            backend,
+        )
+
+        self.tonic_signal = tonic_signal
+        self.storage = "lazy"
+        self.node_signals = None
+        self.node_factory = node_factory
+        self.tonic_propagated = node_factory is None
+        self.fourier_coefficients = None
+
+        self.cache_size = cache_size
+        self._signal_cache = OrderedDict()
+
+    def compute_node_signal(self, vertex : int) -> Signal:
+        """Compute the signal at a vertex, bypassing the cache."""
+        if self.node_factory is not None:
+            return self.node_factory(vertex)
+        return self.tonic_signal.scale_time_by(vertex)
+
+    def node_signal(self, vertex : int) -> Signal:
+        """
+        Return the signal at a vertex, computing it if it is not cached.
+
+        Args:
+            vertex (int): A vertex of the Tonnetz.
+
+        Returns:
+            Signal: The tonic signal rescaled by `vertex`, or the output of `node_factory`.
+        """
+        assert isinstance(vertex, (int, np.integer))
+        assert 0 <= vertex < self.sample_count
+        vertex = int(vertex)
+
+        if vertex in self._signal_cache:
+            self._signal_cache.move_to_end(vertex)
+            return self._signal_cache[vertex]
+
+        new_signal = self.compute_node_signal(vertex)
+
+        if self.cache_size > 0:
+            self._signal_cache[vertex] = new_signal
+            if len(self._signal_cache) > self.cache_size:
+                self._signal_cache.popitem(last=False)
+
+        return new_signal
+
+    def iter_node_signals(self) -> Iterator[tuple[int, Signal]]:
+        """
+        Stream the vertices and their signals, in increasing vertex order.
+
+        Signals already in the cache are reused; the others are computed one at a
+        time and not cached, so a full pass does not evict recently used nodes.
+
+        Yields:
+            tuple[int, Signal]: A vertex and its node signal.
+        """
+        for vertex in self.vertices().tolist():
+            if vertex in self._signal_cache:
+                yield vertex, self._signal_cache[vertex]
+            else:
+                yield vertex, self.compute_node_signal(vertex)
+
+    def _restore(self, directory : Path, metadata : dict, mmap : bool) -> None:
+        """Set up a bare instance from a saved directory, keeping only the tonic."""
+        Tonnetz._restore(self, directory, metadata, mmap)
+
+        self.tonic_signal = Signal(np.load(directory / "tonic.npy"))
+        self.tonic_propagated = True
+        self.storage = "lazy"
+        self.node_signals = None
+        self.node_factory = None
+        self.fourier_coefficients = self._load_fourier_coefficients(directory, metadata)
+
+        self.cache_size = metadata["cache_size"]
+        self._signal_cache = OrderedDict()
+
+    def _save_metadata(self) -> dict:
+        """Metadata describing the saved LazySignalTonnetz."""
+        metadata = super()._save_metadata()
+        metadata["cache_size"] = self.cache_size
+
+        return metadata
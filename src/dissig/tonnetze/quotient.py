@@ -0,0 +1,183 @@
+"""
+Build the quotient of a tonnetz by the action of the unit group (ℤ/nℤ)^×, with one
+vertex per unit-group orbit, i.e., one vertex per divisor of the modulus.
+"""
+from __future__ import annotations
+
+import math
+
+import networkx as nx
+import numpy as np
+
+from dissig.signals.discrete import Signal
+from dissig.utils.context import modulus_context
+
+
+class QuotientTonnetz():
+    """
+    A tonnetz collapsed along the orbits of ℤ/nℤ under its unit group.
+
+    The orbit of a divisor d of n is {d · u mod n | u unit}, as in `unit_clusters`,
+    and every residue lies in exactly one such orbit. Multiplication by an integer
+    a commutes with the unit group, so it sends the whole orbit of d onto the orbit
+    of gcd(d · a, n). The quotient graph has one vertex per divisor d (the divisor n
+    standing for the orbit {0}) and an edge d → gcd(d · a, n) for every multiplier a.
+    It is built from the divisors alone, without enumerating the n vertices of the
+    underlying Tonnetz.
+
+    Nodes carry the attribute "orbit_size" (φ(n/d)), and, when a tonic signal is
+    given, "signal": the average of the node signals of the underlying SignalTonnetz
+    over the orbit. Edges carry "multipliers" (the multipliers realizing the edge),
+    "multiplicity" (the number of underlying Tonnetz edges it collapses) and
+    "weight" (equal to the multiplicity).
+
+    Attributes:
+        sample_count (int): The modulus n.
+        integer_list (list[int]): List of integer multipliers used to generate edges.
+        context (ModulusContext): Shared arithmetic data for ℤ/sample_countℤ.
+        tonic_signal (Signal | None): Signal whose orbit averages decorate the nodes.
+        network (nx.DiGraph): The quotient graph, with divisors of n as vertices.
+    """
+    def __init__(
+        self,
+        sample_count : int,
+        integer_list : list[int],
+        include_loops : bool=False,
+        include_zero : bool=False,
+        tonic_signal : Signal | None=None,
+    ):
+        assert isinstance(sample_count, int)
+        assert sample_count >= 1
+        assert isinstance(integer_list, list)
+        assert all(isinstance(entry, int) for entry in integer_list)
+        assert isinstance(include_loops, bool)
+        assert isinstance(include_zero, bool)
+        assert tonic_signal is None or len(tonic_signal) == sample_count
+
+        self.sample_count = sample_count
+        self.integer_list = integer_list
+
+        self.include_loops = include_loops
+        self.include_zero = include_zero
+
+        self.context = modulus_context(sample_count)
+        self.tonic_signal = tonic_signal
+
+        self.network = self.generate_network(self.integer_list)
+
+        if self.tonic_signal is not None:
+            orbit_means = self.orbit_means(self.tonic_signal)
+            for divisor in self.network.nodes:
+                self.network.nodes[divisor]["signal"] = self.orbit_average(divisor, orbit_means)
+
+    def orbit_of(self, vertex : int) -> int:
+        """Return the divisor labelling the unit-group orbit of `vertex`, i.e., gcd(vertex, n)."""
+        return math.gcd(vertex, self.sample_count)
+
+    def generate_network(self, new_integer_list : list[int]) -> nx.DiGraph:
+        """
+        Generate the quotient graph for a list of multipliers.
+
+        Two facts keep this independent of n: on the orbit of d, v ↦ v · a is a
+        self-loop for every v or for none (exactly when (n/d) | (a - 1)), and two
+        multipliers a, b give the same edges for every v or for none (exactly when
+        (n/d) | (a - b)). Each distinct residue mod n/d among the multipliers thus
+        contributes φ(n/d) underlying edges out of the orbit of d.
+
+        Args:
+            new_integer_list (list[int]): A list of integer multipliers used to compute edges.
+
+        Returns:
+            nx.DiGraph: The quotient graph.
+        """
+        modulus = self.sample_count
+        orbit_sizes = self.context.orbit_sizes
+
+        source_divisors = [
+            divisor for divisor in self.context.divisors
+            if self.include_zero or divisor != modulus
+        ]
+
+        new_network = nx.DiGraph()
+        for divisor in source_divisors:
+            new_network.add_node(divisor, orbit_size=orbit_sizes[divisor])
+
+        for divisor in source_divisors:
+            cofactor = modulus // divisor
+            seen_residues = set()
+            for multiplier in new_integer_list:
+                target = math.gcd(divisor * multiplier, modulus)
+
+                if not self.include_loops and (multiplier - 1) % cofactor == 0:
+                    continue
+
+                if target not in new_network:
+                    new_network.add_node(target, orbit_size=orbit_sizes[target])
+
+                if not new_network.has_edge(divisor, target):
+                    new_network.add_edge(divisor, target, multipliers=[], multiplicity=0, weight=0)
+
+                edge_data = new_network[divisor][target]
+                edge_data["multipliers"].append(multiplier)
+
+                residue = multiplier % cofactor
+                if residue not in seen_residues:
+                    seen_residues.add(residue)
+                    edge_data["multiplicity"] += orbit_sizes[divisor]
+                    edge_data["weight"] = edge_data["multiplicity"]
+
+        return new_network
+
+    def orbit_means(self, discrete_signal : Signal) -> np.ndarray:
+        """
+        Average a signal over every unit-group orbit.
+
+        Args:
+            discrete_signal (Signal): A signal of length n.
+
+        Returns:
+            np.ndarray: Complex array of length n + 1 whose entry d is the mean of the
+                signal over the orbit of d, for each divisor d (other entries are 0).
+        """
+        assert len(discrete_signal) == self.sample_count
+
+        samples = discrete_signal.underlying_signal
+        gcd_classes = self.context.gcd_classes
+        bin_count = self.sample_count + 1
+
+        orbit_totals = (
+            np.bincount(gcd_classes, weights=samples.real, minlength=bin_count)
+            + 1j * np.bincount(gcd_classes, weights=samples.imag, minlength=bin_count)
+        )
+        orbit_counts = np.bincount(gcd_classes, minlength=bin_count)
+
+        orbit_means = np.zeros(bin_count, dtype=np.complex128)
+        np.divide(orbit_totals, orbit_counts, out=orbit_means, where=orbit_counts > 0)
+
+        return orbit_means
+
+    def orbit_average(self, divisor : int, orbit_means : np.ndarray | None = None) -> Signal:
+        """
+        Average the node signals of the underlying SignalTonnetz over the orbit of `divisor`.
+
+        For v in the orbit of d, the values v · t run uniformly over the orbit of
+        gcd(d · t, n), so the average at time t is the tonic's mean over that orbit.
+
+        Args:
+            divisor (int): A divisor of n labelling an orbit.
+            orbit_means (np.ndarray | None): Precomputed `orbit_means` of the tonic.
+
+        Returns:
+            Signal: The orbit-averaged node signal.
+        """
+        assert self.tonic_signal is not None
+        assert self.sample_count % divisor == 0
+
+        if orbit_means is None:
+            orbit_means = self.orbit_means(self.tonic_signal)
+
+        modulus = self.sample_count
+        image_residues = (divisor * np.arange(modulus, dtype=np.int64)) % modulus
+        image_orbits = self.context.gcd_classes[image_residues]
+
+        return Signal(orbit_means[image_orbits])
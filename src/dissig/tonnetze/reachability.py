@@ -0,0 +1,182 @@
+"""
+Reachability, shortest multiplier words and strongly connected components for a tonnetz,
+computed by breadth-first search over integer arrays.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+
+from dissig.tonnetze.networks import Tonnetz
+
+
+class ReachabilityIndex():
+    """
+    Answers "can u reach v, and by which shortest product of multipliers?" for a Tonnetz.
+
+    The multiplier action is tabulated once, together with the strongly connected
+    components of the graph. A breadth-first search from a source fills predecessor
+    and multiplier arrays of length n, one whole frontier per array operation; these
+    are kept for the most recently searched sources, so path queries afterwards only
+    walk back along the predecessors, in time proportional to the path length.
+
+    Attributes:
+        tonnetz (Tonnetz): The indexed Tonnetz.
+        transition_table (np.ndarray): int64 array of shape (n, len(integer_list)).
+        component_count (int): Number of strongly connected components.
+        component_labels (np.ndarray): Strongly connected component of every residue.
+        cache_size (int): Number of breadth-first searches kept.
+    """
+    def __init__(self, tonnetz : Tonnetz, cache_size : int = 8):
+        assert isinstance(tonnetz, Tonnetz)
+        assert isinstance(cache_size, int)
+        assert cache_size >= 1
+
+        self.tonnetz = tonnetz
+        self.cache_size = cache_size
+        self.transition_table = tonnetz.transition_table()
+
+        self._searches = OrderedDict()
+
+        self.component_count, self.component_labels = csgraph.connected_components(
+            self._structure(), directed=True, connection="strong"
+        )
+
+    def _edge_sources(self) -> np.ndarray:
+        """Vertices with outgoing edges: all residues, without 0 unless `include_zero`."""
+        start = 0 if self.tonnetz.include_zero else 1
+        return np.arange(start, self.tonnetz.sample_count, dtype=np.int64)
+
+    def _structure(self) -> sparse.csr_array:
+        """Unweighted adjacency of the multiplier action (self-loops are harmless here)."""
+        modulus = self.tonnetz.sample_count
+        sources = self._edge_sources()
+        multiplier_count = self.transition_table.shape[1]
+
+        structure = sparse.csr_array(
+            (
+                np.ones(len(sources) * multiplier_count, dtype=np.int8),
+                (
+                    np.repeat(sources, multiplier_count),
+                    self.transition_table[sources].ravel(),
+                ),
+            ),
+            shape=(modulus, modulus),
+        )
+
+        return structure
+
+    def search(self, source : int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Breadth-first search from `source` over the multiplier action.
+
+        Args:
+            source (int): Starting vertex.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: int64 arrays of length n holding,
+                for every vertex, its distance from `source`, its predecessor on a
+                shortest path and the position in `integer_list` of the multiplier
+                leading to it (all -1 where unreachable, and at the source itself
+                apart from its distance 0).
+        """
+        assert isinstance(source, (int, np.integer))
+        assert 0 <= source < self.tonnetz.sample_count
+        source = int(source)
+
+        if source in self._searches:
+            self._searches.move_to_end(source)
+            return self._searches[source]
+
+        modulus = self.tonnetz.sample_count
+        multiplier_count = self.transition_table.shape[1]
+
+        distances = np.full(modulus, -1, dtype=np.int64)
+        predecessors = np.full(modulus, -1, dtype=np.int64)
+        multiplier_positions = np.full(modulus, -1, dtype=np.int64)
+        distances[source] = 0
+
+        frontier = np.array([source], dtype=np.int64)
+        if not self.tonnetz.include_zero:
+            frontier = frontier[frontier != 0]
+
+        distance = 0
+        while len(frontier):
+            distance += 1
+            targets = self.transition_table[frontier].ravel()
+            is_new = distances[targets] == -1
+
+            # keep the first edge found into each newly reached vertex
+            new_targets, first_positions = np.unique(targets[is_new], return_index=True)
+            edge_positions = np.flatnonzero(is_new)[first_positions]
+
+            distances[new_targets] = distance
+            predecessors[new_targets] = frontier[edge_positions // multiplier_count]
+            multiplier_positions[new_targets] = edge_positions % multiplier_count
+
+            frontier = new_targets
+            if not self.tonnetz.include_zero:
+                frontier = frontier[frontier != 0]
+
+        search_result = (distances, predecessors, multiplier_positions)
+
+        self._searches[source] = search_result
+        if len(self._searches) > self.cache_size:
+            self._searches.popitem(last=False)
+
+        return search_result
+
+    def same_component(self, vertex_a : int, vertex_b : int) -> bool:
+        """Return whether two vertices lie in the same strongly connected component."""
+        return bool(self.component_labels[vertex_a] == self.component_labels[vertex_b])
+
+    def can_reach(self, source : int, target : int) -> bool:
+        """Return whether a directed path leads from `source` to `target`."""
+        if self.same_component(source, target):
+            return True
+
+        distances, _, _ = self.search(source)
+
+        return bool(distances[target] >= 0)
+
+    def shortest_path(self, source : int, target : int) -> list[int] | None:
+        """
+        Return the vertices of a shortest path from `source` to `target`.
+
+        Returns:
+            list[int] | None: Vertices from source to target inclusive, or None if
+                `target` cannot be reached.
+        """
+        distances, predecessors, _ = self.search(source)
+        if distances[target] < 0:
+            return None
+
+        path = [int(target)]
+        while path[-1] != source:
+            path.append(int(predecessors[path[-1]]))
+
+        return path[::-1]
+
+    def multiplier_word(self, source : int, target : int) -> list[int] | None:
+        """
+        Return the multipliers along a shortest path from `source` to `target`.
+
+        Their product, times `source`, is `target` mod n.
+
+        Returns:
+            list[int] | None: Multipliers in the order they are applied, or None if
+                `target` cannot be reached.
+        """
+        path = self.shortest_path(source, target)
+        if path is None:
+            return None
+
+        _, _, multiplier_positions = self.search(source)
+
+        return [
+            self.tonnetz.integer_list[multiplier_positions[vertex]]
+            for vertex in path[1:]
+        ]
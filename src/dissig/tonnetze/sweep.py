@@ -0,0 +1,190 @@
+"""
+Parameter sweeps: build tonnetze and their statistics for many (modulus, multipliers)
+jobs across worker processes, streaming the results to a CSV file that can be resumed.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse import csgraph
+
+from dissig.signals.discrete import character_signal
+from dissig.tonnetze.networks import LazySignalTonnetz
+
+
+SWEEP_COLUMNS = [
+    "modulus",
+    "multipliers",
+    "include_loops",
+    "include_zero",
+    "node_count",
+    "edge_count",
+    "strong_components",
+    "weak_components",
+    "total_signal_energy",
+    "total_signal_peak",
+]
+
+
+def multipliers_key(integer_list : list[int]) -> str:
+    """Encode a multiplier list as the string stored in the "multipliers" column."""
+    return " ".join(str(multiplier) for multiplier in integer_list)
+
+
+def tonnetz_statistics(
+    modulus : int,
+    integer_list : list[int],
+    include_loops : bool = False,
+    include_zero : bool = False,
+) -> dict[str, int | float | str]:
+    """
+    Build the tonnetz for one (modulus, multipliers) job and summarize it.
+
+    The graph is built with the "csr" backend. Its signal tonnetz uses the character
+    χ_1 as tonic and is lazy, so the total signal comes from its closed form
+    without materializing node signals.
+
+    Args:
+        modulus (int): Sample count of the tonnetz.
+        integer_list (list[int]): Multipliers of the tonnetz.
+        include_loops (bool): Whether to include self-loops.
+        include_zero (bool): Whether to include the zero node.
+
+    Returns:
+        dict[str, int | float | str]: One row with the keys of `SWEEP_COLUMNS`.
+    """
+    signal_tonnetz = LazySignalTonnetz(
+        character_signal(1, modulus),
+        integer_list,
+        include_loops=include_loops,
+        include_zero=include_zero,
+        backend="csr",
+        cache_size=0,
+    )
+    adjacency = signal_tonnetz.adjacency
+    vertices = signal_tonnetz.vertices()
+
+    structure = sparse.csr_array(
+        (np.ones(adjacency.nnz, dtype=np.int8), adjacency.indices, adjacency.indptr),
+        shape=adjacency.shape,
+    )
+    _, strong_labels = csgraph.connected_components(structure, directed=True, connection="strong")
+    _, weak_labels = csgraph.connected_components(structure, directed=True, connection="weak")
+
+    total_samples = signal_tonnetz.total_signal().underlying_signal
+
+    statistics = {
+        "modulus": modulus,
+        "multipliers": multipliers_key(integer_list),
+        "include_loops": include_loops,
+        "include_zero": include_zero,
+        "node_count": len(vertices),
+        "edge_count": int(adjacency.nnz),
+        "strong_components": len(np.unique(strong_labels[vertices])),
+        "weak_components": len(np.unique(weak_labels[vertices])),
+        "total_signal_energy": float(np.sum(np.abs(total_samples)**2)),
+        "total_signal_peak": float(np.max(np.abs(total_samples))),
+    }
+
+    return statistics
+
+
+def _run_shard(
+    modulus : int,
+    multiplier_sets : list[list[int]],
+    include_loops : bool,
+    include_zero : bool,
+) -> list[dict[str, int | float | str]]:
+    """Worker entry point: every job of a shard shares the modulus, hence its cached context."""
+    return [
+        tonnetz_statistics(modulus, integer_list, include_loops, include_zero)
+        for integer_list in multiplier_sets
+    ]
+
+
+def run_sweep(
+    moduli : list[int],
+    multiplier_sets : list[list[int]],
+    output_path : str | Path,
+    max_workers : int | None = None,
+    shard_size : int = 32,
+    include_loops : bool = False,
+    include_zero : bool = False,
+) -> pd.DataFrame:
+    """
+    Compute `tonnetz_statistics` for every modulus and every multiplier set in parallel.
+
+    Jobs are grouped into shards of at most `shard_size` multiplier sets sharing one
+    modulus, so each worker process reuses its per-modulus caches across a shard.
+    Shards run on a ProcessPoolExecutor and each finished shard is appended to the
+    CSV file at `output_path` right away. Jobs already present in that file with the
+    same `include_loops` and `include_zero` flags are skipped, so an interrupted sweep
+    resumes where it stopped, and a sweep with other flags adds its own rows.
+
+    Args:
+        moduli (list[int]): Moduli to sweep over.
+        multiplier_sets (list[list[int]]): Multiplier lists to sweep over.
+        output_path (str | Path): CSV file receiving one row per job.
+        max_workers (int | None): Number of worker processes; defaults to the CPU count.
+        shard_size (int): Maximum number of jobs sent to a worker at once.
+        include_loops (bool): Whether to include self-loops.
+        include_zero (bool): Whether to include the zero node.
+
+    Returns:
+        pd.DataFrame: All rows of the output file, including those from earlier runs.
+    """
+    assert all(isinstance(modulus, int) and modulus >= 1 for modulus in moduli)
+    assert isinstance(shard_size, int)
+    assert shard_size >= 1
+
+    output_path = Path(output_path)
+
+    completed_jobs = set()
+    if output_path.exists():
+        completed = _read_sweep(output_path)
+        completed_jobs = set(zip(
+            completed["modulus"].tolist(),
+            completed["multipliers"].tolist(),
+            completed["include_loops"].tolist(),
+            completed["include_zero"].tolist(),
+        ))
+
+    shards = []
+    for modulus in moduli:
+        pending_sets = [
+            integer_list for integer_list in multiplier_sets
+            if (modulus, multipliers_key(integer_list), include_loops, include_zero) not in completed_jobs
+        ]
+        for start in range(0, len(pending_sets), shard_size):
+            shards.append((modulus, pending_sets[start:start + shard_size]))
+
+    if shards:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_run_shard, modulus, shard_sets, include_loops, include_zero)
+                for modulus, shard_sets in shards
+            ]
+            for future in as_completed(futures):
+                shard_rows = pd.DataFrame(future.result(), columns=SWEEP_COLUMNS)
+                shard_rows.to_csv(
+                    output_path,
+                    mode="a",
+                    header=not output_path.exists(),
+                    index=False,
+                )
+
+    if not output_path.exists():
+        return pd.DataFrame(columns=SWEEP_COLUMNS)
+
+    return _read_sweep(output_path)
+
+
+def _read_sweep(output_path : Path) -> pd.DataFrame:
+    """Read a sweep file, keeping multiplier keys as strings (an empty list is "")."""
+    return pd.read_csv(output_path, dtype={"multipliers": str}, keep_default_na=False)
@@ -12,7 +12,7 @@ import math
 from networkx.drawing.nx_agraph import to_agraph
 
 from dissig.tonnetze.networks import Tonnetz
-from dissig.utils.arithmetic import unit_clusters
+from dissig.utils.context import modulus_context
 
 
 def nx_viz(
@@ -85,7 +85,7 @@ def _apply_dot_layout(G, modulus, integer_list, filename, style):
         bgcolor=style["bg"],
     )
 
-    clusters = unit_clusters(modulus)
+    clusters = modulus_context(modulus).unit_clusters
     for _, (cluster_name, members) in enumerate(clusters.items()):
         cluster_idx = cluster_name.replace('cluster_','')
         sg = aG.add_subgraph(
@@ -0,0 +1,127 @@
+"""
+Evolve discrete signals along a tonnetz: batched walks driven by the multiplier action.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from dissig.signals.discrete import Signal
+from dissig.tonnetze.networks import Tonnetz
+
+
+class TonnetzWalker():
+    """
+    Runs many walks along a Tonnetz at once.
+
+    A walk starts at a vertex and, at each step, moves along one of the Tonnetz
+    multipliers, v ↦ v · a mod n. The moves are looked up in a transition table
+    (vertex × multiplier → vertex) computed once, so every step advances all walks
+    with a single array gather instead of per-walk graph lookups. Steps whose edge
+    would be a self-loop leave the walker in place, whether or not the Tonnetz
+    includes loops.
+
+    Attributes:
+        tonnetz (Tonnetz): The Tonnetz being walked.
+        tonic_signal (Signal | None): Signal rescaled along the walks; defaults to the
+            tonic of a SignalTonnetz.
+        transition_table (np.ndarray): int64 array of shape (n, len(integer_list)).
+    """
+    def __init__(self, tonnetz : Tonnetz, tonic_signal : Signal | None = None):
+        assert isinstance(tonnetz, Tonnetz)
+        assert len(tonnetz.integer_list) >= 1
+
+        if tonic_signal is None:
+            tonic_signal = getattr(tonnetz, "tonic_signal", None)
+        assert tonic_signal is None or len(tonic_signal) == tonnetz.sample_count
+
+        self.tonnetz = tonnetz
+        self.tonic_signal = tonic_signal
+        self.transition_table = tonnetz.transition_table()
+
+    def scripted_walks(
+        self,
+        start_vertices : list[int] | np.ndarray,
+        multiplier_indices : np.ndarray,
+    ) -> np.ndarray:
+        """
+        Run walks along prescribed sequences of multipliers.
+
+        Args:
+            start_vertices (list[int] | np.ndarray): Starting vertex of each walk.
+            multiplier_indices (np.ndarray): Integer array of shape (walk_count, step_count);
+                entry (w, k) is the position in `integer_list` of the multiplier taken by
+                walk w at step k.
+
+        Returns:
+            np.ndarray: int64 array of shape (walk_count, step_count + 1) of visited
+                vertices, starting with the start vertices.
+        """
+        start_array = np.asarray(start_vertices, dtype=np.int64)
+        index_array = np.asarray(multiplier_indices, dtype=np.int64)
+        assert start_array.ndim == 1
+        assert index_array.ndim == 2
+        assert index_array.shape[0] == len(start_array)
+        assert np.all((start_array >= 0) & (start_array < self.tonnetz.sample_count))
+        assert np.all((index_array >= 0) & (index_array < self.transition_table.shape[1]))
+
+        walk_count, step_count = index_array.shape
+        visited = np.empty((walk_count, step_count + 1), dtype=np.int64)
+        visited[:, 0] = start_array
+
+        for step in range(step_count):
+            visited[:, step + 1] = self.transition_table[visited[:, step], index_array[:, step]]
+
+        return visited
+
+    def random_walks(
+        self,
+        start_vertices : list[int] | np.ndarray,
+        step_count : int,
+        rng : np.random.Generator | int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Run walks that pick a multiplier uniformly at random at every step.
+
+        Args:
+            start_vertices (list[int] | np.ndarray): Starting vertex of each walk.
+            step_count (int): Number of steps per walk.
+            rng (np.random.Generator | int | None): Random generator or seed.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The (walk_count, step_count + 1) matrix of
+                visited vertices, and the (walk_count, step_count) matrix of the chosen
+                multiplier indices.
+        """
+        assert isinstance(step_count, int)
+        assert step_count >= 0
+
+        rng = np.random.default_rng(rng)
+        walk_count = len(np.asarray(start_vertices))
+        multiplier_indices = rng.integers(
+            0, self.transition_table.shape[1], size=(walk_count, step_count)
+        )
+
+        visited = self.scripted_walks(start_vertices, multiplier_indices)
+
+        return visited, multiplier_indices
+
+    def walk_signals(self, visited : np.ndarray) -> np.ndarray:
+        """
+        Gather the tonic signal rescaled by every visited vertex.
+
+        Args:
+            visited (np.ndarray): Integer array of visited vertices, of any shape.
+
+        Returns:
+            np.ndarray: Complex array of shape visited.shape + (n,), whose entry
+                [..., t] is tonic[v · t mod n] for the vertex v at that position.
+        """
+        assert self.tonic_signal is not None
+
+        modulus = self.tonnetz.sample_count
+        visited_array = np.asarray(visited, dtype=np.int64)
+        time_indices = np.arange(modulus, dtype=np.int64)
+
+        return self.tonic_signal.underlying_signal[
+            (visited_array[..., None] * time_indices) % modulus
+        ]
@@ -4,7 +4,16 @@
 from __future__ import annotations
 
 from dissig.utils.primes import primes_below, prime_divisors, prime_powers
-from dissig.utils.arithmetic import unit_vectors, multiplicative_units, all_divisors, unit_clusters
+from dissig.utils.arithmetic import (
+    unit_vectors,
+    multiplicative_units,
+    all_divisors,
+    unit_clusters,
+    primitive_root,
+)
+from dissig.utils.blocks import BLOCK_ELEMENTS, block_rows
+from dissig.utils.context import ModulusContext, modulus_context
+from dissig.utils.fft_backend import fft_workers, get_fft_workers, set_fft_workers
 
 __all__ = [
     "primes_below",
@@ -14,4 +23,12 @@ __all__ = [
     "multiplicative_units",
     "all_divisors",
     "unit_clusters",
+    "primitive_root",
+    "BLOCK_ELEMENTS",
+    "block_rows",
+    "ModulusContext",
+    "modulus_context",
+    "fft_workers",
+    "get_fft_workers",
+    "set_fft_workers",
 ]
@@ -5,6 +5,8 @@ from __future__ import annotations
 
 import math
 
+from dissig.utils.primes import prime_divisors
+
 
 def all_divisors(modulus : int) -> list[int]:
     """
@@ -96,3 +98,35 @@ def unit_vectors(modulus: int) -> list[tuple[float, float]]:
     ]
 
     return vectors
+
+
+def primitive_root(prime : int, exponent : int = 1) -> int:
+    """
+    Find the least positive generator of the cyclic group (Z/prime^exponent Z)^×
+    for an odd prime.
+
+    A primitive root g modulo the prime is also one modulo every power of the prime,
+    unless g^(prime-1) ≡ 1 mod prime², in which case g + prime is.
+
+    Args:
+        prime (int): An odd prime.
+        exponent (int): A positive exponent.
+
+    Returns:
+        int: A primitive root modulo prime^exponent.
+    """
+    assert isinstance(prime, int) and prime > 2
+    assert prime_divisors(prime) == [prime]
+    assert isinstance(exponent, int) and exponent >= 1
+
+    cofactors = [(prime - 1) // divisor for divisor in prime_divisors(prime - 1)]
+
+    root = next(
+        candidate for candidate in range(2, prime)
+        if all(pow(candidate, cofactor, prime) != 1 for cofactor in cofactors)
+    )
+
+    if exponent >= 2 and pow(root, prime - 1, prime**2) == 1:
+        root += prime
+
+    return root
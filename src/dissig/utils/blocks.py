@@ -0,0 +1,27 @@
+"""
+Block sizes shared by the routines that fill or transform (rows, row_length) arrays.
+
+Node signal matrices, node spectra, STFT frames and frequency grids are processed a
+block of rows at a time, so index tables, phase factors and other temporaries hold
+at most `BLOCK_ELEMENTS` entries whatever the modulus or the number of rows.
+"""
+from __future__ import annotations
+
+
+BLOCK_ELEMENTS = 2**22 # entries held by the temporaries of one block of rows
+
+
+def block_rows(row_length : int) -> int:
+    """
+    Number of rows of length `row_length` processed per block.
+
+    Args:
+        row_length (int): Entries per row, e.g. the modulus or the frame length.
+
+    Returns:
+        int: At least 1, and at most `BLOCK_ELEMENTS // row_length` otherwise.
+    """
+    assert isinstance(row_length, int)
+    assert row_length >= 1
+
+    return max(1, BLOCK_ELEMENTS // row_length)
@@ -0,0 +1,206 @@
+"""
+./src/dissig/utils/context.py
+
+Shared, lazily computed arithmetic data for a fixed modulus.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+
+import numpy as np
+
+from dissig.utils.arithmetic import all_divisors, primitive_root
+from dissig.utils.primes import prime_powers
+
+
+class ModulusContext():
+    """
+    Arithmetic data attached to the ring ℤ/modulusℤ, computed once on first use
+    and shared by every Signal, Tonnetz and visualizer working with that modulus.
+
+    Instances should be obtained through `modulus_context`, which caches them, rather
+    than constructed directly. The lists and arrays handed out are shared between all
+    callers and must not be mutated.
+
+    Attributes:
+        modulus (int): The modulus n of the ring ℤ/nℤ.
+        units (list[int]): Multiplicative units in ℤ/nℤ.
+        divisors (list[int]): Sorted positive divisors of n.
+        unit_clusters (dict[str, list[int]]): Orbits of ℤ/nℤ under the unit group,
+            keyed as in `dissig.utils.arithmetic.unit_clusters`.
+        factorization (list[tuple[int, int]]): Prime power decomposition of n.
+        gcd_classes (np.ndarray): gcd(t, n) for every residue t, with gcd(0, n) = n.
+        orbit_sizes (dict[int, int]): Size φ(n/d) of the orbit of each divisor d.
+        unit_generators (list[tuple[int, int]]): Generators of cyclic factors of the
+            unit group, with their orders.
+        unit_grid (np.ndarray): Every unit, indexed by its exponents over `unit_generators`.
+    """
+    def __init__(self, modulus : int, table_cache_size : int = 16):
+        assert isinstance(modulus, int)
+        assert modulus >= 1
+        assert isinstance(table_cache_size, int)
+        assert table_cache_size >= 1
+
+        self.modulus = modulus
+        self.table_cache_size = table_cache_size
+        self._scaling_tables = OrderedDict()
+
+    @cached_property
+    def unit_array(self) -> np.ndarray:
+        """Read-only int64 array of the multiplicative units in ℤ/nℤ."""
+        residues = np.arange(self.modulus, dtype=np.int64)
+        unit_array = residues[np.gcd(residues, self.modulus) == 1]
+        unit_array.flags.writeable = False
+
+        return unit_array
+
+    @cached_property
+    def units(self) -> list[int]:
+        """Multiplicative units in ℤ/nℤ, as in `multiplicative_units`."""
+        return self.unit_array.tolist()
+
+    @cached_property
+    def divisors(self) -> list[int]:
+        """Sorted positive divisors of n."""
+        return all_divisors(self.modulus)
+
+    @cached_property
+    def unit_clusters(self) -> dict[str, list[int]]:
+        """Orbits {(d · u) mod n | u unit} for every divisor d of n."""
+        clusters = {}
+        for divisor in self.divisors:
+            new_cluster = np.unique((divisor * self.unit_array) % self.modulus)
+            clusters[f"cluster_{divisor}"] = new_cluster.tolist()
+
+        return clusters
+
+    @cached_property
+    def gcd_classes(self) -> np.ndarray:
+        """Read-only int64 array whose entry t is gcd(t, n), with gcd(0, n) = n."""
+        gcd_classes = np.gcd(np.arange(self.modulus, dtype=np.int64), self.modulus)
+        gcd_classes.flags.writeable = False
+
+        return gcd_classes
+
+    @cached_property
+    def factorization(self) -> list[tuple[int, int]]:
+        """Prime power decomposition [(p, e), ...] of n."""
+        return prime_powers(self.modulus)
+
+    @cached_property
+    def orbit_sizes(self) -> dict[int, int]:
+        """Size φ(n/d) of the unit-group orbit of d, for every divisor d of n."""
+        primes = [prime for prime, _ in self.factorization]
+
+        orbit_sizes = {}
+        for divisor in self.divisors:
+            cofactor = self.modulus // divisor
+            totient = cofactor
+            for prime in primes:
+                if cofactor % prime == 0:
+                    totient = totient // prime * (prime - 1)
+            orbit_sizes[divisor] = totient
+
+        return orbit_sizes
+
+    @cached_property
+    def unit_generators(self) -> list[tuple[int, int]]:
+        """
+        Pairs (g, o) of generators and orders splitting (ℤ/nℤ)^× into cyclic factors.
+
+        Each factor comes from one prime power p^e of n: a primitive root for odd p,
+        -1 for 4, and -1 and 5 (of order 2^(e-2)) for 2^e with e ≥ 3. Generators are
+        lifted to ℤ/nℤ by the Chinese remainder theorem, as 1 modulo the other prime
+        powers. The trivial group is given the single factor (1 mod n, 1).
+        """
+        generators = []
+        for prime, exponent in self.factorization:
+            prime_power = prime**exponent
+            cofactor = self.modulus // prime_power
+            lift = cofactor * pow(cofactor, -1, prime_power)
+
+            if prime > 2:
+                local_generators = [(primitive_root(prime, exponent), prime_power // prime * (prime - 1))]
+            elif exponent == 2:
+                local_generators = [(3, 2)]
+            elif exponent >= 3:
+                local_generators = [(prime_power - 1, 2), (5, prime_power // 4)]
+            else:
+                local_generators = []
+
+            for local_generator, order in local_generators:
+                generator = (1 + lift * (local_generator - 1)) % self.modulus
+                generators.append((generator, order))
+
+        if not generators:
+            generators = [(1 % self.modulus, 1)]
+
+        return generators
+
+    @cached_property
+    def unit_grid(self) -> np.ndarray:
+        """
+        Read-only int64 array of shape (o_1, ..., o_r) whose entry x is the unit
+        g_1^x_1 · ... · g_r^x_r mod n, for the generators of `unit_generators`.
+
+        Reading it backwards is the discrete logarithm: it lists each unit exactly once.
+        Powers of each generator are filled by repeated doubling, g^(k + j) = g^k · g^j.
+        """
+        unit_grid = np.ones((), dtype=np.int64) % self.modulus
+        for generator, order in self.unit_generators:
+            powers = np.empty(order, dtype=np.int64)
+            powers[0] = 1 % self.modulus
+            filled_count, step = 1, generator
+            while filled_count < order:
+                count = min(filled_count, order - filled_count)
+                powers[filled_count:filled_count + count] = (powers[:count] * step) % self.modulus
+                filled_count += count
+                step = (step * step) % self.modulus
+            unit_grid = np.multiply.outer(unit_grid, powers) % self.modulus
+
+        unit_grid.flags.writeable = False
+
+        return unit_grid
+
+    def scaling_table(self, multiplier : int) -> np.ndarray:
+        """
+        Index table t ↦ multiplier · t mod n, cached per multiplier in a bounded LRU.
+
+        Args:
+            multiplier (int): Integer multiplier; only its residue mod n matters.
+
+        Returns:
+            np.ndarray: Read-only int64 array of length n.
+        """
+        residue = int(multiplier) % self.modulus
+
+        if residue in self._scaling_tables:
+            self._scaling_tables.move_to_end(residue)
+            return self._scaling_tables[residue]
+
+        table = (residue * np.arange(self.modulus, dtype=np.int64)) % self.modulus
+        table.flags.writeable = False
+
+        self._scaling_tables[residue] = table
+        if len(self._scaling_tables) > self.table_cache_size:
+            self._scaling_tables.popitem(last=False)
+
+        return table
+
+
+@lru_cache(maxsize=16)
+def modulus_context(modulus : int) -> ModulusContext:
+    """
+    Return the shared ModulusContext for ℤ/modulusℤ.
+
+    Contexts are kept in a bounded LRU cache, so repeated lookups for the same
+    modulus return the same object.
+
+    Args:
+        modulus (int): A positive integer.
+
+    Returns:
+        ModulusContext: The cached context for this modulus.
+    """
+    return ModulusContext(modulus)
@@ -0,0 +1,143 @@
+"""
+./src/dissig/utils/fft_backend.py
+
+FFT backend shared by `dissig.fourier` and `SignalBatch`.
+
+Transforms are computed by `scipy.fft`, which keeps the plans (twiddle factors) of
+recently used lengths cached, so repeated transforms of one modulus are not
+re-planned. Batched transforms are split across `workers` threads; a single 1-D
+transform always runs on one thread.
+
+The worker count is configured globally with `set_fft_workers`, temporarily with
+the `fft_workers` context manager, or per call with the `workers` argument.
+Following `scipy.fft`, negative counts are relative to the number of CPUs, so -1
+uses every core.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import numpy as np
+import scipy.fft
+
+
+_fft_config = {"workers": -1}
+
+
+def get_fft_workers() -> int:
+    """Return the worker count used by transforms called without `workers`."""
+    return _fft_config["workers"]
+
+
+def set_fft_workers(workers : int) -> None:
+    """
+    Set the worker count used by transforms called without `workers`.
+
+    Args:
+        workers (int): Number of threads; negative values count back from the
+            number of CPUs (-1 uses all of them). Must be non-zero.
+    """
+    assert isinstance(workers, int)
+    assert workers != 0
+
+    _fft_config["workers"] = workers
+
+
+@contextmanager
+def fft_workers(workers : int) -> Iterator[None]:
+    """
+    Temporarily set the worker count used by transforms called without `workers`.
+
+    Args:
+        workers (int): Number of threads, as in `set_fft_workers`.
+    """
+    previous_workers = get_fft_workers()
+    set_fft_workers(workers)
+    try:
+        yield
+    finally:
+        set_fft_workers(previous_workers)
+
+
+def _resolve_workers(workers : int | None) -> int:
+    """The worker count of a call, falling back to the configured one."""
+    if workers is None:
+        return get_fft_workers()
+
+    assert isinstance(workers, int)
+    assert workers != 0
+    return workers
+
+
+def fft(samples : np.ndarray, axis : int = -1, workers : int | None = None) -> np.ndarray:
+    """
+    Discrete Fourier transform along one axis, as `np.fft.fft`.
+
+    Args:
+        samples (np.ndarray): Input array.
+        axis (int): Axis to transform.
+        workers (int | None): Number of threads; None uses the configured count.
+
+    Returns:
+        np.ndarray: Complex array of Fourier coefficients, indexed by multiplier.
+    """
+    return scipy.fft.fft(samples, axis=axis, workers=_resolve_workers(workers))
+
+
+def ifft(coefficients : np.ndarray, axis : int = -1, workers : int | None = None) -> np.ndarray:
+    """
+    Inverse discrete Fourier transform along one axis, as `np.fft.ifft`.
+
+    Args:
+        coefficients (np.ndarray): Fourier coefficients, indexed by multiplier.
+        axis (int): Axis to transform.
+        workers (int | None): Number of threads; None uses the configured count.
+
+    Returns:
+        np.ndarray: Complex array of samples.
+    """
+    return scipy.fft.ifft(coefficients, axis=axis, workers=_resolve_workers(workers))
+
+
+def rfft(samples : np.ndarray, axis : int = -1, workers : int | None = None) -> np.ndarray:
+    """
+    Discrete Fourier transform of real input along one axis, as `np.fft.rfft`.
+
+    Args:
+        samples (np.ndarray): Real input array of length n along `axis`.
+        axis (int): Axis to transform.
+        workers (int | None): Number of threads; None uses the configured count.
+
+    Returns:
+        np.ndarray: The n // 2 + 1 non-negative Fourier coefficients along `axis`.
+    """
+    return scipy.fft.rfft(samples, axis=axis, workers=_resolve_workers(workers))
+
+
+def fftn(samples : np.ndarray, workers : int | None = None) -> np.ndarray:
+    """
+    Multidimensional discrete Fourier transform over all axes, as `np.fft.fftn`.
+
+    Args:
+        samples (np.ndarray): Input array.
+        workers (int | None): Number of threads; None uses the configured count.
+
+    Returns:
+        np.ndarray: Complex array of Fourier coefficients, of the shape of `samples`.
+    """
+    return scipy.fft.fftn(samples, workers=_resolve_workers(workers))
+
+
+def ifftn(coefficients : np.ndarray, workers : int | None = None) -> np.ndarray:
+    """
+    Inverse multidimensional discrete Fourier transform over all axes, as `np.fft.ifftn`.
+
+    Args:
+        coefficients (np.ndarray): Fourier coefficients.
+        workers (int | None): Number of threads; None uses the configured count.
+
+    Returns:
+        np.ndarray: Complex array of samples, of the shape of `coefficients`.
+    """
+    return scipy.fft.ifftn(coefficients, workers=_resolve_workers(workers))
@@ -0,0 +1,118 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from dissig.signals.batch import SignalBatch
+from dissig.signals.discrete import Signal
+from dissig.tonnetze.networks import SignalTonnetz, LazySignalTonnetz
+from dissig.fourier import continuous
+from dissig.fourier.continuous import step_spectrum
+
+
+def exact_step_spectrum(samples, omega):
+    """Integrate the step function against e^{-2πiωx} one step at a time."""
+    modulus = len(samples)
+    if omega == 0:
+        return np.mean(samples)
+    edges = np.exp(-2j * np.pi * omega * np.arange(modulus + 1) / modulus)
+    return np.sum(samples * (edges[1:] - edges[:-1])) / (-2j * np.pi * omega)
+
+
+@pytest.mark.parametrize("modulus", [1, 6, 13])
+def test_step_spectrum_matches_integral(modulus):
+    """The closed form agrees with a direct integration of the step function."""
+    rng = np.random.default_rng(modulus)
+    samples = rng.normal(size=modulus) + 1j * rng.normal(size=modulus)
+    omegas = np.concatenate(([0.0], rng.uniform(-40, 40, size=25)))
+
+    spectrum = step_spectrum(Signal(samples), omegas)
+
+    assert spectrum.shape == omegas.shape
+    assert np.allclose(spectrum, [exact_step_spectrum(samples, omega) for omega in omegas])
+
+
+def test_step_spectrum_at_integers_damps_dft():
+    """At integer frequencies the spectrum is the DFT times the sinc envelope."""
+    samples = np.random.default_rng(1).normal(size=8).astype(np.complex128)
+    multipliers = np.arange(8)
+
+    spectrum = step_spectrum(samples, multipliers)
+    envelope = np.exp(-1j * np.pi * multipliers / 8) * np.sinc(multipliers / 8) / 8
+
+    assert np.allclose(spectrum, np.fft.fft(samples) * envelope)
+
+
+def test_step_spectrum_chunks_frequency_grid():
+    """Results do not depend on how the frequency grid is split into blocks."""
+    batch = SignalBatch.characters(list(range(10)), 10)
+    omegas = np.linspace(-30, 30, 101)
+
+    expected = step_spectrum(batch, omegas)
+    with patch("dissig.utils.blocks.BLOCK_ELEMENTS", 25):
+        chunked = step_spectrum(batch, omegas)
+
+    assert expected.shape == (10, 101)
+    assert np.allclose(chunked, expected)
+
+
+@pytest.mark.parametrize("tonnetz_class, storage", [
+    (SignalTonnetz, "graph"),
+    (SignalTonnetz, "matrix"),
+    (LazySignalTonnetz, None),
+])
+def test_step_spectrum_of_tonnetz_nodes(tonnetz_class, storage):
+    """A SignalTonnetz yields one spectrum per vertex, in vertex order."""
+    tonic = Signal(np.exp(2j * np.pi * np.arange(9) ** 2 / 9))
+    options = {} if storage is None else {"storage": storage}
+    signal_tonnetz = tonnetz_class(tonic, [2], **options)
+    omegas = np.linspace(0, 20, 41)
+
+    spectra = step_spectrum(signal_tonnetz, omegas)
+
+    for row, (_, current_signal) in enumerate(signal_tonnetz.iter_node_signals()):
+        assert np.allclose(spectra[row], step_spectrum(current_signal, omegas))
+
+
+@pytest.mark.parametrize("tonnetz_class, storage", [
+    (SignalTonnetz, "graph"),
+    (SignalTonnetz, "matrix"),
+    (LazySignalTonnetz, None),
+])
+def test_step_spectrum_streams_tonnetz_vertices(tonnetz_class, storage):
+    """Node signals streamed in blocks of vertices give the same spectra."""
+    tonic = Signal(np.exp(2j * np.pi * np.arange(12) ** 2 / 12))
+    options = {} if storage is None else {"storage": storage}
+    signal_tonnetz = tonnetz_class(tonic, [5, 7], **options)
+    omegas = np.linspace(-10, 10, 23)
+
+    expected = step_spectrum(signal_tonnetz, omegas)
+    with patch("dissig.utils.blocks.BLOCK_ELEMENTS", 30):
+        streamed = step_spectrum(signal_tonnetz, omegas)
+
+    assert streamed.shape == (len(signal_tonnetz.vertices()), 23)
+    assert np.allclose(streamed, expected)
+
+
+def test_step_spectrum_reads_memory_mapped_rows_in_blocks(tmp_path):
+    """Matrix node signals are passed on as row slices of the memory map, never copied whole."""
+    tonic = Signal(np.exp(2j * np.pi * np.arange(12) ** 2 / 12))
+    SignalTonnetz(tonic, [5, 7], storage="matrix").save(tmp_path / "signal_tonnetz")
+    loaded = SignalTonnetz.load(tmp_path / "signal_tonnetz", mmap=True)
+    omegas = np.linspace(-10, 10, 23)
+
+    block_rows = []
+    sample_sums = continuous._sample_sums
+
+    def recording_sample_sums(samples, omegas, out):
+        assert np.shares_memory(samples, loaded.node_signals)
+        block_rows.append(len(samples))
+        sample_sums(samples, omegas, out)
+
+    with patch("dissig.utils.blocks.BLOCK_ELEMENTS", 30), \
+            patch("dissig.fourier.continuous._sample_sums", recording_sample_sums):
+        spectra = step_spectrum(loaded, omegas)
+
+    assert block_rows == [2, 2, 2, 2, 2, 1]
+    for row, (_, current_signal) in enumerate(loaded.iter_node_signals()):
+        assert np.allclose(spectra[row], step_spectrum(current_signal, omegas))
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from dissig.signals.discrete import Signal
+from dissig.utils.context import modulus_context
+from dissig.fourier.dirichlet import dirichlet_transform, inverse_dirichlet_transform, orbit_indices
+
+
+def random_signal(modulus, seed=0):
+    rng = np.random.default_rng(seed)
+    return Signal(rng.normal(size=modulus) + 1j * rng.normal(size=modulus))
+
+
+def naive_coefficients(samples, modulus, divisor):
+    """Sum the orbit samples against every character, one character at a time."""
+    indices = orbit_indices(modulus, divisor)
+    orders = indices.shape
+    coefficients = np.empty(orders, dtype=np.complex128)
+    for character in np.ndindex(orders):
+        total = 0
+        for exponents in np.ndindex(orders):
+            phase = sum(j * x / order for j, x, order in zip(character, exponents, orders))
+            total += samples[indices[exponents]] * np.exp(-2j * np.pi * phase)
+        coefficients[character] = total
+    return coefficients
+
+
+@pytest.mark.parametrize("modulus", [1, 8, 12, 15, 16, 27])
+def test_orbits_are_unit_clusters(modulus):
+    """The discrete-log grids enumerate exactly the unit-group orbits."""
+    context = modulus_context(modulus)
+
+    for divisor in context.divisors:
+        indices = orbit_indices(modulus, divisor)
+        assert sorted(indices.ravel().tolist()) == context.unit_clusters[f"cluster_{divisor}"]
+
+
+@pytest.mark.parametrize("modulus", [1, 7, 16, 24, 45])
+def test_dirichlet_transform_matches_naive_sums(modulus):
+    """FFTs over the discrete-log grid equal the naive character sums."""
+    signal = random_signal(modulus)
+
+    coefficients = dirichlet_transform(signal)
+
+    assert sorted(coefficients) == modulus_context(modulus).divisors
+    for divisor, orbit_coefficients in coefficients.items():
+        expected = naive_coefficients(signal.underlying_signal, modulus, divisor)
+        assert np.allclose(orbit_coefficients, expected)
+
+
+@pytest.mark.parametrize("modulus", [1, 10, 32, 99])
+def test_inverse_dirichlet_transform_round_trip(modulus):
+    """Coefficients of all orbits rebuild the signal."""
+    signal = random_signal(modulus, seed=1)
+
+    rebuilt = inverse_dirichlet_transform(dirichlet_transform(signal), modulus)
+
+    assert np.allclose(rebuilt.underlying_signal, signal.underlying_signal)
+
+
+def test_dirichlet_character_is_a_spike():
+    """A signal equal to one character on the units has a single coefficient there."""
+    modulus = 20
+    indices = orbit_indices(modulus, 1)
+    orders = indices.shape
+    character = (1,) + (0,) * (len(orders) - 1)
+    samples = np.zeros(modulus, dtype=np.complex128)
+    for exponents in np.ndindex(orders):
+        samples[indices[exponents]] = np.exp(2j * np.pi * exponents[0] / orders[0])
+
+    coefficients = dirichlet_transform(Signal(samples), divisors=[1])[1]
+
+    expected = np.zeros(orders, dtype=np.complex128)
+    expected[character] = indices.size
+    assert np.allclose(coefficients, expected)
+
+
+def test_dirichlet_transform_keeps_shared_contexts():
+    """Cofactor unit grids do not go through, and evict from, the shared context cache."""
+    modulus = 720720
+    context = modulus_context(modulus)
+    cache_before = modulus_context.cache_info()
+
+    dirichlet_transform(Signal(np.ones(modulus, dtype=np.complex128)))
+
+    assert modulus_context.cache_info().currsize == cache_before.currsize
+    assert modulus_context.cache_info().misses == cache_before.misses
+    assert modulus_context(modulus) is context
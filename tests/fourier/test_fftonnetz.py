@@ -1,9 +1,9 @@
 import numpy as np
 import pytest
 
-from dissig.signals.discrete import Signal, character_signal
+from dissig.signals.discrete import CharacterSignal, Signal, character_signal
 from dissig.tonnetze.networks import SignalTonnetz
-from dissig.fourier.fftonnetz import fft_with_multipliers, fft_tonnetz
+from dissig.fourier.fftonnetz import HermitianSpectrum, fft_with_multipliers, fft_tonnetz
 
 
 @pytest.mark.parametrize("samples, expected_fft", [
@@ -43,3 +43,70 @@ def test_fft_tonnetz_signal_consistency(samples, integer_list):
         actual_values = list(node_signal_list)
         for a, b in zip(actual_values, expected_values):
             assert a == pytest.approx(b, abs=1e-10)
+
+
+@pytest.mark.parametrize("modulus", [1, 5, 12])
+def test_fft_tonnetz_components_sum_to_scaled_signal(modulus):
+    """The Fourier components of all nodes sum to n times the input signal."""
+    rng = np.random.default_rng(modulus)
+    samples = rng.normal(size=modulus) + 1j * rng.normal(size=modulus)
+    tonnetz = fft_tonnetz(Signal(samples), [1, 5])
+
+    assert tonnetz.storage == "matrix"
+    assert not tonnetz.tonic_propagated
+    assert np.allclose(tonnetz.fourier_coefficients, np.fft.fft(samples))
+    assert np.allclose(tonnetz.total_signal().underlying_signal, modulus * samples)
+
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_fft_tonnetz_lazy_matches_eager(backend):
+    """Lazy Fourier components match the materialized node matrix."""
+    samples = np.exp(2j * np.pi * np.arange(9) ** 2 / 9)
+    eager = fft_tonnetz(Signal(samples), [2, 4])
+    lazy = fft_tonnetz(Signal(samples), [2, 4], lazy=True, backend=backend)
+
+    assert not lazy.tonic_propagated
+    for multiplier in range(9):
+        assert np.allclose(lazy.node_signal(multiplier).underlying_signal, eager.node_signals[multiplier])
+    assert np.allclose(lazy.total_signal().underlying_signal, eager.total_signal().underlying_signal)
+
+
+@pytest.mark.parametrize("modulus", [1, 2, 7, 12])
+def test_fft_with_multipliers_real_fast_path(modulus):
+    """Real signals get a Hermitian spectrum matching the full complex FFT."""
+    samples = np.random.default_rng(modulus).normal(size=modulus)
+    signal = Signal(samples.astype(np.complex128))
+    expected = np.fft.fft(samples)
+
+    spectrum = fft_with_multipliers(signal)
+
+    assert isinstance(spectrum, HermitianSpectrum)
+    assert len(spectrum.half_spectrum) == modulus // 2 + 1
+    assert list(spectrum) == list(range(modulus))
+    assert np.allclose([spectrum[k] for k in range(modulus)], expected)
+    assert np.allclose(spectrum.to_array(), expected)
+    assert np.allclose(fft_with_multipliers(signal, as_array=True), expected)
+    with pytest.raises(KeyError):
+        spectrum[modulus]
+
+
+@pytest.mark.parametrize("real, expected_type", [(None, dict), (False, dict)])
+def test_fft_with_multipliers_complex_signal(real, expected_type):
+    """Complex signals keep the full FFT, as a dict or an array."""
+    samples = np.array([1, 2j, -1, 0.5 + 1j])
+    signal = Signal(samples)
+
+    assert type(fft_with_multipliers(signal, real=real)) is expected_type
+    assert np.allclose(fft_with_multipliers(signal, as_array=True), np.fft.fft(samples))
+
+
+def test_fft_tonnetz_lazy_nodes_are_characters():
+    """Lazy Fourier nodes are scaled characters whose spectra are single spikes."""
+    samples = np.random.default_rng(3).normal(size=10).astype(np.complex128)
+    tonnetz = fft_tonnetz(Signal(samples), [3], lazy=True)
+
+    node = tonnetz.node_signal(4)
+
+    assert isinstance(node, CharacterSignal)
+    assert node._sample_cache is None
+    assert np.allclose(fft_with_multipliers(node, as_array=True), np.where(np.arange(10) == 4, 10 * np.fft.fft(samples)[4], 0))
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from dissig.signals.discrete import Signal
+from dissig.utils.context import modulus_context
+from dissig.fourier.fftonnetz import fft_tonnetz
+from dissig.fourier.resynthesis import multiplier_mask, resynthesize, resynthesize_batch
+from dissig.tonnetze.networks import SignalTonnetz, Tonnetz
+
+
+def random_signal(modulus, seed=0):
+    rng = np.random.default_rng(seed)
+    return Signal(rng.normal(size=modulus) + 1j * rng.normal(size=modulus))
+
+
+@pytest.mark.parametrize("multipliers, modulus, expected", [
+    ([], 4, [False] * 4),
+    ([1, 3], 4, [False, True, False, True]),
+    ([-1, 6], 5, [False, True, False, False, True]),
+])
+def test_multiplier_mask(multipliers, modulus, expected):
+    assert multiplier_mask(multipliers, modulus).tolist() == expected
+
+
+@pytest.mark.parametrize("modulus", [1, 9, 12])
+def test_resynthesize_all_multipliers_is_identity(modulus):
+    """Keeping every component gives the signal back."""
+    signal = random_signal(modulus)
+
+    rebuilt = resynthesize(signal, range(modulus))
+
+    assert np.allclose(rebuilt.underlying_signal, signal.underlying_signal)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_resynthesize_matches_node_sum(lazy):
+    """Unnormalized resynthesis of an orbit sums its fft_tonnetz node signals."""
+    signal = random_signal(12, seed=1)
+    tonnetz = fft_tonnetz(signal, [5, 7], lazy=lazy)
+    orbit = modulus_context(12).unit_clusters["cluster_2"]
+
+    rebuilt = resynthesize(tonnetz, orbit, normalize=False)
+
+    expected = sum(tonnetz.node_signal(multiplier).underlying_signal for multiplier in orbit)
+    assert np.allclose(rebuilt.underlying_signal, expected)
+
+
+def test_orbit_resynthesis_partitions_signal():
+    """Components over all unit-cluster orbits add up to the signal."""
+    signal = random_signal(18, seed=2)
+    orbits = list(modulus_context(18).unit_clusters.values())
+
+    batch = resynthesize_batch(signal, orbits)
+
+    assert len(batch) == len(orbits)
+    for row, orbit in enumerate(orbits):
+        assert np.allclose(batch[row].underlying_signal, resynthesize(signal, orbit).underlying_signal)
+    assert np.allclose(batch.samples.sum(axis=0), signal.underlying_signal)
+
+
+def test_resynthesize_batch_boolean_masks():
+    """Boolean masks select the same components as multiplier lists."""
+    signal = random_signal(8, seed=3)
+    masks = np.array([multiplier_mask([0, 4], 8), multiplier_mask([1, 7], 8)])
+
+    batch = resynthesize_batch(np.fft.fft(signal.underlying_signal), masks, normalize=False)
+
+    expected = resynthesize_batch(signal, [[0, 4], [1, 7]], normalize=False)
+    assert np.allclose(batch.samples, expected.samples)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_resynthesize_loaded_fft_tonnetz(tmp_path, lazy):
+    """Fourier coefficients are saved with an fft_tonnetz and used after loading it."""
+    discrete_signal = random_signal(12)
+    fft_tonnetz(discrete_signal, [5, 7], lazy=lazy).save(tmp_path / "fft_tonnetz")
+
+    loaded = Tonnetz.load(tmp_path / "fft_tonnetz")
+
+    assert np.allclose(loaded.fourier_coefficients, np.fft.fft(discrete_signal.underlying_signal))
+    assert np.allclose(
+        resynthesize(loaded, [1, 5]).underlying_signal,
+        resynthesize(discrete_signal, [1, 5]).underlying_signal,
+    )
+
+
+def test_resynthesize_rejects_plain_signal_tonnetz():
+    """A tonnetz not built by fft_tonnetz has no Fourier coefficients to resynthesize from."""
+    with pytest.raises(AssertionError):
+        resynthesize(SignalTonnetz(random_signal(6), [5]), [1])
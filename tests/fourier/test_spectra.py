@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from dissig.signals.discrete import Signal
+from dissig.tonnetze.networks import SignalTonnetz, LazySignalTonnetz
+from dissig.fourier.fftonnetz import fft_tonnetz
+from dissig.fourier.spectra import node_spectra, rescaled_spectrum
+
+
+def random_signal(modulus, seed=0):
+    rng = np.random.default_rng(seed)
+    return Signal(rng.normal(size=modulus) + 1j * rng.normal(size=modulus))
+
+
+@pytest.mark.parametrize("modulus", [1, 7, 12, 30])
+def test_rescaled_spectrum_matches_fft(modulus):
+    """Every rescaling's spectrum equals the FFT of the rescaled signal."""
+    signal = random_signal(modulus)
+    spectrum = np.fft.fft(signal.underlying_signal)
+
+    for multiplier in range(-modulus, 2 * modulus):
+        expected = np.fft.fft(signal.scale_time_by(multiplier).underlying_signal)
+        assert np.allclose(rescaled_spectrum(spectrum, multiplier), expected)
+
+
+@pytest.mark.parametrize("include_zero", [False, True])
+@pytest.mark.parametrize("tonnetz_class", [SignalTonnetz, LazySignalTonnetz])
+def test_node_spectra_matches_node_ffts(include_zero, tonnetz_class):
+    """Node spectra match the FFT of each node signal, in vertex order."""
+    signal_tonnetz = tonnetz_class(random_signal(24, seed=1), [5, 6], include_zero=include_zero)
+
+    spectra = node_spectra(signal_tonnetz)
+    vertices = signal_tonnetz.vertices().tolist()
+
+    assert spectra.shape == (len(vertices), 24)
+    for row, (vertex, current_signal) in enumerate(signal_tonnetz.iter_node_signals()):
+        assert vertices[row] == vertex
+        assert np.allclose(spectra[row], np.fft.fft(current_signal.underlying_signal))
+
+
+def test_node_spectra_selected_vertices():
+    """Spectra of selected vertices come back in the requested order."""
+    signal_tonnetz = SignalTonnetz(random_signal(10, seed=2), [3])
+
+    spectra = node_spectra(signal_tonnetz, [4, 0, 7])
+
+    for row, vertex in enumerate([4, 0, 7]):
+        expected = np.fft.fft(signal_tonnetz.tonic_signal.scale_time_by(vertex).underlying_signal)
+        assert np.allclose(spectra[row], expected)
+
+
+def test_node_spectra_requires_propagated_tonic():
+    """Tonnetze with replaced node signals are rejected."""
+    with pytest.raises(AssertionError):
+        node_spectra(fft_tonnetz(random_signal(6), [5]))
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from scipy.signal import get_window
+
+from dissig.signals.discrete import Signal
+from dissig.fourier.stft import frame_count, stft, stream_stft
+
+
+def reference_stft(samples, frame_length, hop_length, window):
+    starts = range(0, len(samples) - frame_length + 1, hop_length)
+    return np.array([np.fft.fft(samples[start:start + frame_length] * window) for start in starts])
+
+
+@pytest.mark.parametrize("sample_count, frame_length, hop_length, expected", [
+    (10, 4, 2, 4),
+    (10, 4, 3, 3),
+    (3, 4, 1, 0),
+    (4, 4, 5, 1),
+])
+def test_frame_count(sample_count, frame_length, hop_length, expected):
+    assert frame_count(sample_count, frame_length, hop_length) == expected
+
+
+@pytest.mark.parametrize("frame_length, hop_length", [(8, 4), (8, 3), (5, 7), (16, 16)])
+def test_stft_matches_framewise_fft(frame_length, hop_length):
+    """Complex signals get the full spectrum of every windowed frame."""
+    rng = np.random.default_rng(frame_length)
+    samples = rng.normal(size=100) + 1j * rng.normal(size=100)
+    window = get_window("hann", frame_length)
+
+    spectra = stft(Signal(samples), frame_length, hop_length)
+
+    assert spectra.shape == (frame_count(100, frame_length, hop_length), frame_length)
+    assert np.allclose(spectra, reference_stft(samples, frame_length, hop_length, window))
+
+
+def test_stft_real_signal_keeps_half_spectrum():
+    """Real signals are transformed with rfft."""
+    samples = np.sin(np.arange(64) / 3)
+
+    spectra = stft(samples, 10, 5, window=None)
+
+    assert spectra.shape == (frame_count(64, 10, 5), 6)
+    assert np.allclose(spectra, reference_stft(samples, 10, 5, np.ones(10))[:, :6])
+
+
+@pytest.mark.parametrize("chunk_lengths", [[100], [1] * 100, [7, 0, 30, 2, 61], [3, 50, 47]])
+@pytest.mark.parametrize("frame_length, hop_length", [(8, 4), (6, 11), (9, 1)])
+def test_stream_stft_matches_stft(chunk_lengths, frame_length, hop_length):
+    """Streaming over any chunking gives the frames of the whole signal."""
+    samples = np.random.default_rng(0).normal(size=100)
+    boundaries = np.cumsum([0] + chunk_lengths)
+    chunks = [samples[start:stop] for start, stop in zip(boundaries[:-1], boundaries[1:])]
+
+    streamed = list(stream_stft(iter(chunks), frame_length, hop_length))
+    expected = stft(samples, frame_length, hop_length)
+
+    assert all(len(spectra) > 0 for spectra in streamed)
+    assert np.allclose(np.concatenate(streamed), expected)
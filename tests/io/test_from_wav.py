@@ -1,9 +1,10 @@
 import pytest
 from unittest.mock import patch
 import numpy as np
+from scipy.io import wavfile
 
 from dissig.signals.discrete import Signal
-from dissig.io.from_wav import read_wav_to_signal
+from dissig.io.from_wav import iter_wav_chunks, read_wav_to_signal
 
 wav_data = [
     ("test_file_1.wav", [1, 2, 3, 4], 44100),
@@ -20,4 +21,30 @@ def test_read_wav_to_signal(file_path, samples, sample_rate):
         expected_samples = [complex(s, 0) for s in samples]
 
         assert rate == sample_rate
-        assert signal.underlying_signal == expected_samples
+        assert signal.underlying_signal.tolist() == expected_samples
+
+
+@pytest.mark.parametrize("channel, expected", [(None, [1.5, 3.5, 5.5]), (1, [2.0, 4.0, 6.0])])
+def test_iter_wav_chunks_multichannel(channel, expected):
+    """Multi-channel files are averaged or reduced to one channel, chunk by chunk."""
+    with patch('scipy.io.wavfile.read') as mock_read:
+        mock_read.return_value = (8000, np.array([[1, 2], [3, 4], [5, 6]], dtype=np.int16))
+
+        chunks, rate = iter_wav_chunks("stereo.wav", chunk_length=2, channel=channel)
+        chunk_list = list(chunks)
+
+        assert rate == 8000
+        assert mock_read.call_args.kwargs["mmap"]
+        assert [len(chunk) for chunk in chunk_list] == [2, 1]
+        assert np.concatenate(chunk_list).tolist() == expected
+
+
+def test_iter_wav_chunks_round_trip(tmp_path):
+    """Chunks read from a written file concatenate to its samples."""
+    samples = np.arange(-500, 500, dtype=np.int16)
+    wavfile.write(tmp_path / "ramp.wav", 4000, samples)
+
+    chunks, rate = iter_wav_chunks(str(tmp_path / "ramp.wav"), chunk_length=300)
+
+    assert rate == 4000
+    assert np.concatenate(list(chunks)).tolist() == samples.astype(float).tolist()
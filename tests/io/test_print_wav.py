@@ -77,10 +77,10 @@ def test_tonnetz_to_wav_calls_signal_to_wav(
     """Test tonnetz_to_wav calls signal_to_wav on each node."""
     # Create mock signal and SignalTonnetz object
     mock_signal = MagicMock(name="MockSignal")
-    mock_network = MagicMock()
-    mock_network.nodes = {i: {'signal': mock_signal} for i in node_ids}
     mock_signal_tonnetz = MagicMock()
-    mock_signal_tonnetz.network = mock_network
+    mock_signal_tonnetz.iter_node_signals.return_value = iter(
+        [(i, mock_signal) for i in node_ids]
+    )
 
     with patch("dissig.io.print_wav.signal_to_wav") as mock_signal_to_wav:
         tonnetz_to_wav(
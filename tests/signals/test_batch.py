@@ -0,0 +1,90 @@
+"""
+Unit tests for SignalBatch in batch signal module.
+"""
+from __future__ import annotations
+
+import pytest
+import numpy as np
+
+from dissig.signals.discrete import Signal, character_signal
+from dissig.signals.batch import SignalBatch
+
+
+def _random_batch(batch_size, modulus, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(batch_size, modulus)) + 1j * rng.normal(size=(batch_size, modulus))
+
+
+@pytest.mark.parametrize(
+    "bad_array",
+    [
+        np.zeros(4, dtype=complex),       # one-dimensional
+        np.zeros((2, 0), dtype=complex),  # no samples
+        np.zeros((2, 3)),                 # real dtype
+        [[1+0j, 2+0j]],                   # not an array
+    ]
+)
+def test_signal_batch_init_invalid(bad_array):
+    """Test invalid SignalBatch initialization raises assertion."""
+    with pytest.raises(AssertionError):
+        SignalBatch(bad_array)
+
+
+def test_signal_batch_round_trip():
+    """Test conversion from and back to a list of Signals."""
+    signals = [Signal(row) for row in _random_batch(3, 5)]
+    batch = SignalBatch.from_signals(signals)
+
+    assert len(batch) == 3
+    assert batch.sample_count == 5
+    for original, recovered in zip(signals, batch.to_signals()):
+        assert np.array_equal(original.underlying_signal, recovered.underlying_signal)
+
+
+def test_signal_batch_rows_are_views():
+    """Test that rows returned by the batch share its memory."""
+    samples = _random_batch(2, 4)
+    batch = SignalBatch(samples)
+    assert np.shares_memory(batch[1].underlying_signal, samples)
+    assert all(np.shares_memory(row.underlying_signal, samples) for row in batch.to_signals())
+
+
+def test_signal_batch_mismatched_lengths():
+    """Test that signals of different lengths cannot be stacked."""
+    with pytest.raises(AssertionError):
+        SignalBatch.from_signals([Signal([1+0j, 2+0j]), Signal([1+0j])])
+
+
+@pytest.mark.parametrize("multiplier", [0, 1, 2, 5, -3])
+def test_signal_batch_scale_time_by(multiplier):
+    """Test batched scaling against per-signal scaling."""
+    batch = SignalBatch(_random_batch(4, 9))
+    scaled = batch.scale_time_by(multiplier)
+    for row, signal in zip(scaled.samples, batch.to_signals()):
+        assert np.array_equal(row, signal.scale_time_by(multiplier).underlying_signal)
+
+
+@pytest.mark.parametrize("normalize", [False, True])
+def test_signal_batch_extract_real(normalize):
+    """Test batched real extraction against per-signal extraction."""
+    batch = SignalBatch(_random_batch(3, 7))
+    result = batch.extract_real(normalize=normalize)
+    for row, signal in zip(result, batch.to_signals()):
+        assert np.allclose(row, signal.extract_real(normalize=normalize))
+
+
+@pytest.mark.parametrize("modulus", [1, 4, 12])
+def test_signal_batch_characters(modulus):
+    """Test batched character construction against character_signal."""
+    multipliers = list(range(-2, modulus + 2))
+    batch = SignalBatch.characters(multipliers, modulus)
+    for row, multiplier in zip(batch.samples, multipliers):
+        assert np.allclose(row, character_signal(multiplier, modulus).underlying_signal)
+
+
+def test_signal_batch_fft():
+    """Test batched FFT along the sample axis."""
+    samples = _random_batch(3, 8)
+    result = SignalBatch(samples).fft()
+    for row, signal_row in zip(result, samples):
+        assert np.allclose(row, np.fft.fft(signal_row))
@@ -6,7 +6,7 @@ from __future__ import annotations
 import pytest
 import numpy as np
 
-from dissig.signals.discrete import Signal, character_signal
+from dissig.signals.discrete import CharacterSignal, Signal, character_signal
 
 
 @pytest.mark.parametrize(
@@ -21,7 +21,7 @@ def test_signal_init_valid(sample_list):
     """Test valid Signal initialization."""
     signal = Signal(sample_list)
     assert len(signal) == len(sample_list)
-    assert signal.underlying_signal == sample_list
+    assert signal.underlying_signal.tolist() == sample_list
     assert isinstance(signal.ring_units, list)
     assert all(isinstance(u, int) for u in signal.ring_units)
 
@@ -41,6 +41,44 @@ def test_signal_init_invalid(bad_sample_list):
         Signal(bad_sample_list)
 
 
+@pytest.mark.parametrize(
+    "bad_array",
+    [
+        np.array([], dtype=complex),            # empty array
+        np.array([1.0, 2.0, 3.0]),              # real dtype
+        np.array([[1+0j, 2+0j], [3+0j, 4+0j]]), # not one-dimensional
+    ]
+)
+def test_signal_init_invalid_array(bad_array):
+    """Test invalid array input raises assertion."""
+    with pytest.raises(AssertionError):
+        Signal(bad_array)
+
+
+def test_signal_init_array_zero_copy():
+    """Test that a contiguous complex128 array is stored without copying."""
+    samples = np.arange(6, dtype=np.complex128)
+    signal = Signal(samples)
+    assert np.shares_memory(signal.underlying_signal, samples)
+    assert signal.underlying_signal.dtype == np.complex128
+
+
+def test_signal_init_array_converted():
+    """Test that non-contiguous or complex64 arrays are converted to contiguous complex128."""
+    samples = np.arange(12, dtype=np.complex64)[::2]
+    signal = Signal(samples)
+    assert signal.underlying_signal.dtype == np.complex128
+    assert signal.underlying_signal.flags.c_contiguous
+    assert np.array_equal(signal.underlying_signal, samples)
+
+
+def test_underlying_signal_read_only():
+    """Test that the exposed samples cannot be written through."""
+    signal = Signal([1+0j, 2+0j, 3+0j])
+    with pytest.raises(ValueError):
+        signal.underlying_signal[0] = 5+0j
+
+
 @pytest.mark.parametrize(
     "samples, multiplier, expected_indices",
     [
@@ -54,7 +92,33 @@ def test_scale_time_by(samples, multiplier, expected_indices):
     signal = Signal(samples)
     scaled = signal.scale_time_by(multiplier)
     expected = [samples[i] for i in expected_indices]
-    assert scaled.underlying_signal == expected
+    assert scaled.underlying_signal.tolist() == expected
+
+
+@pytest.mark.parametrize("multiplier", [-7, -1, 0, 5, 12, 10**12])
+def test_scale_time_by_matches_modular_definition(multiplier):
+    """Test table-driven scaling against the definition s(multiplier · t mod n)."""
+    samples = [complex(idx, -idx) for idx in range(12)]
+    scaled = Signal(samples).scale_time_by(multiplier)
+    expected = [samples[(multiplier * idx) % 12] for idx in range(12)]
+    assert scaled.underlying_signal.tolist() == expected
+
+
+@pytest.mark.parametrize("multipliers", [[0, 1, 2, 3, 4, 5], [5, -1, 13], []])
+def test_scale_time_by_many(multipliers):
+    """Test that batched scaling stacks the individual rescalings."""
+    signal = Signal([complex(idx, 1) for idx in range(6)])
+    result = signal.scale_time_by_many(multipliers)
+    assert result.shape == (len(multipliers), 6)
+    for row, multiplier in zip(result, multipliers):
+        assert np.array_equal(row, signal.scale_time_by(multiplier).underlying_signal)
+
+
+def test_scale_time_by_many_invalid_multipliers():
+    """Test non-integer multipliers raise assertion in batched scaling."""
+    signal = Signal([1+0j, 2+0j])
+    with pytest.raises(AssertionError):
+        signal.scale_time_by_many([1.5, 2.0])
 
 
 @pytest.mark.parametrize(
@@ -124,3 +188,160 @@ def test_extract_real(input_values, normalize, expected):
     signal = Signal(input_values)
     result = signal.extract_real(normalize=normalize)
     assert all(abs(r - e) < 1e-6 for r, e in zip(result, expected))
+
+
+@pytest.mark.parametrize("modulus", [1, 2, 7, 12, 30, 36])
+@pytest.mark.parametrize("include_zero", [True, False])
+def test_rescaling_sum(modulus, include_zero):
+    """Test the divisor-class closed form against summing every rescaled signal."""
+    rng = np.random.default_rng(modulus)
+    signal = Signal(rng.normal(size=modulus) + 1j * rng.normal(size=modulus))
+
+    expected = np.zeros(modulus, dtype=complex)
+    for vertex in range(0 if include_zero else 1, modulus):
+        expected += signal.scale_time_by(vertex).underlying_signal
+
+    result = signal.rescaling_sum(include_zero=include_zero)
+    assert np.allclose(result.underlying_signal, expected)
+
+
+def random_samples(modulus, seed):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=modulus) + 1j * rng.normal(size=modulus)
+
+
+def test_signal_arithmetic_operators():
+    """Operators act pointwise on samples and scale by scalars from either side"""
+    left, right = random_samples(6, 0), random_samples(6, 1)
+    left_signal, right_signal = Signal(left), Signal(right)
+
+    assert np.allclose((left_signal + right_signal).underlying_signal, left + right)
+    assert np.allclose((left_signal - right_signal).underlying_signal, left - right)
+    assert np.allclose((left_signal * right_signal).underlying_signal, left * right)
+    assert np.allclose((2j * left_signal).underlying_signal, 2j * left)
+    assert np.allclose((left_signal * np.complex128(3)).underlying_signal, 3 * left)
+    assert np.allclose((-left_signal).underlying_signal, -left)
+    assert np.allclose((left_signal + 1).underlying_signal, left + 1)
+    assert np.allclose(sum([left_signal, right_signal]).underlying_signal, left + right)
+    assert np.allclose(left_signal.conjugate().underlying_signal, np.conj(left))
+    assert np.allclose(left_signal.underlying_signal, left)
+
+
+def test_signal_in_place_operators_reuse_samples():
+    """In-place operators update the existing sample array"""
+    samples = random_samples(5, 2)
+    other = random_samples(5, 3)
+    signal = Signal(samples.copy())
+    sample_array = signal.underlying_signal
+
+    signal += Signal(other)
+    signal *= 2
+    signal -= 1
+
+    assert np.shares_memory(signal.underlying_signal, sample_array)
+    assert np.allclose(signal.underlying_signal, 2 * (samples + other) - 1)
+
+
+@pytest.mark.parametrize("operation", [
+    lambda left, right: left + right,
+    lambda left, right: left * right,
+    lambda left, right: left.inner(right),
+    lambda left, right: left.convolve(right),
+])
+def test_signal_operators_require_equal_lengths(operation):
+    """Binary operations between signals of different lengths are rejected"""
+    with pytest.raises(AssertionError):
+        operation(Signal(random_samples(4, 0)), Signal(random_samples(5, 1)))
+
+
+def test_signal_operators_reject_other_types():
+    """Unsupported operands raise a TypeError"""
+    with pytest.raises(TypeError):
+        Signal([1j, 2j]) + "a"
+
+
+@pytest.mark.parametrize("modulus", [1, 7, 12])
+def test_signal_energy_inner_convolve_correlate(modulus):
+    """Energy, inner product, convolution and correlation match their definitions"""
+    left, right = random_samples(modulus, 4), random_samples(modulus, 5)
+    left_signal, right_signal = Signal(left), Signal(right)
+    shifts = np.arange(modulus)
+
+    expected_convolution = [np.sum(left * right[(t - shifts) % modulus]) for t in range(modulus)]
+    expected_correlation = [np.sum(left[(shifts + tau) % modulus] * np.conj(right)) for tau in range(modulus)]
+
+    assert left_signal.energy() == pytest.approx(np.sum(np.abs(left) ** 2))
+    assert left_signal.inner(right_signal) == pytest.approx(np.sum(left * np.conj(right)))
+    assert np.allclose(left_signal.convolve(right_signal).underlying_signal, expected_convolution)
+    assert np.allclose(left_signal.correlate(right_signal).underlying_signal, expected_correlation)
+
+
+@pytest.mark.parametrize("multiplier, modulus, amplitude", [(0, 1, 1), (3, 8, 1), (-2, 9, 0.5 - 2j), (7, 7, 2)])
+def test_character_signal_samples(multiplier, modulus, amplitude):
+    """CharacterSignal samples are amplitude · exp(2πi k t / n), computed on first use"""
+    character = CharacterSignal(multiplier, modulus, amplitude)
+    expected = amplitude * np.exp(2j * np.pi * multiplier * np.arange(modulus) / modulus)
+
+    assert character._sample_cache is None
+    assert len(character) == modulus
+    assert np.allclose(character.underlying_signal, expected)
+    assert not character.underlying_signal.flags.writeable
+
+
+@pytest.mark.parametrize("scale", [0, 1, 5, -3, 12])
+def test_character_signal_closed_forms(scale):
+    """Rescaling, spectra, products and rescaling sums match the sampled signal"""
+    character = CharacterSignal(4, 12, 1.5j)
+    sampled = Signal(character.underlying_signal.copy())
+
+    rescaled = character.scale_time_by(scale)
+
+    assert isinstance(rescaled, CharacterSignal)
+    assert rescaled._sample_cache is None
+    assert rescaled.multiplier == (4 * scale) % 12
+    assert np.allclose(rescaled.underlying_signal, sampled.scale_time_by(scale).underlying_signal)
+    assert np.allclose(character.spectrum(), np.fft.fft(sampled.underlying_signal))
+    assert np.allclose((2 * character).underlying_signal, 2 * sampled.underlying_signal)
+    assert np.allclose((character * rescaled).underlying_signal, (sampled * rescaled).underlying_signal)
+    assert np.allclose(character.conjugate().underlying_signal, np.conj(sampled.underlying_signal))
+    assert character.energy() == pytest.approx(sampled.energy())
+    for include_zero in [True, False]:
+        assert np.allclose(
+            character.rescaling_sum(include_zero).underlying_signal,
+            sampled.rescaling_sum(include_zero).underlying_signal,
+        )
+
+
+def test_character_signal_samples_are_read_only():
+    """The cached samples of a character cannot be written through"""
+    character = character_signal(1, 4)
+
+    with pytest.raises(ValueError):
+        character.underlying_signal[0] = 0j
+
+
+def test_character_signal_in_place_arithmetic_rebinds():
+    """In-place operators return new signals and leave the original character unchanged"""
+    original = character_signal(1, 4)
+    samples = original.underlying_signal.copy()
+
+    scaled = original
+    scaled *= 2
+    assert isinstance(scaled, CharacterSignal)
+    assert scaled.amplitude == 2
+    assert np.allclose(scaled.underlying_signal, 2 * samples)
+
+    shifted = original
+    shifted += 1
+    assert type(shifted) is Signal
+    assert np.allclose(shifted.underlying_signal, samples + 1)
+    shifted += Signal([1j, 1j, 1j, 1j])
+    assert np.allclose(shifted.underlying_signal, samples + 1 + 1j)
+
+    difference = original
+    difference -= original
+    assert type(difference) is Signal
+    assert np.allclose(difference.underlying_signal, 0)
+
+    assert original.amplitude == 1
+    assert np.allclose(original.underlying_signal, samples)
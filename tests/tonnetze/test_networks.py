@@ -9,7 +9,7 @@ import pytest
 import networkx as nx
 import numpy as np
 
-from dissig.tonnetze.networks import Tonnetz, SignalTonnetz
+from dissig.tonnetze.networks import Tonnetz, SignalTonnetz, LazySignalTonnetz
 
 from dissig.signals.discrete import Signal
 from dissig.tonnetze.networks import SignalTonnetz
@@ -148,3 +148,351 @@ def test_total_signal(samples):
 
     result = np.array(st.total_signal().underlying_signal)
     assert result == pytest.approx(expected, abs=1e-6)
+
+
+@pytest.mark.parametrize("sample_count", [1, 6, 12])
+@pytest.mark.parametrize("integer_list", [[], [1], [2, 3], [5, -1, 12, 7]])
+@pytest.mark.parametrize("include_loops", [True, False])
+@pytest.mark.parametrize("include_zero", [True, False])
+def test_generate_edge_arrays_matches_definition(
+    sample_count,
+    integer_list,
+    include_loops,
+    include_zero,
+):
+    """Compare vectorized COO edge arrays with the vertex-by-multiplier definition."""
+    t = Tonnetz(sample_count, [], include_loops=include_loops, include_zero=include_zero)
+    sources, targets, weights = t.generate_edge_arrays(integer_list)
+
+    expected = []
+    for source in range(0 if include_zero else 1, sample_count):
+        for multiplier in integer_list:
+            target = (source * multiplier) % sample_count
+            if include_loops or source != target:
+                expected.append((source, target, multiplier))
+
+    assert sources.dtype == targets.dtype == weights.dtype == np.int64
+    assert list(zip(sources.tolist(), targets.tolist(), weights.tolist())) == expected
+
+
+@pytest.mark.parametrize("sample_count", [1, 7, 12, 36])
+@pytest.mark.parametrize("integer_list", [[2], [2, 3, 5, 7], [0, 1, 4, 6, 12], [3, 15]])
+@pytest.mark.parametrize("include_loops", [True, False])
+@pytest.mark.parametrize("include_zero", [True, False])
+def test_csr_backend_matches_networkx(sample_count, integer_list, include_loops, include_zero):
+    """Compare the CSR backend with the NetworkX backend, including lazy graph export."""
+    kwargs = dict(include_loops=include_loops, include_zero=include_zero)
+    nx_tonnetz = Tonnetz(sample_count, integer_list, **kwargs)
+    csr_tonnetz = Tonnetz(sample_count, integer_list, backend="csr", **kwargs)
+
+    assert csr_tonnetz._network is None
+    assert csr_tonnetz.adjacency.shape == (sample_count, sample_count)
+
+    for nx_array, csr_array in zip(nx_tonnetz.edge_arrays(), csr_tonnetz.edge_arrays()):
+        assert np.array_equal(nx_array, csr_array)
+
+    assert np.array_equal(nx_tonnetz.out_degrees(), csr_tonnetz.out_degrees())
+    assert np.array_equal(nx_tonnetz.in_degrees(), csr_tonnetz.in_degrees())
+    for vertex in range(sample_count):
+        assert np.array_equal(nx_tonnetz.successors(vertex), csr_tonnetz.successors(vertex))
+        assert np.array_equal(nx_tonnetz.reachable_from(vertex), csr_tonnetz.reachable_from(vertex))
+
+    exported = csr_tonnetz.network
+    assert set(exported.nodes) == set(nx_tonnetz.network.nodes)
+    assert sorted(exported.edges(data="weight")) == sorted(nx_tonnetz.network.edges(data="weight"))
+
+
+def test_csr_backend_last_multiplier_wins():
+    """Coinciding edges keep the weight of the last multiplier, as with DiGraph.add_edge."""
+    csr_tonnetz = Tonnetz(6, [2, 5, 8], backend="csr")
+    assert csr_tonnetz.adjacency[1, 2] == 8
+    assert csr_tonnetz.adjacency.nnz == Tonnetz(6, [2, 5, 8]).network.number_of_edges()
+
+
+def test_invalid_backend():
+    """Unknown graph backends are rejected."""
+    with pytest.raises(AssertionError):
+        Tonnetz(5, [2], backend="dense")
+
+
+@pytest.mark.parametrize("samples", [[1, 0, 0, 0, 0, 0], [1, 2, 3, 4, 5, 6, 7, 8, 9], [2]])
+@pytest.mark.parametrize("include_zero", [True, False])
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_matrix_storage_matches_graph_storage(samples, include_zero, backend):
+    """Matrix-backed node signals agree with per-node Signals from graph storage."""
+    tonic = Signal([complex(x, -x) for x in samples])
+    graph_st = SignalTonnetz(tonic, [2, 3], include_zero=include_zero)
+    matrix_st = SignalTonnetz(
+        tonic, [2, 3], include_zero=include_zero, backend=backend, storage="matrix"
+    )
+
+    assert matrix_st.node_signals.shape == (len(samples), len(samples))
+    assert not matrix_st.node_signals.flags.writeable
+    assert set(matrix_st.network.nodes) == set(graph_st.network.nodes)
+    for vertex in graph_st.network.nodes:
+        expected = graph_st.network.nodes[vertex]["signal"].underlying_signal
+        node_view = matrix_st.network.nodes[vertex]["signal"]
+        assert np.array_equal(node_view.underlying_signal, expected)
+        assert np.shares_memory(node_view.underlying_signal, matrix_st.node_signals)
+        assert np.array_equal(matrix_st.node_signal(vertex).underlying_signal, expected)
+
+    assert np.allclose(
+        matrix_st.total_signal().underlying_signal,
+        graph_st.total_signal().underlying_signal,
+    )
+
+
+def test_invalid_storage():
+    """Unknown node signal storage is rejected."""
+    with pytest.raises(AssertionError):
+        SignalTonnetz(Signal([1+0j, 2+0j]), [1], storage="dict")
+
+
+@pytest.mark.parametrize("include_zero", [True, False])
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_lazy_signal_tonnetz_matches_eager(include_zero, backend):
+    """Lazily computed node signals agree with the eagerly propagated ones."""
+    tonic = Signal([complex(x, x % 3) for x in range(10)])
+    eager = SignalTonnetz(tonic, [3, 4], include_zero=include_zero)
+    lazy = LazySignalTonnetz(tonic, [3, 4], include_zero=include_zero, backend=backend)
+
+    streamed = list(lazy.iter_node_signals())
+    assert [vertex for vertex, _ in streamed] == sorted(eager.network.nodes)
+    for vertex, node_signal in streamed:
+        expected = eager.network.nodes[vertex]["signal"].underlying_signal
+        assert np.array_equal(node_signal.underlying_signal, expected)
+        assert np.array_equal(lazy.node_signal(vertex).underlying_signal, expected)
+
+    assert np.allclose(
+        lazy.total_signal().underlying_signal,
+        eager.total_signal().underlying_signal,
+    )
+
+
+def test_lazy_signal_tonnetz_cache_is_bounded():
+    """The node signal cache keeps at most cache_size recently used nodes."""
+    tonic = Signal([complex(x) for x in range(8)])
+    lazy = LazySignalTonnetz(tonic, [3], cache_size=2)
+
+    first = lazy.node_signal(1)
+    assert lazy.node_signal(1) is first
+    lazy.node_signal(2)
+    lazy.node_signal(3)
+    assert list(lazy._signal_cache) == [2, 3]
+    assert lazy.node_signal(1) is not first
+
+    list(lazy.iter_node_signals())
+    assert list(lazy._signal_cache) == [3, 1]
+
+
+def test_total_signal_sums_replaced_node_signals():
+    """Once node signals are replaced, total_signal sums them instead of using the tonic."""
+    tonic = Signal([complex(x) for x in range(5)])
+    st = SignalTonnetz(tonic, [2], include_zero=True)
+    for vertex in st.network.nodes:
+        st.network.nodes[vertex]["signal"] = Signal(np.full(5, vertex, dtype=complex))
+    st.tonic_propagated = False
+
+    assert np.allclose(st.total_signal().underlying_signal, np.full(5, 10))
+
+
+@pytest.mark.parametrize("sample_count", [1, 8, 12, 30])
+@pytest.mark.parametrize("include_loops", [True, False])
+@pytest.mark.parametrize("include_zero", [True, False])
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_incremental_multipliers_match_rebuild(sample_count, include_loops, include_zero, backend):
+    """Adding and removing multipliers in place gives the same graph as a rebuild."""
+    kwargs = dict(include_loops=include_loops, include_zero=include_zero)
+    tonnetz = Tonnetz(sample_count, [2, 3], backend=backend, **kwargs)
+    tonnetz.network  # materialize so the CSR backend patches both representations
+
+    steps = [
+        ("add", [5]),
+        ("add", [6, 2 + sample_count]),
+        ("remove", [2]),
+        ("add", [0, 1]),
+        ("remove", [6, 0]),
+        ("remove", [3, 5, 1]),
+    ]
+    for action, multipliers in steps:
+        if action == "add":
+            tonnetz.add_multipliers(multipliers)
+        else:
+            tonnetz.remove_multipliers(multipliers)
+
+        rebuilt = Tonnetz(sample_count, tonnetz.integer_list, **kwargs)
+        expected_edges = sorted(rebuilt.network.edges(data="weight"))
+        assert sorted(tonnetz.network.edges(data="weight")) == expected_edges
+        assert set(tonnetz.network.nodes) == set(rebuilt.network.nodes)
+        for current, fresh in zip(tonnetz.edge_arrays(), rebuilt.edge_arrays()):
+            assert np.array_equal(current, fresh)
+        assert np.array_equal(tonnetz.vertices(), rebuilt.vertices())
+
+
+@pytest.mark.parametrize("storage", ["graph", "matrix"])
+def test_incremental_multipliers_keep_node_signals(storage):
+    """Node signals survive multiplier changes; a newly reached vertex 0 gets one."""
+    tonic = Signal([complex(x, 1) for x in range(6)])
+    st = SignalTonnetz(tonic, [5], storage=storage)
+    before = {vertex: st.network.nodes[vertex]["signal"] for vertex in st.network.nodes}
+
+    st.add_multipliers([3])
+    assert 0 in st.network.nodes
+    assert np.array_equal(
+        st.network.nodes[0]["signal"].underlying_signal,
+        tonic.scale_time_by(0).underlying_signal,
+    )
+    for vertex, node_signal in before.items():
+        assert st.network.nodes[vertex]["signal"] is node_signal
+
+    st.remove_multipliers([3])
+    assert set(st.network.nodes) == set(before)
+
+
+def test_remove_unknown_multiplier():
+    """Only multipliers in integer_list can be removed."""
+    with pytest.raises(AssertionError):
+        Tonnetz(6, [2]).remove_multipliers([3])
+
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+@pytest.mark.parametrize("include_zero", [False, True])
+def test_tonnetz_save_load_round_trip(tmp_path, backend, include_zero):
+    """A loaded Tonnetz has the saved edges, flags and backend."""
+    tonnetz = Tonnetz(12, [5, 7, 4], include_zero=include_zero, backend=backend)
+    tonnetz.save(tmp_path / "tonnetz")
+
+    loaded = Tonnetz.load(tmp_path / "tonnetz")
+
+    assert type(loaded) is Tonnetz
+    assert loaded.backend == backend
+    assert loaded.integer_list == [5, 7, 4]
+    assert loaded.include_zero == include_zero
+    for saved_array, loaded_array in zip(tonnetz.edge_arrays(), loaded.edge_arrays()):
+        assert np.array_equal(saved_array, loaded_array)
+    assert sorted(loaded.network.edges(data="weight")) == sorted(tonnetz.network.edges(data="weight"))
+
+
+@pytest.mark.parametrize("storage", ["graph", "matrix"])
+@pytest.mark.parametrize("mmap", [False, True])
+def test_signal_tonnetz_save_load_round_trip(tmp_path, storage, mmap):
+    """Saved node signals come back as a read-only (optionally memory-mapped) matrix."""
+    tonic = Signal(np.exp(2j * np.pi * np.arange(10) / 10) + 0.5)
+    signal_tonnetz = SignalTonnetz(tonic, [3, 7], storage=storage)
+    signal_tonnetz.save(tmp_path / "signal_tonnetz")
+
+    loaded = Tonnetz.load(tmp_path / "signal_tonnetz", mmap=mmap)
+
+    assert type(loaded) is SignalTonnetz
+    assert loaded.storage == "matrix"
+    assert loaded.tonic_propagated
+    assert isinstance(loaded.node_signals, np.memmap) == mmap
+    assert not loaded.node_signals.flags.writeable
+    for vertex, current_signal in signal_tonnetz.iter_node_signals():
+        assert np.allclose(loaded.node_signal(vertex).underlying_signal, current_signal.underlying_signal)
+    assert np.allclose(loaded.total_signal().underlying_signal, signal_tonnetz.total_signal().underlying_signal)
+
+
+def test_signal_tonnetz_save_load_replaced_signals(tmp_path):
+    """Replaced node signals are saved as they are, not recomputed from the tonic."""
+    signal_tonnetz = SignalTonnetz(Signal([1j, 2j, 3j, 4j, 5j]), [2])
+    for vertex in signal_tonnetz.network.nodes:
+        signal_tonnetz.network.nodes[vertex]["signal"] = Signal([complex(vertex)] * 5)
+    signal_tonnetz.tonic_propagated = False
+    signal_tonnetz.save(tmp_path / "replaced")
+
+    loaded = SignalTonnetz.load(tmp_path / "replaced")
+
+    assert not loaded.tonic_propagated
+    assert loaded.node_signal(3).underlying_signal.tolist() == [3] * 5
+    assert loaded.total_signal().underlying_signal.tolist() == [10] * 5
+
+
+def test_lazy_signal_tonnetz_save_load_keeps_only_tonic(tmp_path):
+    """A lazy tonnetz saves its tonic only and loads back lazily."""
+    lazy_tonnetz = LazySignalTonnetz(Signal([1j, 2j, 3j, 4j, 5j, 6j, 7j]), [3], backend="csr", cache_size=4)
+    lazy_tonnetz.save(tmp_path / "lazy")
+
+    assert not (tmp_path / "lazy" / "node_signals.npy").exists()
+
+    loaded = SignalTonnetz.load(tmp_path / "lazy")
+
+    assert type(loaded) is LazySignalTonnetz
+    assert loaded.cache_size == 4
+    assert loaded.node_signal(3).underlying_signal.tolist() == lazy_tonnetz.node_signal(3).underlying_signal.tolist()
+
+
+def test_load_rejects_unrelated_class(tmp_path):
+    """Loading a plain Tonnetz through SignalTonnetz.load fails."""
+    Tonnetz(6, [5]).save(tmp_path / "plain")
+
+    with pytest.raises(AssertionError):
+        SignalTonnetz.load(tmp_path / "plain")
+
+
+def test_from_node_matrix():
+    """A tonnetz built from a node matrix serves its rows as node signals."""
+    node_signals = np.arange(16, dtype=np.complex128).reshape(4, 4)
+    signal_tonnetz = SignalTonnetz.from_node_matrix(Signal([1j, 1j, 1j, 1j]), [3], node_signals)
+
+    assert signal_tonnetz.storage == "matrix"
+    assert not signal_tonnetz.tonic_propagated
+    assert signal_tonnetz.network.nodes[2]["signal"].underlying_signal.tolist() == [8, 9, 10, 11]
+    assert signal_tonnetz.total_signal().underlying_signal.tolist() == [24, 27, 30, 33]
+
+
+@pytest.mark.parametrize("replaced_vertices", [[3], [1, 2, 3, 4, 5]])
+def test_total_signal_detects_replaced_graph_signals(replaced_vertices):
+    """Replacing node attributes without clearing tonic_propagated is not summed in closed form"""
+    signal_tonnetz = SignalTonnetz(Signal(np.arange(6, dtype=np.complex128)), [2, 3])
+    for vertex in replaced_vertices:
+        signal_tonnetz.network.nodes[vertex]["signal"] = Signal(np.zeros(6, dtype=np.complex128))
+
+    expected = sum(
+        signal_tonnetz.network.nodes[vertex]["signal"].underlying_signal
+        for vertex in signal_tonnetz.network.nodes
+    )
+
+    assert signal_tonnetz.tonic_propagated
+    assert not signal_tonnetz.has_propagated_signals()
+    assert np.allclose(signal_tonnetz.total_signal().underlying_signal, expected)
+    if len(replaced_vertices) == 5:
+        assert np.allclose(signal_tonnetz.total_signal().underlying_signal, 0)
+
+
+def test_has_propagated_signals_after_adding_zero():
+    """A vertex 0 reached by a new multiplier keeps the closed form valid"""
+    signal_tonnetz = SignalTonnetz(Signal(np.arange(6, dtype=np.complex128)), [5])
+    signal_tonnetz.add_multipliers([0])
+
+    assert 0 in signal_tonnetz.network
+    assert signal_tonnetz.has_propagated_signals()
+    expected = sum(current_signal.underlying_signal for _, current_signal in signal_tonnetz.iter_node_signals())
+    assert np.allclose(signal_tonnetz.total_signal().underlying_signal, expected)
+
+
+@pytest.mark.parametrize("modulus, integer_list, new_multipliers", [
+    (12, [5, 11], [5, 5]),
+    (12, [5, 11], [7, 19, 7]),
+    (12, [5, 11], [0, 12, 1, 13]),
+    (7, [2], [3, 3]),
+    (12, [5], [7, 7, 19]),
+])
+def test_csr_splice_repeated_multipliers(modulus, integer_list, new_multipliers):
+    """Repeated or coinciding multipliers splice into sorted rows with later ones winning"""
+    tonnetz = Tonnetz(modulus, integer_list, include_zero=True, backend="csr")
+    tonnetz.add_multipliers(new_multipliers)
+
+    rebuilt = Tonnetz(modulus, tonnetz.integer_list, include_zero=True, backend="csr")
+
+    assert tonnetz.adjacency.has_sorted_indices
+    assert tonnetz.adjacency.nnz == rebuilt.adjacency.nnz
+    for current, fresh in zip(tonnetz.edge_arrays(), rebuilt.edge_arrays()):
+        assert np.array_equal(current, fresh)
+
+    tonnetz.remove_multipliers(new_multipliers)
+    rebuilt = Tonnetz(modulus, tonnetz.integer_list, include_zero=True, backend="csr")
+
+    assert tonnetz.adjacency.nnz == rebuilt.adjacency.nnz
+    for current, fresh in zip(tonnetz.edge_arrays(), rebuilt.edge_arrays()):
+        assert np.array_equal(current, fresh)
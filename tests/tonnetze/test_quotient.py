@@ -0,0 +1,71 @@
+"""
+Unit tests for QuotientTonnetz, the tonnetz collapsed along unit-group orbits.
+"""
+from __future__ import annotations
+
+import math
+from collections import Counter
+
+import pytest
+import numpy as np
+
+from dissig.signals.discrete import Signal
+from dissig.tonnetze.networks import Tonnetz, SignalTonnetz
+from dissig.tonnetze.quotient import QuotientTonnetz
+
+
+@pytest.mark.parametrize("sample_count", [1, 7, 12, 36, 60])
+@pytest.mark.parametrize("integer_list", [[2], [2, 3, 5, 7], [1, 5, 7, 11], [0, 4, 16, 6]])
+@pytest.mark.parametrize("include_loops", [True, False])
+@pytest.mark.parametrize("include_zero", [True, False])
+def test_quotient_matches_collapsed_tonnetz(sample_count, integer_list, include_loops, include_zero):
+    """Collapsing the full Tonnetz orbit by orbit gives the quotient graph."""
+    tonnetz = Tonnetz(sample_count, integer_list, include_loops=include_loops, include_zero=include_zero)
+    quotient = QuotientTonnetz(
+        sample_count, integer_list, include_loops=include_loops, include_zero=include_zero
+    )
+
+    expected_nodes = {quotient.orbit_of(vertex) for vertex in tonnetz.network.nodes}
+    assert set(quotient.network.nodes) == expected_nodes
+
+    expected_multiplicities = Counter(
+        (quotient.orbit_of(u), quotient.orbit_of(v)) for u, v in tonnetz.network.edges
+    )
+    multiplicities = {
+        (u, v): data["multiplicity"] for u, v, data in quotient.network.edges(data=True)
+    }
+    assert multiplicities == dict(expected_multiplicities)
+
+    for divisor in quotient.network.nodes:
+        orbit = [v for v in range(sample_count) if math.gcd(v, sample_count) == divisor]
+        assert quotient.network.nodes[divisor]["orbit_size"] == len(orbit)
+
+
+@pytest.mark.parametrize("sample_count", [1, 9, 12, 30])
+def test_quotient_orbit_averaged_signals(sample_count):
+    """Node signals are the averages of the SignalTonnetz node signals over each orbit."""
+    rng = np.random.default_rng(sample_count)
+    tonic = Signal(rng.normal(size=sample_count) + 1j * rng.normal(size=sample_count))
+    signal_tonnetz = SignalTonnetz(tonic, [2, 3], include_zero=True)
+    quotient = QuotientTonnetz(sample_count, [2, 3], include_zero=True, tonic_signal=tonic)
+
+    for divisor in quotient.network.nodes:
+        orbit = [v for v in range(sample_count) if math.gcd(v, sample_count) == divisor]
+        expected = np.mean(
+            [signal_tonnetz.network.nodes[v]["signal"].underlying_signal for v in orbit], axis=0
+        )
+        result = quotient.network.nodes[divisor]["signal"].underlying_signal
+        assert np.allclose(result, expected)
+
+
+def test_quotient_records_multipliers():
+    """Edges list every multiplier that realizes them."""
+    quotient = QuotientTonnetz(12, [5, 7, 2])
+    assert quotient.network[1][1]["multipliers"] == [5, 7]
+    assert quotient.network[1][2]["multipliers"] == [2]
+
+
+def test_quotient_tonic_length_mismatch():
+    """The tonic must have one sample per residue."""
+    with pytest.raises(AssertionError):
+        QuotientTonnetz(6, [2], tonic_signal=Signal([1+0j, 2+0j]))
@@ -0,0 +1,66 @@
+"""
+Unit tests for the array-based reachability index of a tonnetz.
+"""
+from __future__ import annotations
+
+import math
+
+import pytest
+import networkx as nx
+
+from dissig.tonnetze.networks import Tonnetz
+from dissig.tonnetze.reachability import ReachabilityIndex
+
+
+@pytest.mark.parametrize("sample_count", [1, 7, 12, 36])
+@pytest.mark.parametrize("integer_list", [[2], [2, 3], [5, 7], [3, 0, 4]])
+@pytest.mark.parametrize("include_zero", [True, False])
+def test_reachability_matches_networkx(sample_count, integer_list, include_zero):
+    """Distances, paths and words agree with NetworkX shortest paths."""
+    tonnetz = Tonnetz(sample_count, integer_list, include_loops=True, include_zero=include_zero)
+    graph = tonnetz.network
+    index = ReachabilityIndex(tonnetz)
+
+    for source in graph.nodes:
+        lengths = nx.single_source_shortest_path_length(graph, source)
+        distances, _, _ = index.search(source)
+
+        for target in range(sample_count):
+            if target in lengths:
+                assert distances[target] == lengths[target]
+                assert index.can_reach(source, target)
+
+                path = index.shortest_path(source, target)
+                assert len(path) == lengths[target] + 1
+                assert all(graph.has_edge(u, v) for u, v in zip(path, path[1:]))
+
+                word = index.multiplier_word(source, target)
+                assert (source * math.prod(word)) % sample_count == target
+            else:
+                assert distances[target] == -1
+                assert not index.can_reach(source, target)
+                assert index.shortest_path(source, target) is None
+                assert index.multiplier_word(source, target) is None
+
+
+@pytest.mark.parametrize("sample_count, integer_list", [(12, [5, 7]), (36, [2, 3, 5, 7]), (9, [2])])
+def test_reachability_components_match_networkx(sample_count, integer_list):
+    """Strongly connected components agree with NetworkX."""
+    tonnetz = Tonnetz(sample_count, integer_list, include_zero=True)
+    index = ReachabilityIndex(tonnetz)
+
+    components = list(nx.strongly_connected_components(tonnetz.network))
+    assert index.component_count == len(components)
+    for component in components:
+        labels = {int(index.component_labels[vertex]) for vertex in component}
+        assert len(labels) == 1
+
+
+def test_reachability_search_cache_is_bounded():
+    """Only the most recent searches are kept."""
+    index = ReachabilityIndex(Tonnetz(10, [3]), cache_size=2)
+    first = index.search(1)
+    assert index.search(1) is first
+    index.search(2)
+    index.search(3)
+    assert list(index._searches) == [2, 3]
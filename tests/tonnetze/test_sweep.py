@@ -0,0 +1,68 @@
+"""
+Unit tests for process-parallel parameter sweeps over tonnetze.
+"""
+from __future__ import annotations
+
+import numpy as np
+import networkx as nx
+import pytest
+
+from dissig.signals.discrete import character_signal
+from dissig.tonnetze.networks import SignalTonnetz
+from dissig.tonnetze.sweep import SWEEP_COLUMNS, run_sweep, tonnetz_statistics
+
+
+@pytest.mark.parametrize("modulus, integer_list", [(1, [2]), (12, [5, 7]), (36, [2, 3]), (10, [])])
+def test_tonnetz_statistics(modulus, integer_list):
+    """Statistics agree with the eager NetworkX-backed SignalTonnetz."""
+    signal_tonnetz = SignalTonnetz(character_signal(1, modulus), integer_list)
+    graph = signal_tonnetz.network
+    total_samples = signal_tonnetz.total_signal().underlying_signal
+
+    row = tonnetz_statistics(modulus, integer_list)
+
+    assert list(row) == SWEEP_COLUMNS
+    assert row["node_count"] == graph.number_of_nodes()
+    assert row["edge_count"] == graph.number_of_edges()
+    assert row["strong_components"] == nx.number_strongly_connected_components(graph)
+    assert row["weak_components"] == nx.number_weakly_connected_components(graph)
+    assert row["total_signal_energy"] == pytest.approx(np.sum(np.abs(total_samples)**2))
+
+
+def test_run_sweep_streams_and_resumes(tmp_path):
+    """A sweep writes one row per job and a rerun only computes the missing jobs."""
+    output_path = tmp_path / "sweep.csv"
+    multiplier_sets = [[2], [2, 3], [5, 7, 11]]
+
+    first = run_sweep([6, 12], multiplier_sets[:2], output_path, max_workers=2, shard_size=1)
+    assert len(first) == 4
+
+    full = run_sweep([6, 12, 15], multiplier_sets, output_path, max_workers=2)
+    assert len(full) == 9
+    assert not full.duplicated(["modulus", "multipliers", "include_loops", "include_zero"]).any()
+
+    expected = tonnetz_statistics(15, [5, 7, 11])
+    row = full[(full["modulus"] == 15) & (full["multipliers"] == "5 7 11")].iloc[0]
+    assert row["edge_count"] == expected["edge_count"]
+
+    again = run_sweep([6, 12, 15], multiplier_sets, output_path)
+    assert len(again) == 9
+
+
+def test_run_sweep_resumes_per_flags(tmp_path):
+    """Rows computed with other include_loops / include_zero flags are not reused."""
+    output_path = tmp_path / "sweep.csv"
+
+    run_sweep([12], [[5, 7]], output_path, max_workers=1)
+    flagged = run_sweep([12], [[5, 7]], output_path, max_workers=1, include_loops=True, include_zero=True)
+    assert len(flagged) == 2
+    assert flagged["include_loops"].tolist() == [False, True]
+    assert flagged["include_zero"].tolist() == [False, True]
+
+    expected = tonnetz_statistics(12, [5, 7], include_loops=True, include_zero=True)
+    row = flagged[flagged["include_loops"]].iloc[0]
+    assert row["node_count"] == expected["node_count"]
+    assert row["edge_count"] == expected["edge_count"]
+
+    again = run_sweep([12], [[5, 7]], output_path, include_zero=True, include_loops=True)
+    assert len(again) == 2
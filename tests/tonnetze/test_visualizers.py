@@ -31,9 +31,10 @@ def test_nx_viz_modes(mode, expect_clusters, tmp_path):
     # Mocks for external dependencies
     mock_agraph = MagicMock()
     mock_clusters = {"cluster1": [0, 1], "cluster2": [2]}
+    mock_context = MagicMock(unit_clusters=mock_clusters)
 
     with patch("dissig.tonnetze.visualizers.to_agraph", return_value=mock_agraph), \
-         patch("dissig.tonnetze.visualizers.unit_clusters", return_value=mock_clusters) as patch_clusters, \
+         patch("dissig.tonnetze.visualizers.modulus_context", return_value=mock_context) as patch_clusters, \
          patch("dissig.tonnetze.visualizers.Path") as mock_path_cls:
 
         # Fake path resolution
@@ -0,0 +1,70 @@
+"""
+Unit tests for batched walks along a tonnetz.
+"""
+from __future__ import annotations
+
+import pytest
+import numpy as np
+
+from dissig.signals.discrete import Signal
+from dissig.tonnetze.networks import Tonnetz, SignalTonnetz
+from dissig.tonnetze.walks import TonnetzWalker
+
+
+def test_transition_table():
+    """Entry (v, j) is v times the j-th multiplier, mod n."""
+    table = Tonnetz(10, [3, -1, 12]).transition_table()
+    assert table.shape == (10, 3)
+    for vertex in range(10):
+        assert table[vertex].tolist() == [(vertex * a) % 10 for a in [3, -1, 12]]
+
+
+def test_scripted_walks_follow_multipliers():
+    """Scripted walks apply the listed multipliers in order."""
+    walker = TonnetzWalker(Tonnetz(12, [5, 7, 2]))
+    visited = walker.scripted_walks([1, 3], np.array([[0, 1, 2], [2, 2, 0]]))
+
+    assert visited.tolist() == [
+        [1, 5, 11, 10],
+        [3, 6, 0, 0],
+    ]
+
+
+@pytest.mark.parametrize("sample_count, integer_list", [(12, [5, 7]), (36, [2, 3, 5, 7])])
+def test_random_walks_move_along_edges(sample_count, integer_list):
+    """Every random step lands on v · a mod n for the chosen multiplier a."""
+    tonnetz = Tonnetz(sample_count, integer_list, include_loops=True, include_zero=True)
+    walker = TonnetzWalker(tonnetz)
+    starts = np.arange(sample_count).repeat(4)
+    visited, chosen = walker.random_walks(starts, 6, rng=0)
+
+    assert visited.shape == (len(starts), 7)
+    multipliers = np.asarray(integer_list)[chosen]
+    assert np.array_equal(visited[:, 1:], (visited[:, :-1] * multipliers) % sample_count)
+    for source, target in zip(visited[:, :-1].ravel(), visited[:, 1:].ravel()):
+        assert tonnetz.network.has_edge(int(source), int(target))
+
+    again, _ = walker.random_walks(starts, 6, rng=0)
+    assert np.array_equal(visited, again)
+
+
+def test_walk_signals_are_rescaled_tonics():
+    """Walk signals agree with the node signals of the SignalTonnetz."""
+    tonic = Signal([complex(x, -x) for x in range(9)])
+    signal_tonnetz = SignalTonnetz(tonic, [2, 4], include_zero=True)
+    walker = TonnetzWalker(signal_tonnetz)
+    visited, _ = walker.random_walks([1, 2, 4], 3, rng=1)
+
+    signals = walker.walk_signals(visited)
+    assert signals.shape == visited.shape + (9,)
+    for position in np.ndindex(visited.shape):
+        vertex = int(visited[position])
+        expected = signal_tonnetz.network.nodes[vertex]["signal"].underlying_signal
+        assert np.array_equal(signals[position], expected)
+
+
+def test_walk_signals_need_a_tonic():
+    """A plain Tonnetz has no tonic to rescale."""
+    walker = TonnetzWalker(Tonnetz(5, [2]))
+    with pytest.raises(AssertionError):
+        walker.walk_signals(np.array([[1, 2]]))
@@ -7,7 +7,7 @@ import math
 
 import pytest
 
-from dissig.utils.arithmetic import unit_vectors, unit_clusters, multiplicative_units
+from dissig.utils.arithmetic import unit_vectors, unit_clusters, multiplicative_units, primitive_root
 
 
 @pytest.mark.parametrize(
@@ -113,3 +113,14 @@ def test_unit_clusters_values(modulus, expected_cluster_sizes):
     result = unit_clusters(modulus)
     for key, expected_len in expected_cluster_sizes.items():
         assert len(result[key]) == expected_len
+
+
+@pytest.mark.parametrize("prime, exponent", [(3, 1), (3, 4), (5, 2), (7, 1), (29, 2), (31, 1), (487, 2)])
+def test_primitive_root(prime, exponent):
+    """Verify the root generates every unit modulo the prime power"""
+    prime_power = prime**exponent
+    root = primitive_root(prime, exponent)
+
+    powers = {pow(root, k, prime_power) for k in range(prime_power // prime * (prime - 1))}
+
+    assert powers == set(multiplicative_units(prime_power))
@@ -0,0 +1,27 @@
+"""
+Unit tests for the shared block sizes.
+"""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from dissig.utils.blocks import BLOCK_ELEMENTS, block_rows
+
+
+@pytest.mark.parametrize("row_length, expected", [
+    (1, BLOCK_ELEMENTS),
+    (1024, BLOCK_ELEMENTS // 1024),
+    (BLOCK_ELEMENTS, 1),
+    (BLOCK_ELEMENTS + 1, 1),
+])
+def test_block_rows(row_length, expected):
+    """Blocks hold at most BLOCK_ELEMENTS entries, but always at least one row."""
+    assert block_rows(row_length) == expected
+
+
+def test_block_rows_reads_the_shared_constant():
+    """Patching BLOCK_ELEMENTS changes the block size of every caller."""
+    with patch("dissig.utils.blocks.BLOCK_ELEMENTS", 30):
+        assert block_rows(12) == 2
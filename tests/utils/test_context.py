@@ -0,0 +1,81 @@
+"""
+Unit tests for the shared per-modulus arithmetic context in context.py
+"""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from dissig.signals.discrete import Signal
+from dissig.tonnetze.networks import Tonnetz
+from dissig.utils.arithmetic import all_divisors, multiplicative_units, unit_clusters
+from dissig.utils.context import ModulusContext, modulus_context
+from dissig.utils.primes import prime_powers
+
+
+@pytest.mark.parametrize("modulus", [1, 2, 7, 12, 36, 60])
+def test_context_matches_arithmetic(modulus):
+    """Verify that context data agrees with the arithmetic helpers"""
+    context = ModulusContext(modulus)
+
+    assert context.units == multiplicative_units(modulus)
+    assert context.divisors == all_divisors(modulus)
+    assert context.unit_clusters == unit_clusters(modulus)
+    assert context.factorization == prime_powers(modulus)
+
+
+@pytest.mark.parametrize("modulus, multiplier", [(1, 3), (10, 3), (10, -3), (12, 8)])
+def test_context_scaling_table(modulus, multiplier):
+    """Verify index tables are t ↦ multiplier · t mod modulus and read-only"""
+    table = ModulusContext(modulus).scaling_table(multiplier)
+
+    assert table.tolist() == [(multiplier * idx) % modulus for idx in range(modulus)]
+    with pytest.raises(ValueError):
+        table[0] = 1
+
+
+def test_context_scaling_table_cache_is_bounded():
+    """Verify the per-context table cache reuses tables and evicts the least recently used"""
+    context = ModulusContext(11, table_cache_size=2)
+
+    first = context.scaling_table(2)
+    assert context.scaling_table(13) is first  # same residue mod 11
+
+    context.scaling_table(3)
+    context.scaling_table(4)
+    assert context.scaling_table(2) is not first
+
+
+def test_modulus_context_is_shared():
+    """Verify Signal and Tonnetz read the same cached context"""
+    signal = Signal([complex(idx) for idx in range(9)])
+    tonnetz = Tonnetz(9, [2])
+
+    assert modulus_context(9) is modulus_context(9)
+    assert signal.context is modulus_context(9)
+    assert tonnetz.context is modulus_context(9)
+    assert signal.ring_units is modulus_context(9).units
+
+
+@pytest.mark.parametrize("modulus", [0, -3])
+def test_context_invalid_modulus(modulus):
+    """Verify non-positive moduli are rejected"""
+    with pytest.raises(AssertionError):
+        ModulusContext(modulus)
+
+
+@pytest.mark.parametrize("modulus", [1, 2, 4, 8, 9, 12, 16, 40, 63, 97, 360])
+def test_context_unit_grid(modulus):
+    """Verify the unit grid lists each unit once, as products of generator powers"""
+    context = ModulusContext(modulus)
+    unit_grid = context.unit_grid
+
+    assert unit_grid.shape == tuple(order for _, order in context.unit_generators)
+    assert sorted(unit_grid.ravel().tolist()) == context.units
+    assert not unit_grid.flags.writeable
+
+    for exponents in np.ndindex(unit_grid.shape):
+        expected = 1 % modulus
+        for (generator, _), exponent in zip(context.unit_generators, exponents):
+            expected = expected * pow(generator, exponent, modulus) % modulus
+        assert unit_grid[exponents] == expected
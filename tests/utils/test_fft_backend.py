@@ -0,0 +1,48 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from dissig.utils import fft_backend
+from dissig.utils.fft_backend import fft_workers, get_fft_workers, set_fft_workers
+
+
+@pytest.mark.parametrize("shape", [(8,), (3, 10), (4, 7)])
+@pytest.mark.parametrize("workers", [None, 1, 2, -1])
+def test_transforms_match_numpy(shape, workers):
+    """Backend transforms agree with numpy.fft for any worker count."""
+    rng = np.random.default_rng(len(shape))
+    samples = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+
+    assert np.allclose(fft_backend.fft(samples, workers=workers), np.fft.fft(samples))
+    assert np.allclose(fft_backend.ifft(samples, workers=workers), np.fft.ifft(samples))
+    assert np.allclose(fft_backend.rfft(samples.real, workers=workers), np.fft.rfft(samples.real))
+    assert np.allclose(fft_backend.fft(samples, axis=0, workers=workers), np.fft.fft(samples, axis=0))
+
+
+def test_fft_workers_context_restores_setting():
+    """The context manager sets the default worker count and restores it on exit."""
+    previous_workers = get_fft_workers()
+
+    with fft_workers(3):
+        assert get_fft_workers() == 3
+        with patch("scipy.fft.fft", side_effect=lambda samples, axis, workers: np.fft.fft(samples, axis=axis)) as mock_fft:
+            fft_backend.fft(np.ones(4))
+        assert mock_fft.call_args.kwargs["workers"] == 3
+
+    assert get_fft_workers() == previous_workers
+
+
+def test_per_call_workers_override_default():
+    """An explicit worker count wins over the configured default."""
+    with fft_workers(2), patch("scipy.fft.fft", side_effect=lambda samples, axis, workers: np.fft.fft(samples, axis=axis)) as mock_fft:
+        fft_backend.fft(np.ones(4), workers=5)
+
+    assert mock_fft.call_args.kwargs["workers"] == 5
+
+
+@pytest.mark.parametrize("workers", [0, 1.5, "all"])
+def test_invalid_workers(workers):
+    """Zero and non-integer worker counts are rejected."""
+    with pytest.raises(AssertionError):
+        set_fft_workers(workers)